@@ -0,0 +1,44 @@
+"""Benchmarks editing paragraphs that hold many comments.
+
+Run with `python benchmarks/comment_preserver.py`.
+"""
+
+import time
+
+import docx
+
+from cmi_docx import comment, paragraph
+
+N_RUNS = 2_000
+N_COMMENTS = (100, 300, 500)
+N_EDITS = 10
+
+
+def _build_paragraph(n_comments: int) -> paragraph.ExtendParagraph:
+    """Builds a paragraph with N_RUNS runs, of which n_comments are commented."""
+    document = docx.Document()
+    para = document.add_paragraph()
+    runs = [para.add_run(f"word{index} ") for index in range(N_RUNS)]
+    batch = comment.CommentBatch(document)
+    step = N_RUNS // n_comments
+    for index in range(n_comments):
+        batch.add(runs[index * step], "Reviewer", f"Comment {index}")
+    return paragraph.ExtendParagraph(para)
+
+
+def main() -> None:
+    """Times text edits that extract, strip, and restore all comments."""
+    for n_comments in N_COMMENTS:
+        extend_paragraph = _build_paragraph(n_comments)
+        start = time.perf_counter()
+        for _ in range(N_EDITS):
+            extend_paragraph.replace_between(0, 5, "WORD0")
+        elapsed = (time.perf_counter() - start) / N_EDITS
+        print(
+            f"replace_between in {N_RUNS} runs with {n_comments} comments: "
+            f"{elapsed * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Benchmarks zebra striping a large table cell by cell and with band_rows.
+
+Run with `python benchmarks/format_range.py`.
+"""
+
+import time
+
+import docx
+
+from cmi_docx import styles, table
+
+N_ROWS = 200
+N_COLUMNS = 8
+BANDS = [
+    styles.CellStyle(
+        background_rgb=(242, 242, 242),
+        borders=[styles.CellBorder(sides=("top", "bottom"), sz=4, color="BFBFBF")],
+    ),
+    styles.CellStyle(
+        borders=[styles.CellBorder(sides=("top", "bottom"), sz=4, color="BFBFBF")]
+    ),
+]
+
+
+def main() -> None:
+    """Times shading alternating rows with ExtendCell.format and band_rows."""
+    docx_table = docx.Document().add_table(rows=N_ROWS, cols=N_COLUMNS)
+    start = time.perf_counter()
+    for row_index in range(N_ROWS):
+        for column_index in range(N_COLUMNS):
+            table.ExtendCell(docx_table.cell(row_index, column_index)).format(
+                BANDS[row_index % len(BANDS)]
+            )
+    elapsed = time.perf_counter() - start
+    print(f"ExtendCell.format on {N_ROWS * N_COLUMNS} cells: {elapsed:.2f}s")
+
+    docx_table = docx.Document().add_table(rows=N_ROWS, cols=N_COLUMNS)
+    start = time.perf_counter()
+    table.ExtendTable(docx_table).band_rows(BANDS)
+    elapsed = time.perf_counter() - start
+    print(f"ExtendTable.band_rows on {N_ROWS * N_COLUMNS} cells: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
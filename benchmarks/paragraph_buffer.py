@@ -0,0 +1,54 @@
+"""Benchmarks many forward-order edits to one long paragraph.
+
+Run with `python benchmarks/paragraph_buffer.py`.
+"""
+
+import time
+
+import docx
+from docx.text import paragraph as docx_paragraph
+
+from cmi_docx import buffer, paragraph
+
+N_RUNS = 500
+N_EDITS = (100, 300)
+
+
+def _build_paragraph() -> docx_paragraph.Paragraph:
+    """Builds a paragraph with N_RUNS runs, each holding two placeholders."""
+    document = docx.Document()
+    para = document.add_paragraph()
+    for index in range(N_RUNS):
+        para.add_run(f"{{{{A}}}} word{index} {{{{B}}}} ")
+    return para
+
+
+def main() -> None:
+    """Times replacing placeholders left to right, one edit at a time."""
+    for n_edits in N_EDITS:
+        para = _build_paragraph()
+        extend_paragraph = paragraph.ExtendParagraph(para)
+        start = time.perf_counter()
+        position = 0
+        for _ in range(n_edits):
+            position = para.text.index("{{", position)
+            extend_paragraph.replace_between(position, position + 5, "value")
+        sequential = time.perf_counter() - start
+
+        para = _build_paragraph()
+        start = time.perf_counter()
+        with buffer.ParagraphBuffer(para) as paragraph_buffer:
+            position = 0
+            for _ in range(n_edits):
+                position = paragraph_buffer.find("{{", position)
+                paragraph_buffer.replace(position, position + 5, "value")
+        buffered = time.perf_counter() - start
+
+        print(
+            f"{n_edits} edits in {N_RUNS} runs: replace_between {sequential:.2f}s, "
+            f"ParagraphBuffer {buffered:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Benchmarks replacing many matches in a paragraph with many runs.
+
+Run with `python benchmarks/replace_runs.py`.
+"""
+
+import time
+
+import docx
+
+from cmi_docx import paragraph, styles
+
+N_RUNS = 5_000
+N_MATCHES = 1_000
+
+
+def _build_paragraph() -> paragraph.ExtendParagraph:
+    """Builds a paragraph with N_RUNS runs, of which N_MATCHES hold a needle."""
+    document = docx.Document()
+    para = document.add_paragraph()
+    step = N_RUNS // N_MATCHES
+    for index in range(N_RUNS):
+        para.add_run("{{X}}" if index % step == 0 else "filler ")
+    return paragraph.ExtendParagraph(para)
+
+
+def main() -> None:
+    """Times replacements with and without a style."""
+    for style in (None, styles.RunStyle(bold=True)):
+        extend_paragraph = _build_paragraph()
+        start = time.perf_counter()
+        extend_paragraph.replace("{{X}}", "value", style)
+        elapsed = time.perf_counter() - start
+        label = "without style" if style is None else "with style"
+        print(f"{N_MATCHES} replacements in {N_RUNS} runs {label}: {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Benchmarks formatting and reading the formatting of many runs.
+
+Run with `python benchmarks/run_format.py`.
+"""
+
+import time
+
+import docx
+
+from cmi_docx import run, styles
+
+N_RUNS = 50_000
+STYLE = styles.RunStyle(bold=True, italic=False, font_size=11, font_rgb=(0, 0, 255))
+
+
+def main() -> None:
+    """Times ExtendRun.format and ExtendRun.get_format over N_RUNS runs."""
+    document = docx.Document()
+    para = document.add_paragraph()
+    runs = [run.ExtendRun(para.add_run("word ")) for _ in range(N_RUNS)]
+
+    start = time.perf_counter()
+    for extend_run in runs:
+        extend_run.format(STYLE)
+    formatted = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for extend_run in runs:
+        extend_run.get_format()
+    read = time.perf_counter() - start
+
+    print(f"{N_RUNS} runs: format {formatted:.2f}s, get_format {read:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Benchmarks filling a template table cell by cell and with ExtendTable.fill.
+
+Run with `python benchmarks/table_fill.py`.
+"""
+
+import random
+import time
+
+import docx
+
+from cmi_docx import table
+
+N_ROWS = 300
+N_COLUMNS = 6
+
+
+def main() -> None:
+    """Times setting cell.text through Table.cell against ExtendTable.fill."""
+    rng = random.Random(0)  # noqa: S311
+    data = [[f"{rng.random():.3f}" for _ in range(N_COLUMNS)] for _ in range(N_ROWS)]
+
+    docx_table = docx.Document().add_table(rows=N_ROWS + 1, cols=N_COLUMNS)
+    start = time.perf_counter()
+    for row_index, values in enumerate(data, start=1):
+        for column_index, value in enumerate(values):
+            docx_table.cell(row_index, column_index).text = value
+    elapsed = time.perf_counter() - start
+    print(f"cell.text on {N_ROWS * N_COLUMNS} cells: {elapsed:.2f}s")
+
+    docx_table = docx.Document().add_table(rows=2, cols=N_COLUMNS)
+    start = time.perf_counter()
+    table.ExtendTable(docx_table).fill(data)
+    elapsed = time.perf_counter() - start
+    print(f"ExtendTable.fill on {N_ROWS * N_COLUMNS} cells: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,18 @@
 # sergey: disable-file: IMP001 # Allow importing non-modules for barrel export.
 
 from cmi_docx import declarative  # noqa: F401
+from cmi_docx.buffer import ParagraphBuffer  # noqa: F401
 from cmi_docx.comment import add_comment  # noqa: F401
-from cmi_docx.document import ExtendDocument  # noqa: F401
-from cmi_docx.paragraph import ExtendParagraph, FindParagraph  # noqa: F401
-from cmi_docx.run import ExtendRun, FindRun  # noqa: F401
+from cmi_docx.document import ExtendDocument, PlaceholderLocation  # noqa: F401
+from cmi_docx.index import DocumentIndex  # noqa: F401
+from cmi_docx.matching import MatchOptions  # noqa: F401
+from cmi_docx.paragraph import (  # noqa: F401
+    ExtendParagraph,
+    FindParagraph,
+    format_paragraphs,
+)
+from cmi_docx.run import ExtendRun, FindResults, FindRun  # noqa: F401
+from cmi_docx.session import EditSession  # noqa: F401
 from cmi_docx.styles import (  # noqa: F401
     CellBorder,
     CellStyle,
@@ -16,3 +24,4 @@ from cmi_docx.styles import (  # noqa: F401
     TableStyle,
 )
 from cmi_docx.table import ExtendCell, ExtendTable  # noqa: F401
+from cmi_docx.template import fill_template  # noqa: F401
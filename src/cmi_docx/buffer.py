@@ -0,0 +1,331 @@
+"""Edits the text of a paragraph in memory and writes it back to the runs once."""
+
+import bisect
+import dataclasses
+import itertools
+import types
+from typing import Self
+
+from docx.text import paragraph as docx_paragraph
+
+from cmi_docx import paragraph, run, styles
+
+
+@dataclasses.dataclass
+class _Piece:
+    """A contiguous span of a buffer's text.
+
+    Pieces refer to a span of a source string rather than holding a copy, so
+    splitting a piece does not copy its text.
+
+    Attributes:
+        source: The paragraph's original text, or the text inserted by an edit.
+        start: The offset of the piece in its source.
+        end: The offset after the piece in its source, greater than start.
+        original: Whether the source is the paragraph's original text.
+        style: The style of inserted text, None to match the surrounding run.
+    """
+
+    source: str
+    start: int
+    end: int
+    original: bool
+    style: styles.RunStyle | None = None
+
+    def __len__(self) -> int:
+        """Returns the length of the piece."""
+        return self.end - self.start
+
+    @property
+    def text(self) -> str:
+        """Returns the text of the piece."""
+        return self.source[self.start : self.end]
+
+    @property
+    def original_start(self) -> int | None:
+        """Returns the offset in the original text, None for inserted text."""
+        return self.start if self.original else None
+
+    def slice(self, start: int, end: int | None = None) -> "_Piece":
+        """Returns part of the piece.
+
+        Args:
+            start: The offset of the part in the piece.
+            end: The offset after the part, None for the end of the piece.
+
+        Returns:
+            The part of the piece.
+        """
+        return dataclasses.replace(
+            self,
+            start=self.start + start,
+            end=self.end if end is None else self.start + end,
+        )
+
+
+class ParagraphBuffer:
+    """A piece table over the text of a paragraph.
+
+    Every edit made through `FindRun.replace` or `ExtendParagraph.replace_between`
+    rewrites runs immediately, after which previously computed run and
+    character indices may be stale. The buffer instead keeps the paragraph's
+    text as a list of pieces, each either a span of the original text or text
+    inserted by an edit. Offsets always refer to the current text of the buffer,
+    so edits can be interleaved with searches in any order. Pieces are located
+    from the last edited piece onwards, which makes a forward pass of edits
+    linear in the number of pieces.
+
+    The runs are only written when the buffer is flushed, typically when
+    leaving its `with` block, with a single `ExtendParagraph.apply_edits` call.
+    """
+
+    def __init__(self, para: docx_paragraph.Paragraph) -> None:
+        """Initializes a ParagraphBuffer.
+
+        Args:
+            para: The paragraph to edit.
+        """
+        self.paragraph = para
+        self._load()
+
+    def __enter__(self) -> Self:
+        """Opens the buffer."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        """Writes the edits to the paragraph, unless the block raised an exception."""
+        if exc_type is None:
+            self.flush()
+
+    @property
+    def text(self) -> str:
+        """Returns the text of the paragraph with all edits applied."""
+        if self._text is None:
+            self._text = "".join(piece.text for piece in self._pieces)
+        return self._text
+
+    @property
+    def dirty(self) -> bool:
+        """Returns whether the buffer holds edits that were not flushed."""
+        return self._dirty
+
+    def find(self, needle: str, start: int = 0) -> int:
+        """Finds a text in the buffer.
+
+        Args:
+            needle: The text to find.
+            start: The offset to start searching from.
+
+        Returns:
+            The offset of the first occurrence, or -1 if it does not occur.
+        """
+        if self._text is not None:
+            return self._text.find(needle, start)
+        if start > self._length:
+            return -1
+        if not needle:
+            return start
+
+        # Search each piece in its source without copying it. `carry` holds
+        # the last len(needle) - 1 characters before the current piece, to
+        # catch matches that span pieces.
+        index, piece_start = self._seek(start)
+        carry = ""
+        for piece_index in range(index, len(self._pieces)):
+            piece = self._pieces[piece_index]
+            skip = max(0, start - piece_start)
+            low = piece.start + skip
+            if carry:
+                head = piece.source[low : min(low + len(needle) - 1, piece.end)]
+                position = (carry + head).find(needle)
+                if -1 < position < len(carry):
+                    return piece_start + skip - len(carry) + position
+            position = piece.source.find(needle, low, piece.end)
+            if position != -1:
+                return piece_start + position - piece.start
+            tail = piece.source[max(low, piece.end - len(needle) + 1) : piece.end]
+            carry = (carry + tail)[max(0, len(carry) + len(tail) - len(needle) + 1) :]
+            piece_start += len(piece)
+        return -1
+
+    def locate(self, offset: int) -> tuple[int, int] | None:
+        """Maps an offset of the buffer's text to the paragraph's runs.
+
+        Args:
+            offset: The offset in the buffer's text.
+
+        Returns:
+            The index of the run and the offset within the run's text, relative
+            to the runs at the last flush. None if the character was inserted
+            by an edit since.
+
+        Raises:
+            IndexError: If the offset is outside of the text.
+        """
+        if not 0 <= offset < self._length:
+            msg = f"Offset {offset} is outside of the text."
+            raise IndexError(msg)
+        index, piece_start = self._seek(offset)
+        piece = self._pieces[index]
+        if piece.original_start is None:
+            return None
+        original_offset = piece.original_start + offset - piece_start
+        run_index = bisect.bisect_right(self._run_starts, original_offset) - 1
+        return run_index, original_offset - self._run_starts[run_index]
+
+    def replace(
+        self, start: int, end: int, text: str, style: styles.RunStyle | None = None
+    ) -> None:
+        """Replaces text between offsets of the buffer's text.
+
+        Args:
+            start: The first offset to replace.
+            end: The offset after the last character to replace.
+            text: The text to insert.
+            style: The style of the inserted text. If None, matches the style of
+                the first run in the replacement window, as in
+                `ExtendParagraph.replace_between`.
+
+        Raises:
+            ValueError: If the offsets are outside of the text.
+        """
+        if not 0 <= start <= end <= self._length:
+            msg = f"Span ({start}, {end}) is outside of the text."
+            raise ValueError(msg)
+        if start == end and not text:
+            return
+
+        first, first_start = self._seek(start)
+        last, last_start = first, first_start
+        while last < len(self._pieces) and last_start + len(self._pieces[last]) < end:
+            last_start += len(self._pieces[last])
+            last += 1
+
+        replacement = []
+        if start > first_start:
+            replacement.append(self._pieces[first].slice(0, start - first_start))
+        if text:
+            replacement.append(_Piece(text, 0, len(text), original=False, style=style))
+        if last < len(self._pieces) and end - last_start < len(self._pieces[last]):
+            replacement.append(self._pieces[last].slice(end - last_start))
+        self._pieces[first : last + 1] = replacement
+
+        self._text = None
+        self._length += len(text) - (end - start)
+        self._cursor = (first, first_start)
+        self._dirty = True
+
+    def insert(
+        self, offset: int, text: str, style: styles.RunStyle | None = None
+    ) -> None:
+        """Inserts text at an offset of the buffer's text.
+
+        Args:
+            offset: The offset to insert at.
+            text: The text to insert.
+            style: The style of the inserted text, see `replace`.
+        """
+        self.replace(offset, offset, text, style)
+
+    def delete(self, start: int, end: int) -> None:
+        """Deletes text between offsets of the buffer's text.
+
+        Args:
+            start: The first offset to delete.
+            end: The offset after the last character to delete.
+        """
+        self.replace(start, end, "")
+
+    def flush(self) -> None:
+        """Writes all edits to the paragraph's runs."""
+        if not self._dirty:
+            return
+        paragraph.ExtendParagraph(self.paragraph).apply_edits(self._edits())
+        self._load()
+
+    def _load(self) -> None:
+        """Reads the text and run offsets of the paragraph."""
+        run_texts = [
+            paragraph_run.text for paragraph_run in run.ParagraphRuns(self.paragraph)
+        ]
+        text = "".join(run_texts)
+        self._text: str | None = text
+        self._length = len(text)
+        self._run_starts = list(itertools.accumulate(map(len, run_texts), initial=0))
+        self._pieces = [_Piece(text, 0, len(text), original=True)] if text else []
+        self._cursor = (0, 0)
+        self._dirty = False
+
+    def _seek(self, offset: int) -> tuple[int, int]:
+        """Finds the piece containing an offset.
+
+        Args:
+            offset: The offset in the buffer's text.
+
+        Returns:
+            The index of the piece and the offset at which it starts. An offset
+            at the end of the text returns the number of pieces.
+        """
+        index, piece_start = self._cursor
+        if offset < piece_start:
+            index, piece_start = 0, 0
+        while (
+            index < len(self._pieces)
+            and piece_start + len(self._pieces[index]) <= offset
+        ):
+            piece_start += len(self._pieces[index])
+            index += 1
+        self._cursor = (index, piece_start)
+        return index, piece_start
+
+    def _edits(self) -> list[paragraph.Edit]:
+        """Converts the pieces to edits of the original text.
+
+        Returns:
+            The edits for `ExtendParagraph.apply_edits`. Inserted pieces with
+            different styles in the same gap of the original text become
+            separate edits at the same offset.
+        """
+        edits: list[paragraph.Edit] = []
+        original_offset = 0
+        inserted: list[_Piece] = []
+        for piece in self._pieces:
+            if piece.original_start is None:
+                inserted.append(piece)
+                continue
+            if piece.original_start != original_offset or inserted:
+                edits.extend(
+                    _gap_edits(original_offset, piece.original_start, inserted)
+                )
+            original_offset = piece.original_start + len(piece)
+            inserted = []
+        if self._run_starts[-1] != original_offset or inserted:
+            edits.extend(_gap_edits(original_offset, self._run_starts[-1], inserted))
+        return edits
+
+
+def _gap_edits(start: int, end: int, inserted: list[_Piece]) -> list[paragraph.Edit]:
+    """Builds the edits that replace a gap of the original text.
+
+    Args:
+        start: The start of the gap in the original text.
+        end: The end of the gap in the original text.
+        inserted: The inserted pieces that fill the gap.
+
+    Returns:
+        The edits, the first replacing the gap and the others inserting at its
+        end.
+    """
+    groups = [
+        ("".join(piece.text for piece in group), style)
+        for style, group in itertools.groupby(inserted, key=lambda piece: piece.style)
+    ] or [("", None)]
+    return [
+        (start if index == 0 else end, end, text, style)
+        for index, (text, style) in enumerate(groups)
+    ]
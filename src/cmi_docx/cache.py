@@ -0,0 +1,76 @@
+"""Caches paragraph texts and run offsets for repeated searches."""
+
+import dataclasses
+import itertools
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from docx.text import paragraph as docx_paragraph
+
+from cmi_docx import matching
+
+if TYPE_CHECKING:
+    from docx.oxml.text import paragraph as docx_oxml_paragraph
+
+
+@dataclasses.dataclass
+class CacheEntry:
+    """Cached data of a single paragraph.
+
+    Attributes:
+        text: The text of the paragraph.
+        cumulative_run_lengths: The cumulative text lengths of the paragraph's runs.
+        folded_texts: The folded texts of the paragraph, per matching options.
+    """
+
+    text: str
+    cumulative_run_lengths: list[int]
+    folded_texts: dict[matching.MatchOptions, matching.FoldedText] = dataclasses.field(
+        default_factory=dict
+    )
+
+
+class ParagraphCache:
+    """Cache of the paragraphs of a document, their texts, and run offsets.
+
+    Entries are built on first access and dropped whenever the paragraph is
+    edited through an `ExtendParagraph`, `FindRun` or `FindResults` that holds
+    this cache, so that only edited paragraphs are re-read. Edits made by other
+    means are not seen by the cache.
+    """
+
+    def __init__(self, paragraphs: Iterable[docx_paragraph.Paragraph]) -> None:
+        """Initializes a ParagraphCache.
+
+        Args:
+            paragraphs: The paragraphs to cache.
+        """
+        self.paragraphs = list(paragraphs)
+        self._entries: dict[docx_oxml_paragraph.CT_P, CacheEntry] = {}
+
+    def entry(self, paragraph: docx_paragraph.Paragraph) -> CacheEntry:
+        """Returns the cached entry of a paragraph, building it if needed.
+
+        Args:
+            paragraph: The paragraph to look up.
+
+        Returns:
+            The paragraph's text and run offsets.
+        """
+        key = paragraph._p  # noqa: SLF001
+        if key not in self._entries:
+            self._entries[key] = CacheEntry(
+                text=paragraph.text,
+                cumulative_run_lengths=list(
+                    itertools.accumulate(len(run.text) for run in paragraph.runs)
+                ),
+            )
+        return self._entries[key]
+
+    def invalidate(self, paragraph: docx_paragraph.Paragraph) -> None:
+        """Drops the cached entry of a paragraph.
+
+        Args:
+            paragraph: The paragraph to drop.
+        """
+        self._entries.pop(paragraph._p, None)  # noqa: SLF001
@@ -3,14 +3,13 @@
 Code based on sample code in https://github.com/python-openxml/python-docx/issues/93.
 """
 
+import bisect
 import dataclasses
 import datetime
-from typing import Final
-from xml.etree import ElementTree as ET
+import weakref
+from typing import TYPE_CHECKING
 
 from docx import document, oxml
-from docx.opc import constants as docx_constants
-from docx.opc import packuri, part
 from docx.oxml import ns
 from docx.oxml.text import run as docx_run
 from docx.text import paragraph, run
@@ -18,36 +17,13 @@ from lxml import (
     etree,  # ty:ignore[unresolved-import] # This does work; not sure why not detected.
 )
 
-_COMMENTS_PART_DEFAULT_XML_BYTES: Final[bytes] = (
-    b"""
-<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\r
-<w:comments
-    xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"
-    xmlns:o="urn:schemas-microsoft-com:office:office"
-    xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"
-    xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math"
-    xmlns:v="urn:schemas-microsoft-com:vml"
-    xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
-    xmlns:w10="urn:schemas-microsoft-com:office:word"
-    xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-    xmlns:wne="http://schemas.microsoft.com/office/word/2006/wordml"
-    xmlns:sl="http://schemas.openxmlformats.org/schemaLibrary/2006/main"
-    xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"
-    xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture"
-    xmlns:c="http://schemas.openxmlformats.org/drawingml/2006/chart"
-    xmlns:lc="http://schemas.openxmlformats.org/drawingml/2006/lockedCanvas"
-    xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram"
-    xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
-    xmlns:wpg="http://schemas.microsoft.com/office/word/2010/wordprocessingGroup"
-    xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml"
-    xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml"
-    xmlns:w16="http://schemas.microsoft.com/office/word/2018/wordml"
-    xmlns:w16cex="http://schemas.microsoft.com/office/word/2018/wordml/cex"
-    xmlns:w16cid="http://schemas.microsoft.com/office/word/2016/wordml/cid"
-    xmlns:cr="http://schemas.microsoft.com/office/comments/2020/reactions">
-</w:comments>
-"""
-).strip()
+if TYPE_CHECKING:
+    from docx.parts import document as docx_document_part
+
+# Keyed by document part, as python-docx Documents are not hashable.
+_BATCHES: "weakref.WeakKeyDictionary[docx_document_part.DocumentPart, CommentBatch]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
 def add_comment(
@@ -63,6 +39,9 @@ def add_comment(
     There is a known bug where a range of locations can be provided
     where the start comes after the end.
 
+    Comments added to the same document share a `CommentBatch`, so adding
+    many comments does not re-read the comments part on every call.
+
     Args:
         docx_doc: A Word document.
         location: The paragraph and/or run object to place the comment on.
@@ -70,86 +49,175 @@ def add_comment(
             and the second element is the end.
         author: Name of the comment author.
         text: Content of the comment.
+    """
+    if docx_doc.part not in _BATCHES:
+        _BATCHES[docx_doc.part] = CommentBatch(docx_doc)
+    _BATCHES[docx_doc.part].add(location, author, text)
+
+
+class CommentBatch:
+    """Adds many comments to a Word document.
 
-    Raises:
-        ValueError: If location has incorrect typing.
+    The comments part is loaded once and comment IDs are handed out from a
+    counter; new comments are appended to the in-memory part, which is
+    serialized once when the document is saved.
     """
-    if not isinstance(location, tuple):
-        elements = (location._element, location._element)  # noqa: SLF001
-    elif len(location) > 2:  # noqa: PLR2004
-        msg = "Location must be a single element or a tuple of two."
-        raise ValueError(msg)
-    else:
-        elements = (location[0]._element, location[1]._element)  # noqa: SLF001  # ty:ignore[unresolved-attribute]
 
-    try:
-        comments_part = docx_doc.part.part_related_by(
-            docx_constants.RELATIONSHIP_TYPE.COMMENTS
-        )
-    except KeyError:
-        # No comments part found.
-        comments_part = part.Part(
-            partname=packuri.PackURI("/word/comments.xml"),
-            content_type=docx_constants.CONTENT_TYPE.WML_COMMENTS,
-            blob=_COMMENTS_PART_DEFAULT_XML_BYTES,
-            package=docx_doc.part.package,
-        )
-        docx_doc.part.relate_to(
-            comments_part, docx_constants.RELATIONSHIP_TYPE.COMMENTS
-        )
+    def __init__(self, docx_doc: document.Document) -> None:
+        """Initializes a CommentBatch.
+
+        Args:
+            docx_doc: The document to add comments to.
+        """
+        self._comments = docx_doc.part._comments_part.element  # noqa: SLF001
+        self._n_comments = -1
+        self._last_comment: etree._Element | None = None
+        self._next_id = 0
+
+    def add(
+        self,
+        location: tuple[paragraph.Paragraph | run.Run, paragraph.Paragraph | run.Run]
+        | paragraph.Paragraph
+        | run.Run,
+        author: str,
+        text: str,
+    ) -> int:
+        """Adds a comment to the document.
+
+        Args:
+            location: The paragraph and/or run object to place the comment on.
+                May also be a tuple of these where the first element is the
+                start and the second element is the end.
+            author: Name of the comment author.
+            text: Content of the comment. Each line becomes a paragraph.
+
+        Returns:
+            The ID of the new comment.
+
+        Raises:
+            ValueError: If location has incorrect typing.
+        """
+        if not isinstance(location, tuple):
+            elements = (location._element, location._element)  # noqa: SLF001
+        elif len(location) > 2:  # noqa: PLR2004
+            msg = "Location must be a single element or a tuple of two."
+            raise ValueError(msg)
+        else:
+            elements = (location[0]._element, location[1]._element)  # noqa: SLF001  # ty:ignore[unresolved-attribute]
+
+        comment_id = self._reserve_id()
+        self._last_comment = _comment_element(comment_id, author, text)
+        self._comments.append(self._last_comment)
+        self._n_comments = len(self._comments)
+        _mark_comment_range(elements[0], elements[1], comment_id)
+        return comment_id
+
+    def _reserve_id(self) -> int:
+        """Returns an unused comment ID.
+
+        The IDs in the comments part are scanned again whenever the part no
+        longer ends with the last comment added by this batch, or holds a
+        different number of comments, i.e. whenever other code added or
+        removed comments since. IDs never decrease, so comments removed by
+        other code cannot cause an ID to be handed out twice.
+
+        Returns:
+            One more than the largest comment ID in use or handed out.
+        """
+        n_comments = len(self._comments)
+        if n_comments != self._n_comments or (
+            n_comments and self._comments[-1] is not self._last_comment
+        ):
+            self._next_id = max(
+                self._next_id,
+                1
+                + max(
+                    (int(value) for value in self._comments.xpath("./w:comment/@w:id")),
+                    default=-1,
+                ),
+            )
+        comment_id = self._next_id
+        self._next_id += 1
+        return comment_id
+
 
-    comments_xml = oxml.parse_xml(comments_part.blob)
+def _comment_element(comment_id: int, author: str, text: str) -> etree._Element:
+    """Creates the `w:comment` element of a comment.
 
-    # Create the comment
-    comment_id = str(len(comments_xml.findall(ns.qn("w:comment"))))
-    comment_element = oxml.OxmlElement("w:comment")
-    comment_element.set(ns.qn("w:id"), comment_id)
-    comment_element.set(ns.qn("w:author"), author)
-    comment_element.set(
-        ns.qn("w:date"), datetime.datetime.now(datetime.UTC).isoformat()
+    Args:
+        comment_id: The ID of the comment.
+        author: Name of the comment author.
+        text: Content of the comment. Each line becomes a paragraph.
+
+    Returns:
+        The comment element.
+    """
+    comment_element = oxml.OxmlElement(
+        "w:comment",
+        {
+            ns.qn("w:id"): str(comment_id),
+            ns.qn("w:author"): author,
+            ns.qn("w:date"): datetime.datetime.now(datetime.UTC).isoformat(),
+        },
     )
+    for index, line in enumerate(text.split("\n")):
+        comment_paragraph = etree.SubElement(comment_element, ns.qn("w:p"))
+        paragraph_properties = etree.SubElement(comment_paragraph, ns.qn("w:pPr"))
+        etree.SubElement(
+            paragraph_properties, ns.qn("w:pStyle"), {ns.qn("w:val"): "CommentText"}
+        )
+        if index == 0:
+            annotation_run = etree.SubElement(comment_paragraph, ns.qn("w:r"))
+            run_properties = etree.SubElement(annotation_run, ns.qn("w:rPr"))
+            etree.SubElement(
+                run_properties,
+                ns.qn("w:rStyle"),
+                {ns.qn("w:val"): "CommentReference"},
+            )
+            etree.SubElement(annotation_run, ns.qn("w:annotationRef"))
+        text_run = etree.SubElement(comment_paragraph, ns.qn("w:r"))
+        text_element = etree.SubElement(text_run, ns.qn("w:t"))
+        text_element.text = line
+        text_element.set(f"{{{ns.nsmap['xml']}}}space", "preserve")
+    return comment_element
 
-    # Create the text element for the comment
-    for para in text.split("\n"):
-        comment_paragraph = oxml.OxmlElement("w:p")
-        comment_run = oxml.OxmlElement("w:r")
-        comment_text_element = oxml.OxmlElement("w:t")
-        comment_text_element.text = para
-        comment_run.append(comment_text_element)
-        comment_paragraph.append(comment_run)
-        comment_element.append(comment_paragraph)
-        comments_xml.append(comment_element)
-    comments_part._blob = ET.tostring(comments_xml)  # noqa: SLF001
-
-    # Create the commentRangeStart and commentRangeEnd elements
-    comment_range_start = oxml.OxmlElement("w:commentRangeStart")
-    comment_range_start.set(ns.qn("w:id"), comment_id)
-    comment_range_end = oxml.OxmlElement("w:commentRangeEnd")
-    comment_range_end.set(ns.qn("w:id"), comment_id)
-
-    # Add the commentRangeStart to the first element and commentRangeEnd to
-    # the last element
-    elements[0].insert(0, comment_range_start)
-    elements[1].append(comment_range_end)
-
-    # Add the comment reference to each element in the range
-    # for element in elements:
-    comment_reference = oxml.OxmlElement("w:r")
-    comment_reference_run = oxml.OxmlElement("w:r")
-    comment_reference_run_properties = oxml.OxmlElement("w:rPr")
-    comment_reference_run_properties.append(
-        oxml.OxmlElement("w:rStyle", {ns.qn("w:val"): "CommentReference"})
+
+def _mark_comment_range(
+    first: etree._Element, last: etree._Element, comment_id: int
+) -> None:
+    """Delimits a comment's range and adds its reference after the range.
+
+    Args:
+        first: The first paragraph or run of the range.
+        last: The last paragraph or run of the range.
+        comment_id: The ID of the comment.
+    """
+    range_start = oxml.OxmlElement(
+        "w:commentRangeStart", {ns.qn("w:id"): str(comment_id)}
     )
-    comment_reference_run.append(comment_reference_run_properties)
-    comment_reference_element = oxml.OxmlElement("w:commentReference")
-    comment_reference_element.set(ns.qn("w:id"), comment_id)
-    comment_reference_run.append(comment_reference_element)
-    comment_reference.append(comment_reference_run)
+    if first.tag == ns.qn("w:r"):
+        first.addprevious(range_start)
+    else:
+        first.insert(1 if first.find(ns.qn("w:pPr")) is not None else 0, range_start)
 
-    elements[0].append(comment_reference)
+    range_end = oxml.OxmlElement("w:commentRangeEnd", {ns.qn("w:id"): str(comment_id)})
+    reference_run = oxml.OxmlElement("w:r")
+    run_properties = etree.SubElement(reference_run, ns.qn("w:rPr"))
+    etree.SubElement(
+        run_properties, ns.qn("w:rStyle"), {ns.qn("w:val"): "CommentReference"}
+    )
+    etree.SubElement(
+        reference_run, ns.qn("w:commentReference"), {ns.qn("w:id"): str(comment_id)}
+    )
+    if last.tag == ns.qn("w:r"):
+        last.addnext(range_end)
+        range_end.addnext(reference_run)
+    else:
+        last.append(range_end)
+        last.append(reference_run)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CommentRange:
     """All data representing a comment range.
 
@@ -173,39 +241,35 @@ class CommentPreserver:
         self.paragraph = paragraph_element
         self.ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
 
-    def _get_text_length_before_element(self, element: etree._Element) -> int:
-        """Calculate total text length before given element."""
-        length = 0
-        for elem in self.paragraph.iter():
-            if elem == element:
-                break
-            if elem.tag == f"{{{self.ns['w']}}}t":
-                length += len(elem.text or "")
-        return length
-
     def extract_comments(self) -> list[CommentRange]:
-        """Extract all comment ranges from the paragraph."""
+        """Extract all comment ranges from the paragraph.
+
+        The text offsets of all range boundaries are computed in a single walk
+        over the paragraph.
+        """
         comments = []
         start_elements = {}
+        text_length = 0
 
         for elem in self.paragraph.iter():
             if elem.tag == f"{{{self.ns['w']}}}commentRangeStart":
                 comment_id = elem.get(f"{{{self.ns['w']}}}id")
-                start_pos = self._get_text_length_before_element(elem)
-                start_elements[comment_id] = start_pos
+                start_elements[comment_id] = text_length
 
             if elem.tag == f"{{{self.ns['w']}}}commentRangeEnd":
                 comment_id = elem.get(f"{{{self.ns['w']}}}id")
                 if comment_id in start_elements:
-                    end_pos = self._get_text_length_before_element(elem)
                     comments.append(
                         CommentRange(
                             id=comment_id,
                             start_index=start_elements[comment_id],
-                            end_index=end_pos,
+                            end_index=text_length,
                         )
                     )
 
+            if elem.tag == f"{{{self.ns['w']}}}t":
+                text_length += len(elem.text or "")
+
         return comments
 
     def strip_comments(self) -> None:
@@ -302,20 +366,38 @@ class CommentPreserver:
         return adjusted
 
     def restore_comments(self, comments: list[CommentRange]) -> None:
-        """Restore comment ranges to the paragraph at adjusted positions."""
+        """Restore comment ranges to the paragraph at adjusted positions.
+
+        The text runs of the paragraph are collected once; every range
+        boundary is then placed next to its run directly.
+        """
         # First, ensure any leftover comment references are removed
         self.strip_comments()
+        if not comments:
+            return
+
+        # Clean up any empty runs before adding the comment references
+        for elem in list(self.paragraph):
+            if elem.tag == f"{{{self.ns['w']}}}r" and len(elem) == 0:
+                self.paragraph.remove(elem)
+
+        runs_with_text = self._collect_text_runs()
+        run_ends = [start_pos + length for _, start_pos, length in runs_with_text]
 
         for comment in comments:
             # Create and insert comment range start
             start_elem = etree.Element(f"{{{self.ns['w']}}}commentRangeStart")
             start_elem.set(f"{{{self.ns['w']}}}id", comment.id)
-            self._insert_at_position(start_elem, comment.start_index)
+            self._insert_at_position(
+                start_elem, comment.start_index, runs_with_text, run_ends
+            )
 
             # Create and insert comment range end
             end_elem = etree.Element(f"{{{self.ns['w']}}}commentRangeEnd")
             end_elem.set(f"{{{self.ns['w']}}}id", comment.id)
-            self._insert_at_position(end_elem, comment.end_index)
+            self._insert_at_position(
+                end_elem, comment.end_index, runs_with_text, run_ends
+            )
 
             # Create and insert comment reference as last element
             ref_run = etree.Element(f"{{{self.ns['w']}}}r")
@@ -325,36 +407,36 @@ class CommentPreserver:
             ref = etree.SubElement(ref_run, f"{{{self.ns['w']}}}commentReference")
             ref.set(f"{{{self.ns['w']}}}id", comment.id)
 
-            # Clean up any empty runs before adding the comment reference
-            for elem in list(self.paragraph):
-                if elem.tag == f"{{{self.ns['w']}}}r" and len(elem) == 0:
-                    self.paragraph.remove(elem)
-
             # Always append reference at the end of paragraph
             self.paragraph.append(ref_run)
 
-    def _insert_at_position(self, elem: etree._Element, text_pos: int) -> None:
-        """Insert element at the specified text position."""
-        runs_with_text = self._collect_text_runs()
-
+    def _insert_at_position(
+        self,
+        elem: etree._Element,
+        text_pos: int,
+        runs_with_text: list[tuple],
+        run_ends: list[int],
+    ) -> None:
+        """Insert element at the specified text position.
+
+        Args:
+            elem: The element to insert.
+            text_pos: The text offset to insert the element at.
+            runs_with_text: The text runs of the paragraph, see
+                `_collect_text_runs`.
+            run_ends: The text offset at the end of each text run.
+        """
         if not runs_with_text:
-            if self.paragraph:
-                self.paragraph.insert(0, elem)
-            else:
-                self.paragraph.append(elem)
+            self.paragraph.insert(0, elem)
             return
 
-        for run_elem, start_pos, length in runs_with_text:
-            if start_pos + length >= text_pos:
-                if start_pos + length == text_pos:
-                    insert_idx = self.paragraph.index(run_elem) + 1
-                    self.paragraph.insert(insert_idx, elem)
-                else:
-                    insert_idx = self.paragraph.index(run_elem)
-                    self.paragraph.insert(insert_idx, elem)
-                return
-
-        self.paragraph.append(elem)
+        run_index = bisect.bisect_left(run_ends, text_pos)
+        if run_index == len(run_ends):
+            self.paragraph.append(elem)
+        elif run_ends[run_index] == text_pos:
+            runs_with_text[run_index][0].addnext(elem)
+        else:
+            runs_with_text[run_index][0].addprevious(elem)
 
     def _collect_text_runs(self) -> list[tuple]:
         """Collect all text-containing runs with their positions."""
@@ -1,7 +1,12 @@
 """Declarative API for creating Word documents."""
 
 from cmi_docx.declarative.base import Component
-from cmi_docx.declarative.document import Document, DocumentTemplate
+from cmi_docx.declarative.batch import render_many
+from cmi_docx.declarative.document import (
+    CompiledTemplate,
+    Document,
+    DocumentTemplate,
+)
 from cmi_docx.declarative.image import ImageRun
 from cmi_docx.declarative.paragraph import Break, Paragraph, Tab, TextRun
 from cmi_docx.declarative.section import (
@@ -18,6 +23,7 @@ from cmi_docx.declarative.styles import (
 )
 from cmi_docx.declarative.table import (
     CellBorder,
+    DataTable,
     Table,
     TableBorder,
     TableCell,
@@ -28,7 +34,9 @@ __all__ = [
     "BlockChildren",
     "Break",
     "CellBorder",
+    "CompiledTemplate",
     "Component",
+    "DataTable",
     "Document",
     "DocumentTemplate",
     "Footer",
@@ -46,4 +54,5 @@ __all__ = [
     "TableSectionFormat",
     "TableStyleDefinition",
     "TextRun",
+    "render_many",
 ]
@@ -0,0 +1,175 @@
+"""Renders many declarative documents in parallel worker processes."""
+
+import asyncio
+import copy
+import dataclasses
+import os
+import pathlib
+from collections.abc import AsyncIterator, Iterable
+from concurrent import futures
+
+from cmi_docx.declarative import base, document
+
+
+async def render_many(
+    documents: Iterable[document.Document],
+    output_dir: pathlib.Path | str | None = None,
+    *,
+    workers: int | None = None,
+    template: document.DocumentTemplate | None = None,
+) -> AsyncIterator[tuple[int, pathlib.Path | bytes]]:
+    """Renders documents to Word files in a pool of worker processes.
+
+    Async children are resolved in the calling process, after which the
+    resolved documents are packed and saved by the workers. Documents are
+    resolved one at a time while the workers are busy, so that at most a few
+    documents per worker are held in memory.
+
+    Conditions are evaluated once, in the calling process, before a document
+    is sent to a worker. The workers receive a copy of each document with its
+    conditions replaced by their values; the documents themselves are only
+    changed by resolving them and by closing the coroutines of disabled
+    children, which are never awaited.
+
+    Args:
+        documents: The documents to render.
+        output_dir: The directory to save the documents to, as `<index>.docx`.
+            If None, the documents are returned as bytes instead.
+        workers: The number of worker processes. Defaults to the number of
+            CPUs available.
+        template: The template to use as a base for every document.
+
+    Yields:
+        The index of each document in `documents`, and its path or bytes, in
+        the order in which the documents complete.
+    """
+    output_dir = pathlib.Path(output_dir) if output_dir is not None else None
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = 2 * workers
+    loop = asyncio.get_running_loop()
+    # Leaving a `with` block would wait for the workers on the event loop.
+    executor = futures.ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending: set[asyncio.Future[tuple[int, pathlib.Path | bytes]]] = set()
+        for index, doc in enumerate(documents):
+            await doc.resolve()
+            frozen = copy.copy(doc)
+            frozen.sections = [
+                _freeze_conditions(sec, enabled=True) for sec in doc.sections
+            ]
+            path = output_dir / f"{index}.docx" if output_dir is not None else None
+            pending.add(
+                loop.run_in_executor(executor, _render, index, frozen, template, path)
+            )
+
+            if len(pending) >= max_pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield future.result()
+
+        for future in asyncio.as_completed(pending):
+            yield await future
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _render(
+    index: int,
+    doc: document.Document,
+    template: document.DocumentTemplate | None,
+    path: pathlib.Path | None,
+) -> tuple[int, pathlib.Path | bytes]:
+    """Packs and saves a resolved document in a worker process.
+
+    Args:
+        index: The index of the document.
+        doc: The resolved document.
+        template: The template to use as a base for the document.
+        path: The path to save the document to, or None to return its bytes.
+
+    Returns:
+        The index of the document, and its path or bytes.
+    """
+    if path is not None:
+        asyncio.run(doc.save(path, template))
+        return index, path
+    return index, asyncio.run(doc.to_bytes(template))
+
+
+def _freeze_conditions[T: base.Component](component: T, *, enabled: bool) -> T:
+    """Copies a component tree with its conditions replaced by their values.
+
+    Conditions are usually lambdas, which cannot be sent to another process.
+    Children of disabled components are never resolved nor packed; any
+    unresolved values they hold are left out of the copy, and their
+    coroutines are closed.
+
+    Args:
+        component: The root of the tree.
+        enabled: Whether the component's parents are enabled.
+
+    Returns:
+        A copy of the tree. Components and containers are copied, other values
+        are shared with the original tree.
+    """
+    enabled = enabled and component.condition()
+    frozen = copy.copy(component)
+    frozen.condition = _enabled if enabled else _disabled
+    for field in dataclasses.fields(component):
+        if field.name == "condition":
+            continue
+        value = getattr(component, field.name)
+        if isinstance(value, dict):
+            items = list(value.values())
+            frozen_value = {
+                key: _freeze_item(item, enabled=enabled) for key, item in value.items()
+            }
+        elif isinstance(value, list | tuple):
+            items = list(value)
+            frozen_value = type(value)(
+                _freeze_item(item, enabled=enabled) for item in value
+            )
+        else:
+            items = [value]
+            frozen_value = _freeze_item(value, enabled=enabled)
+
+        if not enabled and any(
+            callable(item) or asyncio.iscoroutine(item) for item in items
+        ):
+            frozen_value = None
+        setattr(frozen, field.name, frozen_value)
+    return frozen
+
+
+def _freeze_item(item: object, *, enabled: bool) -> object:
+    """Freezes the conditions of an item if it is a component.
+
+    Args:
+        item: A field value, or an element of one.
+        enabled: Whether the item's parents are enabled.
+
+    Returns:
+        A frozen copy of the item if it is a component, otherwise the item.
+        Coroutines of disabled components are closed, as they are never
+        awaited.
+    """
+    if isinstance(item, base.Component):
+        return _freeze_conditions(item, enabled=enabled)
+    if not enabled and asyncio.iscoroutine(item):
+        item.close()
+    return item
+
+
+def _enabled() -> bool:
+    """Condition of components that are rendered."""
+    return True
+
+
+def _disabled() -> bool:
+    """Condition of components that are not rendered."""
+    return False
@@ -1,12 +1,20 @@
 """Top-level Document class for declarative API."""
 
 import asyncio
+import copy
 import dataclasses
 import datetime
 import io
+import itertools
+import math
+import numbers
+import operator
 import pathlib
-from collections.abc import Iterable, Sequence
-from typing import Literal
+import re
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent import futures
+from typing import IO, Literal, Self
+from xml.sax import saxutils
 
 import docx
 from docx import document as docx_document
@@ -18,15 +26,18 @@ from docx.enum import style as docx_style
 from docx.enum import table as docx_enum_table
 from docx.enum import text as docx_text
 from docx.oxml import simpletypes as docx_simpletypes
-from docx.oxml.ns import qn
+from docx.oxml.ns import nsdecls, qn
 from docx.text import paragraph as docx_paragraph
 from lxml import (
     etree,  # ty:ignore[unresolved-import] # This does work; not sure why not detected.
 )
 
+from cmi_docx import comment as cmi_comment
 from cmi_docx import document as imperative_document
+from cmi_docx import paragraph as cmi_paragraph
 from cmi_docx import styles as cmi_styles
 from cmi_docx import table as cmi_table
+from cmi_docx import template as cmi_template
 from cmi_docx.declarative import image, paragraph, section, table
 from cmi_docx.declarative import styles as styles_mod
 
@@ -48,6 +59,266 @@ class DocumentTemplate:
     replacements: dict[str, str] | None = None
     paragraph_index: int | None = None
 
+    def compile(self) -> "CompiledTemplate":
+        """Parses the template once for rendering many documents.
+
+        Returns:
+            The compiled template.
+        """
+        return CompiledTemplate(self)
+
+    def fill(
+        self,
+        destination: pathlib.Path | str | IO[bytes],
+        replacements: Mapping[str, str] | None = None,
+    ) -> None:
+        """Fills the template's placeholders and writes the result.
+
+        A fast path for templates that only need text placeholders replaced:
+        the document's XML is edited directly without python-docx, and parts
+        without placeholders are copied unchanged. `paragraph_index` is not
+        used, as no content is inserted.
+
+        Args:
+            destination: Where to write the filled document.
+            replacements: Replacement texts for the template's placeholders.
+                Defaults to the replacements of the template.
+        """
+        if replacements is None:
+            replacements = self.replacements or {}
+        cmi_template.fill_template(self.path, destination, replacements)
+
+
+_TEXT_TAG = qn("w:t")
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+# Characters that may not appear in an XML 1.0 document, not even escaped.
+_INVALID_XML_CHARACTERS = re.compile(
+    "[^\t\n\r\u0020-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+# The missing-value scalars of pandas, matched by type name so that pandas
+# stays optional.
+_MISSING_TYPE_NAMES = frozenset({"NAType", "NaTType"})
+
+
+@dataclasses.dataclass
+class _TemplateSlot:
+    """A text element or run of a compiled template that contains placeholders.
+
+    Attributes:
+        partname: The name of the package part containing the element.
+        path: Child indices leading from the part's root element to the element.
+        text: The text of the element in the template.
+        placeholders: The (start, end, needle) of each placeholder in the run.
+    """
+
+    partname: str
+    path: tuple[int, ...]
+    text: str
+    placeholders: list[tuple[int, int, str]]
+
+
+class CompiledTemplate:
+    """A DocumentTemplate that is parsed once and rendered many times.
+
+    The template file is read once. Every placeholder occurrence is moved into
+    a single run and its location is recorded, so that a render only clones the
+    parsed document and rewrites the runs that hold placeholders.
+
+    Attributes:
+        template: The template that was compiled.
+    """
+
+    def __init__(self, template: DocumentTemplate) -> None:
+        """Compiles a DocumentTemplate.
+
+        Args:
+            template: The template to compile.
+        """
+        self.template = template
+        self._needles = frozenset(
+            needle for needle in (template.replacements or {}) if needle
+        )
+        working_doc = docx.Document(str(template.path))
+        self._slots = self._find_slots(working_doc)
+
+        # Reload the prepared template so that no python-docx proxy objects
+        # holding references into the XML are cached on the document; those
+        # would be copied separately from the XML trees by `copy.deepcopy`.
+        buffer = io.BytesIO()
+        working_doc.save(buffer)
+        self._document = docx.Document(buffer)
+
+    @property
+    def paragraph_index(self) -> int | None:
+        """The paragraph index at which to insert user-defined section content."""
+        return self.template.paragraph_index
+
+    def render(
+        self, replacements: Mapping[str, str] | None = None
+    ) -> docx_document.Document:
+        """Renders a new, independent document from the template.
+
+        Args:
+            replacements: Replacement texts for the template's placeholders.
+                Defaults to the replacements of the template. Placeholders
+                without a replacement are left as they are.
+
+        Returns:
+            The rendered python-docx Document.
+
+        Raises:
+            ValueError: If a replacement is given for a needle that was not
+                part of the template's replacements when it was compiled.
+        """
+        if replacements is None:
+            replacements = self.template.replacements or {}
+        if unknown := {needle for needle in replacements if needle} - self._needles:
+            msg = f"Needles were not compiled into the template: {sorted(unknown)}"
+            raise ValueError(msg)
+
+        docx_doc = copy.deepcopy(self._document)
+        parts = {part.partname: part for part in docx_doc.part.package.iter_parts()}
+        for slot in self._slots:
+            element = parts[slot.partname].element  # ty:ignore[unresolved-attribute] Slots only refer to XML parts.
+            for index in slot.path:
+                element = element[index]
+
+            pieces = []
+            position = 0
+            for start, end, needle in slot.placeholders:
+                pieces.append(slot.text[position:start])
+                pieces.append(replacements.get(needle, needle))
+                position = end
+            pieces.append(slot.text[position:])
+            element.text = "".join(pieces)
+            if element.tag == _TEXT_TAG:
+                element.set(_XML_SPACE, "preserve")
+        return docx_doc
+
+    def _find_slots(self, docx_doc: docx_document.Document) -> list[_TemplateSlot]:
+        """Moves every placeholder into a single run and records its location.
+
+        Args:
+            docx_doc: The template document, which is modified in place.
+
+        Returns:
+            The runs of the template that contain placeholders.
+        """
+        if not self._needles:
+            return []
+        pattern = re.compile(
+            "|".join(
+                re.escape(needle)
+                for needle in sorted(self._needles, key=len, reverse=True)
+            )
+        )
+
+        slots: list[_TemplateSlot] = []
+        extended_doc = imperative_document.ExtendDocument(docx_doc)
+        for para in extended_doc.iter_paragraphs():
+            matches = list(pattern.finditer(para.text))
+            if not matches:
+                continue
+
+            extended_para = cmi_paragraph.ExtendParagraph(para)
+            spans = [match.span() for match in matches]
+            for match, run_find in zip(
+                reversed(matches),
+                reversed(extended_para.spans_to_runs(spans)),
+                strict=True,
+            ):
+                run_find.replace(match.group())
+
+            placeholders_by_run: dict[int, list[tuple[int, int, str]]] = {}
+            run_elements = {}
+            for match, run_find in zip(
+                matches, extended_para.spans_to_runs(spans), strict=True
+            ):
+                run_index = run_find.run_indices[0]
+                run_elements[run_index] = run_find.runs[0]._element  # noqa: SLF001
+                start = run_find.character_indices[0]
+                placeholders_by_run.setdefault(run_index, []).append(
+                    (start, start + len(match.group()), match.group())
+                )
+            for run_index, placeholders in placeholders_by_run.items():
+                slots.extend(
+                    _run_slots(
+                        para.part.partname, run_elements[run_index], placeholders
+                    )
+                )
+        return slots
+
+
+def _run_slots(
+    partname: str,
+    run_element: etree._Element,  # type: ignore[name-defined]
+    placeholders: list[tuple[int, int, str]],
+) -> list[_TemplateSlot]:
+    """Creates the slots for the placeholders of a single run.
+
+    Placeholders are located in the run's `w:t` elements, whose text can be
+    rewritten directly. If any placeholder contains a tab or a break, the whole
+    run becomes a single slot instead.
+
+    Args:
+        partname: The name of the package part containing the run.
+        run_element: The `w:r` element holding the placeholders.
+        placeholders: The (start, end, needle) of each placeholder in the run.
+
+    Returns:
+        The slots of the run.
+    """
+    text_slots: dict[etree._Element, _TemplateSlot] = {}  # type: ignore[name-defined]
+    offset = 0
+    placeholder_iter = iter(placeholders)
+    placeholder = next(placeholder_iter, None)
+    for child in run_element.xpath(
+        "w:br | w:cr | w:noBreakHyphen | w:ptab | w:t | w:tab"
+    ):
+        child_text = str(child)
+        end = offset + len(child_text)
+        while placeholder is not None and placeholder[1] <= end:
+            start, stop, needle = placeholder
+            if child.tag != _TEXT_TAG or start < offset:
+                return [
+                    _TemplateSlot(
+                        partname=partname,
+                        path=_element_path(run_element),
+                        text=run_element.text,
+                        placeholders=placeholders,
+                    )
+                ]
+            if child not in text_slots:
+                text_slots[child] = _TemplateSlot(
+                    partname=partname,
+                    path=_element_path(child),
+                    text=child_text,
+                    placeholders=[],
+                )
+            text_slots[child].placeholders.append(
+                (start - offset, stop - offset, needle)
+            )
+            placeholder = next(placeholder_iter, None)
+        offset = end
+    return list(text_slots.values())
+
+
+def _element_path(element: etree._Element) -> tuple[int, ...]:  # type: ignore[name-defined]
+    """Returns the child indices leading from the root element to an element.
+
+    Args:
+        element: The element to locate.
+
+    Returns:
+        The indices, starting at the root element.
+    """
+    path = []
+    parent = element.getparent()
+    while parent is not None:
+        path.append(parent.index(element))
+        element, parent = parent, parent.getparent()
+    return tuple(reversed(path))
+
 
 class Document:
     """A Word document with sections.
@@ -111,26 +382,120 @@ class Document:
         self.styles = styles
         self.numbering = numbering
 
-    async def to_docx(  # noqa: C901
-        self, template: DocumentTemplate | None = None
+    async def resolve(self) -> Self:
+        """Resolves all async children of the document's sections concurrently.
+
+        Returns:
+            Self with all sections resolved.
+        """
+        await asyncio.gather(*(section.resolve() for section in self.sections))
+        return self
+
+    async def to_docx(
+        self,
+        template: DocumentTemplate | CompiledTemplate | None = None,
+        *,
+        executor: futures.Executor | None = None,
     ) -> docx_document.Document:
         """Convert to a python-docx Document.
 
-        Automatically resolves all async children before converting.
+        Automatically resolves all async children before converting. The
+        conversion itself runs in an executor, so that the event loop is not
+        blocked while large documents are packed.
+
+        Args:
+            template: The template to use as a base for the document. Use a
+                CompiledTemplate when rendering the same template many times.
+            executor: The executor to pack the document in. Defaults to the
+                event loop's default executor.
 
         Returns:
             A python-docx Document object.
         """
-        await asyncio.gather(*(section.resolve() for section in self.sections))
+        await self.resolve()
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, self._pack, template
+        )
+
+    async def save(
+        self,
+        path: pathlib.Path | str | IO[bytes],
+        template: DocumentTemplate | CompiledTemplate | None = None,
+        *,
+        executor: futures.Executor | None = None,
+    ) -> None:
+        """Convert to a Word document and save it.
+
+        Packing and saving run in an executor, see `to_docx`.
 
-        docx_doc = (
-            docx.Document() if template is None else docx.Document(str(template.path))
+        Args:
+            path: The path or file to save the document to.
+            template: The template to use as a base for the document.
+            executor: The executor to pack and save the document in. Defaults
+                to the event loop's default executor.
+        """
+        await self.resolve()
+        await asyncio.get_running_loop().run_in_executor(
+            executor, self._pack_and_save, path, template
         )
 
-        if template is not None and template.replacements is not None:
-            extended_doc = imperative_document.ExtendDocument(docx_doc)
-            for needle, replacement in template.replacements.items():
-                extended_doc.replace(needle, replacement)
+    async def to_bytes(
+        self,
+        template: DocumentTemplate | CompiledTemplate | None = None,
+        *,
+        executor: futures.Executor | None = None,
+    ) -> bytes:
+        """Convert to the bytes of a Word document.
+
+        Packing and saving run in an executor, see `to_docx`.
+
+        Args:
+            template: The template to use as a base for the document.
+            executor: The executor to pack and save the document in. Defaults
+                to the event loop's default executor.
+
+        Returns:
+            The contents of the .docx file.
+        """
+        buffer = io.BytesIO()
+        await self.save(buffer, template, executor=executor)
+        return buffer.getvalue()
+
+    def _pack_and_save(
+        self,
+        path: pathlib.Path | str | IO[bytes],
+        template: DocumentTemplate | CompiledTemplate | None,
+    ) -> None:
+        """Packs the resolved document and saves it.
+
+        Args:
+            path: The path or file to save the document to.
+            template: The template to use as a base for the document.
+        """
+        docx_doc = self._pack(template)
+        docx_doc.save(str(path) if isinstance(path, pathlib.Path) else path)
+
+    def _pack(  # noqa: C901, PLR0912
+        self, template: DocumentTemplate | CompiledTemplate | None
+    ) -> docx_document.Document:
+        """Packs the resolved document into a python-docx Document.
+
+        Args:
+            template: The template to use as a base for the document.
+
+        Returns:
+            A python-docx Document object.
+        """
+        if template is None:
+            docx_doc = docx.Document()
+        elif isinstance(template, CompiledTemplate):
+            docx_doc = template.render()
+        else:
+            docx_doc = docx.Document(str(template.path))
+            if template.replacements is not None:
+                imperative_document.ExtendDocument(docx_doc).replace_many(
+                    template.replacements
+                )
 
         if self.creator:
             docx_doc.core_properties.author = self.creator
@@ -626,16 +991,16 @@ def _pack_footer(
 def _pack_block_element(
     docx_doc: docx_document.Document,
     container: docx_document.Document,
-    element: paragraph.Paragraph | table.Table,
+    element: paragraph.Paragraph | table.Table | table.DataTable,
     default_comment_author: str | None,
     insert_index: int | None = None,
 ) -> None:
-    """Pack a block-level element (Paragraph or Table).
+    """Pack a block-level element (Paragraph, Table or DataTable).
 
     Args:
         docx_doc: The python-docx Document (needed for comment API).
         container: The container to add to.
-        element: The Paragraph or Table to pack.
+        element: The Paragraph, Table or DataTable to pack.
         default_comment_author: Default author for comments.
         insert_index: If provided, insert at this paragraph index in docx_doc
             instead of appending.
@@ -647,6 +1012,8 @@ def _pack_block_element(
         return _pack_paragraph(
             docx_doc, container, element, default_comment_author, insert_index
         )
+    if isinstance(element, table.DataTable):
+        return _pack_data_table(docx_doc, container, element, insert_index)
     return _pack_table(
         docx_doc, container, element, default_comment_author, insert_index
     )
@@ -733,7 +1100,7 @@ def _pack_paragraph_into_existing(  # noqa: C901, PLR0912
 
     if para.comment_text:
         author = para.comment_author or default_comment_author or ""
-        docx_doc.add_comment(runs=docx_para.runs, text=para.comment_text, author=author)  # ty:ignore[invalid-argument-type] already awaited.
+        cmi_comment.add_comment(docx_doc, docx_para, author, para.comment_text)  # ty:ignore[invalid-argument-type] already awaited.
 
 
 def _pack_inline_element(
@@ -814,7 +1181,7 @@ def _pack_text_run(  # noqa: C901
 
     if run.comment_text:
         author = run.comment_author or default_comment_author or ""
-        docx_doc.add_comment(runs=docx_run, text=run.comment_text, author=author)  # ty:ignore[invalid-argument-type] already awaited.
+        cmi_comment.add_comment(docx_doc, docx_run, author, run.comment_text)  # ty:ignore[invalid-argument-type] already awaited.
 
 
 def _pack_image_run(para: docx_paragraph.Paragraph, img: image.ImageRun) -> None:
@@ -884,6 +1251,223 @@ def _pack_table(
         else 0
     )
 
+    docx_table = _add_table(
+        docx_doc,
+        container,
+        tbl,
+        num_rows=num_rows,
+        num_cols=num_cols,
+        insert_index=insert_index,
+    )
+
+    for row_idx, row in enumerate(filtered_rows):
+        _pack_table_row(docx_doc, docx_table.rows[row_idx], row, default_comment_author)  # ty:ignore[invalid-argument-type] already awaited.
+
+    if tbl.layout != "autofit" and tbl.column_widths is not None:
+        _apply_column_widths(docx_table, tbl.column_widths, num_cols)
+
+    if tbl.borders:
+        _apply_table_borders(docx_table, tbl.borders)
+
+
+def _pack_data_table(
+    docx_doc: docx_document.Document,
+    container: docx_document.Document,
+    tbl: table.DataTable,
+    insert_index: int | None = None,
+) -> None:
+    """Pack a DataTable into a container.
+
+    Each column is formatted in one pass, then the rows are assembled as XML
+    text and parsed in chunks, bypassing the python-docx row and cell proxies.
+
+    Args:
+        docx_doc: The python-docx Document.
+        container: The container to add to.
+        tbl: The declarative DataTable.
+        insert_index: If provided, insert the table before this paragraph index
+            in docx_doc instead of appending.
+
+    Raises:
+        ValueError: If the columns differ in length, or if the formats,
+            alignments or header rows do not have one entry per column.
+    """
+    num_cols = len(tbl.columns)
+    if num_cols == 0:
+        return
+    num_rows = len(tbl.columns[0])
+    if any(len(column) != num_rows for column in tbl.columns):
+        msg = "All columns of a DataTable must have the same length."
+        raise ValueError(msg)
+    formats = tbl.formats if tbl.formats is not None else [None] * num_cols
+    alignments = tbl.alignments if tbl.alignments is not None else [None] * num_cols
+    header_rows = tbl.header_rows or []
+    for name, values in [
+        ("formats", formats),
+        ("alignments", alignments),
+        *(("header_rows", header_row) for header_row in header_rows),
+    ]:
+        if len(values) != num_cols:
+            msg = f"{name} must have one entry per column ({num_cols})."
+            raise ValueError(msg)
+
+    docx_table = _add_table(
+        docx_doc,
+        container,
+        tbl,
+        num_rows=0,
+        num_cols=num_cols,
+        insert_index=insert_index,
+    )
+    tbl_element = docx_table._tbl  # noqa: SLF001
+    cell_starts = [
+        "<w:tc><w:tcPr>"
+        f'<w:tcW w:type="dxa" w:w="{grid_col.w.twips}"/>'
+        "</w:tcPr><w:p>"
+        + (f'<w:pPr><w:jc w:val="{alignment}"/></w:pPr>' if alignment else "")
+        for grid_col, alignment in zip(
+            tbl_element.tblGrid.gridCol_lst, alignments, strict=True
+        )
+    ]
+    header_start = (
+        "<w:tr><w:trPr><w:tblHeader/></w:trPr>" if tbl.repeat_header else "<w:tr>"
+    )
+    header_xml = [
+        _data_row_xml(
+            header_start,
+            cell_starts,
+            (_xml_text(str(text)) for text in header_row),
+        )
+        for header_row in header_rows
+    ]
+    columns = [
+        _format_column(column, spec, tbl.missing)
+        for column, spec in zip(tbl.columns, formats, strict=True)
+    ]
+    rows_xml = (
+        _data_row_xml("<w:tr>", cell_starts, texts)
+        for texts in zip(*columns, strict=True)
+    )
+
+    for chunk in itertools.batched(itertools.chain(header_xml, rows_xml), 1_000):
+        tbl_element.extend(
+            oxml.parse_xml(f"<w:tbl {nsdecls('w')}>{''.join(chunk)}</w:tbl>")
+        )
+
+    if tbl.layout != "autofit" and tbl.column_widths is not None:
+        _apply_column_widths(docx_table, tbl.column_widths, num_cols)
+
+    if tbl.borders:
+        _apply_table_borders(docx_table, tbl.borders)
+
+
+def _format_column(
+    values: Sequence[object],
+    spec: str | Callable[[object], str] | None,
+    missing: str,
+) -> list[str]:
+    """Formats the values of a DataTable column as escaped XML text.
+
+    Args:
+        values: The values of the column.
+        spec: A format spec, a callable returning the text of a value, or None
+            to use `str`.
+        missing: The text of None and NaN values.
+
+    Returns:
+        The escaped text of each value.
+    """
+    if spec is None:
+        formatter: Callable[[object], str] = str
+    elif isinstance(spec, str):
+        formatter = operator.methodcaller("__format__", spec)
+    else:
+        formatter = spec
+    missing = _xml_text(missing)
+    return [
+        missing if _is_missing(value) else _xml_text(formatter(value))
+        for value in values
+    ]
+
+
+def _is_missing(value: object) -> bool:
+    """Checks whether a DataTable value is missing.
+
+    Args:
+        value: The value to check.
+
+    Returns:
+        True for None, NaN, and the pandas NA and NaT scalars.
+    """
+    if value is None:
+        return True
+    if isinstance(value, numbers.Real):
+        try:
+            return math.isnan(value)
+        except (TypeError, ValueError, OverflowError):
+            return False
+    return type(value).__name__ in _MISSING_TYPE_NAMES
+
+
+def _xml_text(text: str) -> str:
+    """Escapes a text for XML, dropping characters XML does not allow.
+
+    Args:
+        text: The text to escape.
+
+    Returns:
+        The escaped text.
+    """
+    # All characters XML forbids are unprintable, so most texts skip the regex.
+    if not text.isprintable():
+        text = _INVALID_XML_CHARACTERS.sub("", text)
+    return saxutils.escape(text)
+
+
+def _data_row_xml(row_start: str, cell_starts: list[str], texts: Iterable[str]) -> str:
+    """Builds the XML of a DataTable row.
+
+    Args:
+        row_start: The opening of the row, including any row properties.
+        cell_starts: The opening of each cell, up to and including its
+            paragraph properties.
+        texts: The escaped text of each cell.
+
+    Returns:
+        The XML of the row.
+    """
+    cells = [
+        f'{start}<w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p></w:tc>'
+        if text
+        else f"{start}</w:p></w:tc>"
+        for start, text in zip(cell_starts, texts, strict=True)
+    ]
+    return f"{row_start}{''.join(cells)}</w:tr>"
+
+
+def _add_table(  # noqa: PLR0913
+    docx_doc: docx_document.Document,
+    container: docx_document.Document,
+    tbl: table.Table | table.DataTable,
+    *,
+    num_rows: int,
+    num_cols: int,
+    insert_index: int | None,
+) -> docx_table.Table:
+    """Adds an empty table and applies the table-level settings.
+
+    Args:
+        docx_doc: The python-docx Document.
+        container: The container to add to.
+        tbl: The declarative table.
+        num_rows: The number of rows to create.
+        num_cols: The number of columns to create.
+        insert_index: If provided, insert the table before this paragraph index
+            in docx_doc instead of appending.
+
+    Returns:
+        The python-docx table.
+    """
     docx_table = container.add_table(rows=num_rows, cols=num_cols)
 
     if insert_index is not None:
@@ -900,15 +1484,7 @@ def _pack_table(
     elif tbl.layout == "fixed" or tbl.column_widths is not None:
         # column_widths or layout="fixed" both imply fixed layout
         docx_table.autofit = False
-
-    for row_idx, row in enumerate(filtered_rows):
-        _pack_table_row(docx_doc, docx_table.rows[row_idx], row, default_comment_author)  # ty:ignore[invalid-argument-type] already awaited.
-
-    if tbl.layout != "autofit" and tbl.column_widths is not None:
-        _apply_column_widths(docx_table, tbl.column_widths, num_cols)
-
-    if tbl.borders:
-        _apply_table_borders(docx_table, tbl.borders)
+    return docx_table
 
 
 def _apply_table_borders(
@@ -6,12 +6,8 @@ from typing import Literal
 
 from cmi_docx.declarative import base, paragraph, table
 
-type BlockElement = paragraph.Paragraph | table.Table
-type BlockChildren = MutableSequence[
-    paragraph.Paragraph
-    | table.Table
-    | Coroutine[None, None, paragraph.Paragraph | table.Table]
-]
+type BlockElement = paragraph.Paragraph | table.Table | table.DataTable
+type BlockChildren = MutableSequence[BlockElement | Coroutine[None, None, BlockElement]]
 type HeaderFooterType = Literal["default", "first", "even"]
 
 
@@ -66,9 +66,9 @@ class TableCell(base.Component):
     """A table cell containing paragraphs or nested tables.
 
     Attributes:
-        children: List of Paragraph or Table components, or coroutines that
-            resolve to these types. May be a zero-argument callable for lazy
-            evaluation (useful with ``condition``).
+        children: List of Paragraph, Table or DataTable components, or
+            coroutines that resolve to these types. May be a zero-argument
+            callable for lazy evaluation (useful with ``condition``).
         grid_span: Number of columns this cell spans (horizontal merge).
             Defaults to None (no spanning).
         vmerge: Vertical merge role. ``"restart"`` marks the top cell of a
@@ -87,14 +87,16 @@ class TableCell(base.Component):
         MutableSequence[
             paragraph.Paragraph
             | Table
-            | Coroutine[None, None, paragraph.Paragraph | Table]
+            | DataTable
+            | Coroutine[None, None, paragraph.Paragraph | Table | DataTable]
         ]
         | Callable[
             [],
             MutableSequence[
                 paragraph.Paragraph
                 | Table
-                | Coroutine[None, None, paragraph.Paragraph | Table]
+                | DataTable
+                | Coroutine[None, None, paragraph.Paragraph | Table | DataTable]
             ],
         ]
         | None
@@ -148,3 +150,44 @@ class Table(base.Component):
     layout: Literal["autofit", "fixed"] | None = None
     style: str | None = None
     borders: MutableSequence[TableBorder] | None = None
+
+
+@dataclasses.dataclass
+class DataTable(base.Component):
+    """A table built column by column from a large data set.
+
+    Unlike `Table`, no component is created per row or cell. The columns are
+    formatted one at a time and the rows are written directly as table XML when
+    the document is packed, so memory and time grow with the data rather than
+    with the number of components.
+
+    Attributes:
+        columns: The values of each column: lists, NumPy arrays, or any other
+            sequence. All columns must have the same length.
+        formats: One entry per column: a format spec for `format`, e.g.
+            ``".2f"``, a callable that converts a value to text, or None to use
+            `str`. Defaults to None (`str` for every column).
+        header_rows: Rows of header texts, one text per column, placed above
+            the data.
+        repeat_header: If True, the header rows are repeated at the top of
+            each page the table spans.
+        missing: Text for None and NaN values.
+        alignments: One horizontal alignment per column (``"left"``,
+            ``"center"``, ``"right"`` or None), applied to the header and data
+            cells. Defaults to None (Word's default, which is left).
+        column_widths: List of column widths in twips (DXA), as for `Table`.
+        layout: Table layout type, as for `Table`.
+        style: Table style name.
+        borders: Cell border configuration.
+    """
+
+    columns: Sequence[Sequence[object]]
+    formats: Sequence[str | Callable[[object], str] | None] | None = None
+    header_rows: Sequence[Sequence[str]] | None = None
+    repeat_header: bool = False
+    missing: str = ""
+    alignments: Sequence[Literal["left", "center", "right"] | None] | None = None
+    column_widths: Sequence[int] | None = None
+    layout: Literal["autofit", "fixed"] | None = None
+    style: str | None = None
+    borders: MutableSequence[TableBorder] | None = None
@@ -1,51 +1,251 @@
 """Extends a python-docx Word document with additional functionality."""
 
+import dataclasses
 import pathlib
+import re
+from collections.abc import Callable, Iterator, Mapping
 
+from docx import blkcntnr as docx_blkcntnr
 from docx import document
+from docx.parts import story as docx_story
 from docx.text import paragraph as docx_paragraph
 
-from cmi_docx import paragraph, run, styles
+from cmi_docx import cache, index, matching, paragraph, run, session, styles
+
+
+@dataclasses.dataclass
+class PlaceholderLocation:
+    """Data class for the location of a placeholder in a document.
+
+    Attributes:
+        part: The story part containing the placeholder: the body, a header,
+            or a footer.
+        paragraph_index: The index of the paragraph among the paragraphs of the
+            part, including those in tables.
+        run_find: The location of the placeholder in the paragraph's runs.
+    """
+
+    part: docx_story.StoryPart
+    paragraph_index: int
+    run_find: run.FindRun
 
 
 class ExtendDocument:
     """Extends a python-docx Word document with additional functionality."""
 
-    def __init__(self, document: document.Document) -> None:
-        """Initializes a DocxSearch object for finding text."""
+    def __init__(self, document: document.Document, *, cached: bool = False) -> None:
+        """Initializes a DocxSearch object for finding text.
+
+        Args:
+            document: The document to extend.
+            cached: If True, the paragraphs of the document, their texts, and run
+                offsets are collected once and reused by all searches. Edits made
+                through this object, or the `FindRun` objects it returns,
+                invalidate only the edited paragraph; call `clear_cache` after
+                modifying the document by other means.
+        """
         self.document = document
+        self.cached = cached
+        self._paragraph_cache: cache.ParagraphCache | None = None
+
+    def clear_cache(self) -> None:
+        """Drops all cached paragraphs; they are collected again on next access."""
+        self._paragraph_cache = None
+
+    def iter_paragraphs(self) -> Iterator[docx_paragraph.Paragraph]:
+        """Iterates over all paragraphs including headers, footers, and tables.
+
+        Unlike `all_paragraphs`, paragraphs are produced one at a time, so
+        callers that stop early never visit the remainder of the document.
+
+        Yields:
+            The paragraphs of the document.
+        """
+        if self.cached:
+            yield from self.all_paragraphs
+        else:
+            yield from self._iter_paragraphs()
+
+    def iter_find_in_paragraphs(
+        self, needle: str, *, options: matching.MatchOptions | None = None
+    ) -> Iterator[paragraph.FindParagraph]:
+        """Iterates over the paragraphs that contain a text.
+
+        Args:
+            needle: The text to find.
+            options: The matching options, see
+                `ExtendParagraph.find_in_paragraph`.
+
+        Yields:
+            The indices of the text in each paragraph with at least one match.
+        """
+        for para in self.iter_paragraphs():
+            extend_paragraph = self._extend(para)
+            if options is not None:
+                result = extend_paragraph.find_in_paragraph(needle, options=options)
+                if result.character_indices:
+                    yield result
+            elif needle in extend_paragraph.text:
+                yield extend_paragraph.find_in_paragraph(needle)
+
+    def iter_find_in_runs(
+        self, needle: str, *, options: matching.MatchOptions | None = None
+    ) -> Iterator[run.FindRun]:
+        """Iterates over the locations of a text in the document's runs.
+
+        Replacing a result invalidates the later results in the same paragraph;
+        use `replace` for replacing all occurrences.
+
+        Args:
+            needle: The text to find.
+            options: The matching options, see
+                `ExtendParagraph.find_in_paragraph`.
+
+        Yields:
+            The locations of the text in the runs.
+        """
+        if len(needle) == 0:
+            return
+        for para in self.iter_paragraphs():
+            extend_paragraph = self._extend(para)
+            if options is not None:
+                yield from extend_paragraph.find_in_runs(needle, options=options)
+            elif needle in extend_paragraph.text:
+                yield from extend_paragraph.find_in_runs(needle)
+
+    def first_match(
+        self, needle: str, *, options: matching.MatchOptions | None = None
+    ) -> run.FindRun | None:
+        """Finds the first location of a text in the document's runs.
 
-    def find_in_paragraphs(self, needle: str) -> list[paragraph.FindParagraph]:
+        Args:
+            needle: The text to find.
+            options: The matching options, see
+                `ExtendParagraph.find_in_paragraph`.
+
+        Returns:
+            The location of the first occurrence, or None if the text is absent.
+        """
+        return next(self.iter_find_in_runs(needle, options=options), None)
+
+    def any_match(
+        self, needle: str, *, options: matching.MatchOptions | None = None
+    ) -> bool:
+        """Checks whether a text occurs anywhere in the document.
+
+        Args:
+            needle: The text to find.
+            options: The matching options, see
+                `ExtendParagraph.find_in_paragraph`.
+
+        Returns:
+            True if the text occurs in any paragraph, False otherwise. An
+            empty text never occurs.
+        """
+        if len(needle) == 0:
+            return False
+        if options is not None:
+            folded_needle = matching.fold_needle(needle, options)
+            return any(
+                folded_needle in self._extend(para).folded_text(options).text
+                for para in self.iter_paragraphs()
+            )
+        return any(needle in self._extend(para).text for para in self.iter_paragraphs())
+
+    def find_in_paragraphs(
+        self, needle: str, *, options: matching.MatchOptions | None = None
+    ) -> list[paragraph.FindParagraph]:
         """Finds the indices of a text relative to the paragraphs.
 
+        Contains one result per paragraph, including paragraphs without matches.
+        Use `iter_find_in_paragraphs` to skip those.
+
         Args:
             needle: The text to find.
+            options: The matching options, see
+                `ExtendParagraph.find_in_paragraph`.
 
         Returns:
             The indices of the text in the document.
         """
         return [
-            paragraph.ExtendParagraph(para).find_in_paragraph(needle)
-            for para in self.all_paragraphs
+            self._extend(para).find_in_paragraph(needle, options=options)
+            for para in self.iter_paragraphs()
         ]
 
-    def find_in_runs(self, needle: str) -> list[run.FindRun]:
+    def build_index(self) -> index.DocumentIndex:
+        """Builds an inverted index of the words of every paragraph.
+
+        Each paragraph is tokenized once; later word and phrase queries only
+        visit the paragraphs that contain them. The index is not updated by
+        edits, build a new one after changing the document.
+
+        Returns:
+            The index.
+        """
+        paragraphs = list(self.iter_paragraphs())
+        return index.DocumentIndex(
+            paragraphs, (self._extend(para).text for para in paragraphs)
+        )
+
+    def find_in_runs(
+        self, needle: str, *, options: matching.MatchOptions | None = None
+    ) -> list[run.FindRun]:
         """Finds the indices of a text relative to the document's runs.
 
         Args:
             needle: The text to find.
+            options: The matching options, see
+                `ExtendParagraph.find_in_paragraph`.
 
         Returns:
             The locations of the text in the runs.
         """
-        return [
-            finder
-            for para in self.all_paragraphs
-            for finder in paragraph.ExtendParagraph(para).find_in_runs(needle)
-        ]
+        return list(self.iter_find_in_runs(needle, options=options))
+
+    def find_results(
+        self, needle: str, *, options: matching.MatchOptions | None = None
+    ) -> run.FindResults:
+        """Finds a text in the document's runs, storing the results compactly.
+
+        Unlike `find_in_runs`, no `FindRun` object is created per match, which
+        matters when a search has millions of matches.
+
+        Args:
+            needle: The text to find.
+            options: The matching options, see
+                `ExtendParagraph.find_in_paragraph`.
+
+        Returns:
+            The locations of the text in the runs.
+        """
+        results = run.FindResults()
+        if len(needle) == 0:
+            return results
+        for find_paragraph in self.iter_find_in_paragraphs(needle, options=options):
+            extend_paragraph = self._extend(find_paragraph.paragraph)
+            for (
+                start_run,
+                end_run,
+                start_index,
+                end_index,
+            ) in extend_paragraph.locate_spans(find_paragraph.character_indices):
+                results.append(
+                    find_paragraph.paragraph,
+                    (start_run, end_run),
+                    (start_index, end_index),
+                )
+        # The cache of a cached document is only built by the search above.
+        results.paragraph_cache = self._paragraph_cache
+        return results
 
     def replace(
-        self, needle: str, replace: str, style: styles.RunStyle | None = None
+        self,
+        needle: str,
+        replace: str,
+        style: styles.RunStyle | None = None,
+        *,
+        options: matching.MatchOptions | None = None,
     ) -> None:
         """Finds and replaces text in a Word document.
 
@@ -53,15 +253,154 @@ class ExtendDocument:
             needle: The text to find.
             replace: The text to replace.
             style: The style to apply to the replacement text.
+            options: The matching options, see
+                `ExtendParagraph.find_in_paragraph`. All variants of the needle
+                are replaced in a single pass.
+
+        """
+        self.find_results(needle, options=options).replace(replace, style)
+
+    def replace_many(
+        self, replacements: Mapping[str, str], style: styles.RunStyle | None = None
+    ) -> None:
+        """Finds and replaces multiple texts in a single pass over the document.
+
+        All needles are combined into one pattern, so every paragraph is read
+        only once regardless of the number of needles. When needles overlap,
+        the longest one wins. Replacement texts are not searched again, i.e.
+        a replacement that contains another needle is inserted verbatim.
 
+        Args:
+            replacements: Mapping of needles to their replacement texts.
+            style: The style to apply to the replacement texts.
         """
-        run_finder = self.find_in_runs(needle)
-        run_finder.sort(
-            key=lambda x: (x.run_indices[0], x.character_indices[0]), reverse=True
+        needles = sorted(
+            (needle for needle in replacements if needle), key=len, reverse=True
         )
+        if not needles:
+            return
+        self.replace_regex(
+            "|".join(re.escape(needle) for needle in needles),
+            lambda match: replacements[match.group()],
+            style,
+        )
+
+    def replace_regex(
+        self,
+        pattern: str | re.Pattern[str],
+        repl: str | Callable[[re.Match[str]], str | tuple[str, styles.RunStyle | None]],
+        style: styles.RunStyle | None = None,
+    ) -> None:
+        """Finds and replaces all matches of a regular expression.
+
+        The pattern is compiled once and matched against the text of every
+        paragraph, so matches may span multiple runs. Empty matches are ignored.
+
+        Args:
+            pattern: The regular expression to find.
+            repl: The replacement. A string may contain group references as in
+                `re.sub`. A callable receives the match and returns either the
+                replacement text, or a tuple of the replacement text and its
+                style. A style of None keeps the formatting of the matched text.
+            style: The style to apply to replacement texts that do not come
+                with their own style.
+        """
+        compiled = re.compile(pattern)
+
+        for para in self.iter_paragraphs():
+            extend_paragraph = self._extend(para)
+            matches = [
+                match
+                for match in compiled.finditer(extend_paragraph.text)
+                if match.end() > match.start()
+            ]
+            if not matches:
+                continue
+
+            run_finder = extend_paragraph.spans_to_runs(
+                match.span() for match in matches
+            )
+            for match, run_find in zip(
+                reversed(matches), reversed(run_finder), strict=True
+            ):
+                replacement = repl(match) if callable(repl) else match.expand(repl)
+                if isinstance(replacement, tuple):
+                    run_find.replace(*replacement)
+                else:
+                    run_find.replace(replacement, style)
+
+    def scan_placeholders(
+        self, pattern: str | re.Pattern[str] = r"\{\{.*?\}\}"
+    ) -> dict[str, list[PlaceholderLocation]]:
+        """Finds every placeholder of a document in a single traversal.
+
+        Placeholders are matched against the text of each paragraph, so they
+        may span multiple runs. Empty matches are ignored. The run locations
+        of one paragraph are only valid until that paragraph is edited;
+        replace them in reverse order, as `replace` does.
 
-        for run_find in run_finder:
-            run_find.replace(replace, style)
+        Args:
+            pattern: The regular expression matching a placeholder.
+
+        Returns:
+            The locations of each distinct placeholder text, in document order.
+        """
+        compiled = re.compile(pattern)
+        placeholders: dict[str, list[PlaceholderLocation]] = {}
+        part = None
+        paragraph_index = 0
+        for para in self.iter_paragraphs():
+            if para.part is part:
+                paragraph_index += 1
+            else:
+                part, paragraph_index = para.part, 0
+
+            extend_paragraph = self._extend(para)
+            matches = [
+                match
+                for match in compiled.finditer(extend_paragraph.text)
+                if match.end() > match.start()
+            ]
+            if not matches:
+                continue
+
+            run_finder = extend_paragraph.spans_to_runs(
+                match.span() for match in matches
+            )
+            for match, run_find in zip(matches, run_finder, strict=True):
+                placeholders.setdefault(match.group(), []).append(
+                    PlaceholderLocation(part, paragraph_index, run_find)
+                )
+        return placeholders
+
+    def edit_session(self) -> session.EditSession:
+        """Starts a session that queues edits and applies them per paragraph.
+
+        Use as a context manager; the queued edits are applied when the `with`
+        block exits without an exception:
+
+            with ExtendDocument(document).edit_session() as edits:
+                edits.replace("{{OPTIONAL}}", "")
+                edits.replace_many({"{{NAME}}": "Jane", "{{AGE}}": "42"})
+
+        Returns:
+            The edit session.
+        """
+        return session.EditSession(self.iter_paragraphs())
+
+    def normalize_runs(self) -> int:
+        """Merges adjacent runs with identical formatting in every paragraph.
+
+        Templates authored in Word often split placeholders across many runs.
+        Normalizing a template once makes every later search and edit cheaper;
+        see `ExtendParagraph.normalize_runs` for which runs are merged.
+
+        Returns:
+            The number of removed runs.
+        """
+        return sum(
+            self._extend(para).normalize_runs() for para in self.iter_paragraphs()
+        )
 
     def insert_paragraph_by_text(
         self,
@@ -125,29 +464,59 @@ class ExtendDocument:
     @property
     def all_paragraphs(self) -> list[docx_paragraph.Paragraph]:
         """Returns all paragraphs including headers, footers, and tables."""
-        all_paragraphs = list(self.document.paragraphs)
-
-        for section in self.document.sections:
-            all_paragraphs.extend(
-                (*section.footer.paragraphs, *section.header.paragraphs)
-            )
-
-        all_paragraphs.extend(self._get_table_paragraphs(self.document.tables))
+        if not self.cached:
+            return list(self._iter_paragraphs())
+        if self._paragraph_cache is None:
+            self._paragraph_cache = cache.ParagraphCache(self._iter_paragraphs())
+        return list(self._paragraph_cache.paragraphs)
+
+    def _extend(self, para: docx_paragraph.Paragraph) -> paragraph.ExtendParagraph:
+        """Extends a paragraph of this document, sharing the document's cache."""
+        return paragraph.ExtendParagraph(para, self._paragraph_cache)
+
+    def _iter_paragraphs(self) -> Iterator[docx_paragraph.Paragraph]:
+        """Iterates over all paragraphs including headers, footers, and tables.
+
+        Each story part (the body and every header and footer) is walked once,
+        in document order. Headers and footers that are linked to the previous
+        section are skipped, as they reuse an already visited part.
+        """
+        yield from self._iter_story_paragraphs(self.document._body)  # noqa: SLF001
 
+        visited_parts = set()
         for section in self.document.sections:
-            all_paragraphs.extend(self._get_table_paragraphs(section.header.tables))
-            all_paragraphs.extend(self._get_table_paragraphs(section.footer.tables))
+            for story in (
+                section.header,
+                section.first_page_header,
+                section.even_page_header,
+                section.footer,
+                section.first_page_footer,
+                section.even_page_footer,
+            ):
+                if story.is_linked_to_previous or story.part in visited_parts:
+                    continue
+                visited_parts.add(story.part)
+                yield from self._iter_story_paragraphs(story)
+
+    @staticmethod
+    def _iter_story_paragraphs(
+        story: docx_blkcntnr.BlockItemContainer,
+    ) -> Iterator[docx_paragraph.Paragraph]:
+        """Iterates over the paragraphs of a story, including nested tables.
+
+        Paragraphs nested inside other paragraphs, e.g. in text boxes, are not
+        included.
 
-        return all_paragraphs
+        Args:
+            story: The body, header, or footer to walk.
 
-    def _get_table_paragraphs(self, tables: list) -> list[docx_paragraph.Paragraph]:
-        """Extract all paragraphs from a list of tables."""
-        paragraphs = []
-        for table in tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    paragraphs.extend(cell.paragraphs)
-        return paragraphs
+        Yields:
+            Every paragraph of the story exactly once, in document order.
+        """
+        for paragraph_element in story._element.xpath(  # noqa: SLF001
+            ".//w:p[not(ancestor::w:p)]"
+        ):
+            yield docx_paragraph.Paragraph(paragraph_element, story)
 
     def _insert_empty_paragraph(
         self, index: int, style: str | None = None
@@ -164,6 +533,7 @@ class ExtendDocument:
         Raises:
             IndexError: If the index is out of range.
         """
+        self.clear_cache()
         n_paragraphs = len(self.document.paragraphs)
         if index > n_paragraphs:
             msg = f"Index {index} is out of range."
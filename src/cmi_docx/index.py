@@ -0,0 +1,156 @@
+"""Inverted index over the words of a document's paragraphs."""
+
+import array
+import bisect
+import re
+from collections.abc import Iterable, Iterator
+
+from docx.text import paragraph as docx_paragraph
+
+from cmi_docx import paragraph
+
+_TERM = re.compile(r"\w+")
+
+
+class DocumentIndex:
+    """Inverted index mapping each word to the places it occurs.
+
+    Paragraph texts are tokenized into words once. For every word, the index
+    keeps a single integer array of (paragraph index, offset) pairs, so a
+    query only visits the paragraphs that contain its rarest word instead of
+    scanning the whole document.
+
+    Queries match whole words: a match must not start or end in the middle of
+    a word. Queries of several words, e.g. "blood pressure", are looked up
+    by their rarest word and verified against the indexed text.
+
+    The index reflects the paragraphs as they were when it was built; build
+    a new index after editing the document.
+    """
+
+    def __init__(
+        self,
+        paragraphs: Iterable[docx_paragraph.Paragraph],
+        texts: Iterable[str] | None = None,
+    ) -> None:
+        """Initializes a DocumentIndex.
+
+        Args:
+            paragraphs: The paragraphs to index.
+            texts: The texts of the paragraphs, if already known.
+        """
+        self.paragraphs = list(paragraphs)
+        self._texts = (
+            [para.text for para in self.paragraphs] if texts is None else list(texts)
+        )
+        self._postings: dict[str, array.array[int]] = {}
+        for paragraph_index, text in enumerate(self._texts):
+            for match in _TERM.finditer(text):
+                postings = self._postings.get(match.group())
+                if postings is None:
+                    postings = self._postings[match.group()] = array.array("q")
+                postings.append(paragraph_index)
+                postings.append(match.start())
+        self._terms = sorted(self._postings)
+
+    def __len__(self) -> int:
+        """Returns the number of distinct words in the index."""
+        return len(self._terms)
+
+    def count(self, term: str) -> int:
+        """Counts the occurrences of a word.
+
+        Args:
+            term: The word to count.
+
+        Returns:
+            The number of occurrences.
+        """
+        return len(self._postings.get(term, ())) // 2
+
+    def find(self, query: str) -> list[paragraph.FindParagraph]:
+        """Finds a word or phrase.
+
+        Args:
+            query: The text to find. Queries without any word characters are
+                matched by scanning the indexed texts.
+
+        Returns:
+            The matching character indices in each paragraph with at least one
+            match, in document order.
+        """
+        if not query:
+            return []
+        terms = [(match.group(), match.start()) for match in _TERM.finditer(query)]
+        if not terms:
+            return self._group(
+                (paragraph_index, match.start(), match.end())
+                for paragraph_index, text in enumerate(self._texts)
+                for match in re.finditer(re.escape(query), text)
+            )
+
+        term, term_offset = min(terms, key=lambda term: self.count(term[0]))
+        simple = len(terms) == 1 and term == query
+        return self._group(
+            (paragraph_index, start, start + len(query))
+            for paragraph_index, offset in self._iter_postings(term)
+            if (start := offset - term_offset) >= 0
+            and (simple or self._matches(paragraph_index, start, query))
+        )
+
+    def find_prefix(self, prefix: str) -> list[paragraph.FindParagraph]:
+        """Finds the words starting with a prefix.
+
+        Args:
+            prefix: The start of the words to find.
+
+        Returns:
+            The character indices of the matching words in each paragraph with
+            at least one match, in document order.
+        """
+        first = bisect.bisect_left(self._terms, prefix)
+        last = first
+        while last < len(self._terms) and self._terms[last].startswith(prefix):
+            last += 1
+        return self._group(
+            sorted(
+                (paragraph_index, offset, offset + len(term))
+                for term in self._terms[first:last]
+                for paragraph_index, offset in self._iter_postings(term)
+            )
+        )
+
+    def _iter_postings(self, term: str) -> Iterator[tuple[int, int]]:
+        """Iterates over the (paragraph index, offset) pairs of a word."""
+        postings = self._postings.get(term, array.array("q"))
+        return zip(postings[::2], postings[1::2], strict=True)
+
+    def _matches(self, paragraph_index: int, start: int, query: str) -> bool:
+        """Checks that a query occurs as whole words at an offset."""
+        text = self._texts[paragraph_index]
+        end = start + len(query)
+        return (
+            text.startswith(query, start)
+            and not (start > 0 and _is_word(text[start - 1]) and _is_word(query[0]))
+            and not (end < len(text) and _is_word(text[end]) and _is_word(query[-1]))
+        )
+
+    def _group(
+        self, matches: Iterable[tuple[int, int, int]]
+    ) -> list[paragraph.FindParagraph]:
+        """Groups sorted (paragraph index, start, end) matches by paragraph."""
+        results: list[paragraph.FindParagraph] = []
+        previous_index = -1
+        for paragraph_index, start, end in matches:
+            if paragraph_index != previous_index:
+                results.append(
+                    paragraph.FindParagraph(self.paragraphs[paragraph_index], [])
+                )
+                previous_index = paragraph_index
+            results[-1].character_indices.append((start, end))
+        return results
+
+
+def _is_word(character: str) -> bool:
+    """Checks whether a character is part of a word."""
+    return _TERM.match(character) is not None
@@ -0,0 +1,168 @@
+"""Folds texts for case-insensitive and Unicode-normalized matching."""
+
+import dataclasses
+import re
+import unicodedata
+from collections.abc import Iterator
+
+# Typographic quotes that NFKC normalization leaves untouched.
+_QUOTES = str.maketrans(
+    dict.fromkeys("\u2018\u2019\u201a\u201b\u2032", "'")
+    | dict.fromkeys("\u201c\u201d\u201e\u201f\u2033", '"')
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class MatchOptions:
+    """Dataclass for text matching options.
+
+    Attributes:
+        casefold: If True, matching ignores case, see `str.casefold`.
+        normalize: If True, texts are NFKC-normalized and typographic quotes
+            are replaced by straight quotes, so that e.g. a non-breaking space
+            matches a space and a curly apostrophe matches a straight one.
+        whitespace: If True, any run of whitespace matches any other run of
+            whitespace.
+    """
+
+    casefold: bool = False
+    normalize: bool = False
+    whitespace: bool = False
+
+
+@dataclasses.dataclass
+class FoldedText:
+    """A folded text and the original span of each of its characters.
+
+    Attributes:
+        text: The folded text.
+        starts: The original offset at which each folded character starts.
+        ends: The original offset at which each folded character ends.
+    """
+
+    text: str
+    starts: list[int]
+    ends: list[int]
+
+    def find(self, needle: str) -> list[tuple[int, int]]:
+        """Finds a folded needle and maps its matches to the original text.
+
+        Matches that start or end within the folded characters of a cluster,
+        such as "s" within the "ss" casefolded from a sharp s, are skipped, as
+        they match only part of an original character.
+
+        Args:
+            needle: The needle, folded with the same options as the text.
+
+        Returns:
+            The (start, end) indices of each match in the original text.
+        """
+        if not needle:
+            return []
+        return [
+            (self.starts[match.start()], self.ends[match.end() - 1])
+            for match in re.finditer(re.escape(needle), self.text)
+            if self._is_boundary(match.start()) and self._is_boundary(match.end())
+        ]
+
+    def _is_boundary(self, index: int) -> bool:
+        """Checks whether a folded offset lies between two clusters.
+
+        Args:
+            index: The offset in the folded text.
+
+        Returns:
+            True if the characters before and after the offset come from
+            different original characters.
+        """
+        return (
+            index in {0, len(self.starts)}
+            or self.starts[index - 1] != self.starts[index]
+        )
+
+
+def fold(text: str, options: MatchOptions) -> FoldedText:
+    """Folds a text, recording where each folded character came from.
+
+    Characters are folded a cluster at a time, a cluster being a base
+    character and the combining marks that follow it, so that decomposed and
+    precomposed forms of the same character fold alike. All folded characters
+    of a cluster map to the cluster's span in the original text.
+
+    Args:
+        text: The text to fold.
+        options: The matching options.
+
+    Returns:
+        The folded text.
+    """
+    pieces: list[str] = []
+    starts: list[int] = []
+    ends: list[int] = []
+    in_whitespace = False
+    for start, end in _clusters(text):
+        if options.whitespace and text[start].isspace():
+            if in_whitespace:
+                ends[-1] = end
+            else:
+                pieces.append(" ")
+                starts.append(start)
+                ends.append(end)
+            in_whitespace = True
+            continue
+        in_whitespace = False
+
+        folded = _fold_cluster(text[start:end], options)
+        pieces.append(folded)
+        starts.extend([start] * len(folded))
+        ends.extend([end] * len(folded))
+    return FoldedText("".join(pieces), starts, ends)
+
+
+def fold_needle(needle: str, options: MatchOptions) -> str:
+    """Folds a needle with the same options as the texts it is matched against.
+
+    Args:
+        needle: The needle to fold.
+        options: The matching options.
+
+    Returns:
+        The folded needle.
+    """
+    return fold(needle, options).text
+
+
+def _clusters(text: str) -> Iterator[tuple[int, int]]:
+    """Splits a text into base characters with their combining marks.
+
+    Args:
+        text: The text to split.
+
+    Yields:
+        The (start, end) offsets of each cluster.
+    """
+    start = 0
+    for offset in range(1, len(text) + 1):
+        if offset == len(text) or not unicodedata.combining(text[offset]):
+            yield start, offset
+            start = offset
+
+
+def _fold_cluster(cluster: str, options: MatchOptions) -> str:
+    """Folds a base character and its combining marks.
+
+    Args:
+        cluster: The characters to fold.
+        options: The matching options.
+
+    Returns:
+        The folded characters, which may be longer or shorter than the
+        cluster.
+    """
+    if options.normalize:
+        cluster = unicodedata.normalize("NFKC", cluster).translate(_QUOTES)
+    if options.casefold:
+        cluster = cluster.casefold()
+        if options.normalize:
+            cluster = unicodedata.normalize("NFKC", cluster)
+    return cluster
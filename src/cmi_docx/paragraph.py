@@ -1,17 +1,41 @@
 """Module for extending python-docx Paragraph objects."""
 
 import bisect
+import copy
 import dataclasses
+import functools
 import itertools
 import re
+from collections.abc import Iterable, Iterator
 
+from docx import oxml
+from docx.enum import text as docx_text
+from docx.oxml import ns
 from docx.text import paragraph as docx_paragraph
 from docx.text import run as docx_run
+from lxml import (
+    etree,  # ty:ignore[unresolved-import] # This does work; not sure why not detected.
+)
 
-from cmi_docx import comment, run, styles
+from cmi_docx import cache, comment, matching, run, styles
 
+type Edit = tuple[int, int, str] | tuple[int, int, str, styles.RunStyle | None]
 
-@dataclasses.dataclass
+_RUN_TAG = ns.qn("w:r")
+_RUN_PROPERTIES_TAG = ns.qn("w:rPr")
+_TEXT_TAG = ns.qn("w:t")
+_PROOF_ERROR_TAG = ns.qn("w:proofErr")
+# The paragraph property elements set by `format_paragraphs`, by tag.
+_PARAGRAPH_PROPERTY_NAMES = {ns.qn(f"w:{name}"): name for name in ("spacing", "jc")}
+_XML_SPACE = f"{{{ns.nsmap['xml']}}}space"
+# Run content that can be moved into a neighbouring run without changing it.
+_MERGEABLE_CONTENT_TAGS = frozenset(
+    ns.qn(tag)
+    for tag in ("w:t", "w:tab", "w:br", "w:cr", "w:noBreakHyphen", "w:softHyphen")
+)
+
+
+@dataclasses.dataclass(slots=True)
 class FindParagraph:
     """Data class for maintaining find results in paragraphs.
 
@@ -28,26 +52,83 @@ class FindParagraph:
 class ExtendParagraph:
     """Extends a python-docx Word paragraph with additional functionality."""
 
-    def __init__(self, paragraph: docx_paragraph.Paragraph) -> None:
+    def __init__(
+        self,
+        paragraph: docx_paragraph.Paragraph,
+        paragraph_cache: cache.ParagraphCache | None = None,
+    ) -> None:
         """Initializes an ExtendParagraph object.
 
         Args:
             paragraph: The paragraph to extend.
+            paragraph_cache: If provided, the paragraph's text and run offsets are
+                read from this cache instead of the document. Edits made through
+                this object, or the `FindRun` objects it returns, drop the
+                paragraph's entry from the cache.
         """
         self.paragraph = paragraph
+        self.paragraph_cache = paragraph_cache
+
+    @property
+    def text(self) -> str:
+        """Returns the text of the paragraph."""
+        if self.paragraph_cache is None:
+            return self.paragraph.text
+        return self.paragraph_cache.entry(self.paragraph).text
+
+    @property
+    def cumulative_run_lengths(self) -> list[int]:
+        """Returns the cumulative text lengths of the paragraph's runs."""
+        if self.paragraph_cache is None:
+            return list(
+                itertools.accumulate(len(run.text) for run in self.paragraph.runs)
+            )
+        return self.paragraph_cache.entry(self.paragraph).cumulative_run_lengths
+
+    def folded_text(self, options: matching.MatchOptions) -> matching.FoldedText:
+        """Returns the folded text of the paragraph.
+
+        With a paragraph cache, the folded text is computed once per set of
+        options and reused until the paragraph is edited.
 
-    def find_in_paragraph(self, needle: str) -> FindParagraph:
+        Args:
+            options: The matching options.
+
+        Returns:
+            The folded text and its map to the paragraph's text.
+        """
+        if self.paragraph_cache is None:
+            return matching.fold(self.text, options)
+        entry = self.paragraph_cache.entry(self.paragraph)
+        if options not in entry.folded_texts:
+            entry.folded_texts[options] = matching.fold(entry.text, options)
+        return entry.folded_texts[options]
+
+    def find_in_paragraph(
+        self, needle: str, *, options: matching.MatchOptions | None = None
+    ) -> FindParagraph:
         """Finds the indices of a text relative to the paragraph.
 
         Args:
             needle: The text to find.
+            options: The matching options. Matches are found in the folded
+                text and their indices refer to the original text, so one
+                search covers all variants of the needle.
 
         Returns:
             The indices of the text in the paragraph.
         """
+        if options is not None and options != matching.MatchOptions():
+            return FindParagraph(
+                paragraph=self.paragraph,
+                character_indices=self.folded_text(options).find(
+                    matching.fold_needle(needle, options)
+                ),
+            )
+
         within_paragraph_indices = [
             (match.start(), match.end())
-            for match in re.finditer(re.escape(needle), self.paragraph.text)
+            for match in re.finditer(re.escape(needle), self.text)
         ]
 
         return FindParagraph(
@@ -55,11 +136,14 @@ class ExtendParagraph:
             character_indices=within_paragraph_indices,
         )
 
-    def find_in_runs(self, needle: str) -> list[run.FindRun]:
+    def find_in_runs(
+        self, needle: str, *, options: matching.MatchOptions | None = None
+    ) -> list[run.FindRun]:
         """Finds the indices of a text relative to the paragraph's runs.
 
         Args:
             needle: The text to find.
+            options: The matching options, see `find_in_paragraph`.
 
         Returns:
             The indices of the text in the paragraph.
@@ -67,17 +151,57 @@ class ExtendParagraph:
         if len(needle) == 0:
             return []
 
-        run_finds: list[run.FindRun] = []
-        run_lengths = [len(run.text) for run in self.paragraph.runs]
-        cumulative_run_lengths = list(itertools.accumulate(run_lengths))
+        return self.spans_to_runs(
+            self.find_in_paragraph(needle, options=options).character_indices
+        )
+
+    def spans_to_runs(self, spans: Iterable[tuple[int, int]]) -> list[run.FindRun]:
+        """Converts character spans of the paragraph's text to run locations.
+
+        Args:
+            spans: The (start, end) character indices relative to the paragraph
+                text, as returned by `find_in_paragraph`.
+
+        Returns:
+            The locations of the spans in the paragraph's runs.
+        """
+        paragraph_runs = run.ParagraphRuns(self.paragraph)
+        return [
+            run.FindRun(
+                paragraph=self.paragraph,
+                run_indices=(start_run, end_run),
+                character_indices=(start_index, end_index),
+                paragraph_runs=paragraph_runs,
+                paragraph_cache=self.paragraph_cache,
+            )
+            for start_run, end_run, start_index, end_index in self.locate_spans(spans)
+        ]
+
+    def locate_spans(
+        self, spans: Iterable[tuple[int, int]]
+    ) -> Iterator[tuple[int, int, int, int]]:
+        """Converts character spans of the paragraph's text to run offsets.
+
+        Unlike `spans_to_runs`, no `FindRun` objects are created.
+
+        Args:
+            spans: The (start, end) character indices relative to the paragraph
+                text, as returned by `find_in_paragraph`.
+
+        Yields:
+            The start run, end run, start character within the start run, and
+            end character within the end run of each span.
+        """
+        cumulative_run_lengths = self.cumulative_run_lengths
 
-        for occurrence in self.find_in_paragraph(needle).character_indices:
+        for occurrence in spans:
             start_run = bisect.bisect_right(cumulative_run_lengths, occurrence[0])
             end_run = bisect.bisect_right(
-                cumulative_run_lengths[:-1],
+                cumulative_run_lengths,
                 occurrence[1]
                 - 1,  # -1 as the range does not include the last character
                 lo=start_run,
+                hi=len(cumulative_run_lengths) - 1,
             )
 
             start_index = (
@@ -90,18 +214,15 @@ class ExtendParagraph:
                 if end_run > 0
                 else occurrence[1]
             )
-
-            run_finds.append(
-                run.FindRun(
-                    paragraph=self.paragraph,
-                    run_indices=(start_run, end_run),
-                    character_indices=(start_index, end_index),
-                )
-            )
-        return run_finds
+            yield start_run, end_run, start_index, end_index
 
     def replace(
-        self, needle: str, replace: str, style: styles.RunStyle | None = None
+        self,
+        needle: str,
+        replace: str,
+        style: styles.RunStyle | None = None,
+        *,
+        options: matching.MatchOptions | None = None,
     ) -> None:
         """Finds and replaces text in a Word paragraph.
 
@@ -109,8 +230,9 @@ class ExtendParagraph:
             needle: The text to find.
             replace: The text to replace.
             style: The style to apply to the replacement text.
+            options: The matching options, see `find_in_paragraph`.
         """
-        run_finder = self.find_in_runs(needle)
+        run_finder = self.find_in_runs(needle, options=options)
         run_finder.sort(
             key=lambda x: (x.run_indices[0], x.character_indices[0]), reverse=True
         )
@@ -130,26 +252,149 @@ class ExtendParagraph:
             style: The style to apply to the replacement text. If None, matches
                 the style of the first run in the replacement window.
         """
+        self.apply_edits([(start, end, replace, style)])
+
+    def apply_edits(self, edits: Iterable[Edit]) -> None:
+        """Replaces multiple spans of text, preserving comments.
+
+        Comments are extracted and restored once for all edits, and all edits
+        share a single table of run offsets. The indices of every edit refer to
+        the text before any edit is applied.
+
+        Args:
+            edits: The edits as (start, end, text) or (start, end, text, style)
+                tuples. As in `replace_between`, a style of None matches the
+                style of the first run in the replacement window.
+
+        Raises:
+            ValueError: If two edits overlap.
+        """
+        sorted_edits = sorted(
+            (
+                (edit[0], edit[1], edit[2], edit[3] if len(edit) > 3 else None)  # noqa: PLR2004
+                for edit in edits
+            ),
+            key=lambda edit: (edit[0], edit[1]),
+        )
+        if not sorted_edits:
+            return
+        for previous, current in itertools.pairwise(sorted_edits):
+            if previous[1] > current[0]:
+                msg = f"Edits {previous[:2]} and {current[:2]} overlap."
+                raise ValueError(msg)
+
         comment_preserver = comment.CommentPreserver(self.paragraph._element)  # noqa: SLF001
         comments = comment_preserver.extract_comments()
         comment_preserver.strip_comments()
 
+        paragraph_runs = run.ParagraphRuns(self.paragraph)
         cumulative_run_lengths = list(
             itertools.accumulate(
-                (len(run.text) for run in self.paragraph.runs), initial=0
+                (len(paragraph_run.text) for paragraph_run in paragraph_runs),
+                initial=0,
             )
         )
-        start_run_index = bisect.bisect_right(cumulative_run_lengths, start) - 1
+        # Editing right to left leaves the offsets of all earlier runs intact.
+        for edit in reversed(sorted_edits):
+            self._replace_span(paragraph_runs, cumulative_run_lengths, edit)
+            start, end, replace, _ = edit
+            comments = comment_preserver.adjust_range_positions(
+                comments, start, end, len(replace)
+            )
+
+        comment_preserver.restore_comments(comments)
+        self._invalidate()
+
+    def insert_run(self, index: int, text: str, style: styles.RunStyle) -> docx_run.Run:
+        """Inserts a run into a paragraph.
+
+        Args:
+            index: The index to insert the run at.
+            text: The text of the run.
+            style: The style of the run, see run.ExtendRun.format for more details.
+
+        Returns:
+            The inserted run.
+        """
+        new_run = run.ParagraphRuns(self.paragraph).insert(index, text)
+        run.ExtendRun(new_run).format(style)
+        self._invalidate()
+        return new_run
+
+    def normalize_runs(self) -> int:
+        """Merges adjacent runs with identical formatting and drops empty runs.
+
+        Runs are only merged if no other element sits between them, so comment
+        ranges, bookmarks, fields, and hyperlinks keep their boundaries. Runs
+        inside hyperlinks are merged with each other. Spell-check markers
+        (`w:proofErr`) are removed first, as Word recreates them on opening the
+        document. Runs holding anything but text, tabs, and breaks, e.g.
+        images or comment references, are left as they are. Revision IDs on
+        runs are ignored when comparing their formatting.
+
+        Returns:
+            The number of removed runs.
+        """
+        paragraph_element = self.paragraph._p  # noqa: SLF001
+        removed = 0
+        for container in [paragraph_element, *paragraph_element.xpath("./w:hyperlink")]:
+            removed += _normalize_container(container)
+        if removed:
+            self._invalidate()
+        return removed
+
+    def format(
+        self,
+        style: styles.ParagraphStyle,
+    ) -> None:
+        """Formats a paragraph in a Word document.
+
+        Args:
+            style: The style to apply to the paragraph.
+        """
+        format_paragraphs([self.paragraph], style)
+
+    def _invalidate(self) -> None:
+        """Drops the paragraph's entry from the paragraph cache, if any."""
+        if self.paragraph_cache is not None:
+            self.paragraph_cache.invalidate(self.paragraph)
+
+    @staticmethod
+    def _replace_span(
+        paragraph_runs: run.ParagraphRuns,
+        cumulative_run_lengths: list[int],
+        edit: tuple[int, int, str, styles.RunStyle | None],
+    ) -> None:
+        """Replaces text between indices without touching comments.
+
+        Args:
+            paragraph_runs: The runs of the paragraph.
+            cumulative_run_lengths: The text offset at which each run starts,
+                followed by the length of the text. Must be valid for all runs
+                up to the run containing the end of the edit.
+            edit: The (start, end, text, style) of the edit, see
+                `replace_between`.
+        """
+        start, end, replace, style = edit
+        if not paragraph_runs:
+            new_run = paragraph_runs.insert(0, replace)
+            if style is not None:
+                run.ExtendRun(new_run).format(style)
+            return
+        start_run_index = min(
+            bisect.bisect_right(cumulative_run_lengths, start) - 1,
+            len(paragraph_runs) - 1,
+        )
         end_run_index = min(
             bisect.bisect_right(cumulative_run_lengths, end) - 1,
-            len(self.paragraph.runs) - 1,
+            len(paragraph_runs) - 1,
         )
 
         for index in range(start_run_index + 1, end_run_index):
-            self.paragraph.runs[index].text = ""
+            paragraph_runs[index].text = ""
 
-        start_run = self.paragraph.runs[start_run_index]
-        end_run = self.paragraph.runs[end_run_index]
+        start_run = paragraph_runs[start_run_index]
+        end_run = paragraph_runs[end_run_index]
 
         if end_run_index != start_run_index:
             remainder = end - cumulative_run_lengths[end_run_index]
@@ -161,70 +406,199 @@ class ExtendParagraph:
         start_run.text = start_run.text[
             : start - cumulative_run_lengths[start_run_index]
         ]
+        replace_run = paragraph_runs.insert(start_run_index + 1, replace)
         if style is None:
-            style = run.ExtendRun(start_run).get_format()
-        self.insert_run(start_run_index + 1, replace, style)
+            _copy_run_properties(start_run, replace_run)
+        else:
+            run.ExtendRun(replace_run).format(style)
         if after_text:
-            self.insert_run(
-                start_run_index + 2, after_text, run.ExtendRun(start_run).get_format()
+            _copy_run_properties(
+                start_run, paragraph_runs.insert(start_run_index + 2, after_text)
             )
 
-        adjusted_comments = comment_preserver.adjust_range_positions(
-            comments, start, end, len(replace)
-        )
-        comment_preserver.restore_comments(adjusted_comments)
 
-    def insert_run(self, index: int, text: str, style: styles.RunStyle) -> docx_run.Run:
-        """Inserts a run into a paragraph.
+def format_paragraphs(
+    paragraphs: Iterable[docx_paragraph.Paragraph], style: styles.ParagraphStyle
+) -> None:
+    """Formats many paragraphs, see `ExtendParagraph.format`.
 
-        Args:
-            index: The index to insert the run at.
-            text: The text of the run.
-            style: The style of the run, see run.ExtendRun.format for more details.
+    The paragraph and run properties of the style are built once and copied
+    onto the `w:pPr` and `w:r` elements of every paragraph.
 
-        Returns:
-            The inserted run.
-        """
-        if index == len(self.paragraph.runs):
-            self.paragraph.add_run(text)
+    Args:
+        paragraphs: The paragraphs to format.
+        style: The style to apply to the paragraphs.
+    """
+    paragraph_properties = _paragraph_properties(
+        (style.line_spacing, style.alignment, style.space_before, style.space_after)
+    )
+    run_style = styles.RunStyle(
+        bold=style.bold,
+        italic=style.italic,
+        font_size=style.font_size,
+        font_rgb=style.font_rgb,
+    )
+    paragraph_elements = [para._p for para in paragraphs]  # noqa: SLF001
+    if len(paragraph_properties):
+        for paragraph_element in paragraph_elements:
+            _stamp_paragraph_properties(paragraph_element, paragraph_properties)
+    run.format_run_elements(
+        itertools.chain.from_iterable(
+            paragraph_element.r_lst for paragraph_element in paragraph_elements
+        ),
+        run_style,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _paragraph_properties(
+    key: tuple[
+        float | None, docx_text.WD_PARAGRAPH_ALIGNMENT | None, int | None, int | None
+    ],
+) -> etree._Element:
+    """Builds the paragraph properties of a style once.
+
+    The returned element is shared between calls and must not be modified.
+
+    Args:
+        key: The line spacing, alignment, space before, and space after.
+
+    Returns:
+        The `w:pPr` element holding the properties set by the style.
+    """
+    line_spacing, alignment, space_before, space_after = key
+    scratch = docx_paragraph.Paragraph(oxml.OxmlElement("w:p"), None)  # ty:ignore[invalid-argument-type]
+    if line_spacing is not None:
+        scratch.paragraph_format.line_spacing = line_spacing
+    if alignment is not None:
+        scratch.alignment = alignment
+    if space_before is not None:
+        scratch.paragraph_format.space_before = space_before
+    if space_after is not None:
+        scratch.paragraph_format.space_after = space_after
+    return scratch._p.get_or_add_pPr()  # noqa: SLF001
+
+
+def _stamp_paragraph_properties(
+    paragraph_element: etree._Element, paragraph_properties: etree._Element
+) -> None:
+    """Copies prebuilt paragraph properties onto a paragraph.
+
+    A paragraph without properties receives a copy of the whole element.
+    Otherwise the attributes of each property are set on the paragraph's own
+    element, so that e.g. setting the space before keeps the line spacing.
+
+    Args:
+        paragraph_element: The `w:p` element to format.
+        paragraph_properties: The prebuilt `w:pPr` element.
+    """
+    target = paragraph_element.pPr
+    if target is None or len(target) == 0:
+        if target is not None:
+            paragraph_element.remove(target)
+        paragraph_element.insert(0, copy.deepcopy(paragraph_properties))
+        return
+
+    for child in paragraph_properties:
+        target_child = target.find(child.tag)
+        if target_child is None:
+            name = _PARAGRAPH_PROPERTY_NAMES[child.tag]
+            getattr(target, f"_insert_{name}")(copy.deepcopy(child))
+            continue
+        for key, value in child.attrib.items():
+            target_child.set(key, value)
+
+
+def _normalize_container(container: etree._Element) -> int:
+    """Merges the adjacent runs of a paragraph or hyperlink.
+
+    Args:
+        container: The element whose child runs to merge.
+
+    Returns:
+        The number of removed runs.
+    """
+    removed = 0
+    previous: etree._Element | None = None
+    previous_key = b""
+    merged = []
+    for child in list(container):
+        if child.tag == _PROOF_ERROR_TAG:
+            container.remove(child)
+            continue
+        if child.tag != _RUN_TAG:
+            previous = None
+            continue
+
+        content = [element for element in child if element.tag != _RUN_PROPERTIES_TAG]
+        if not content:
+            container.remove(child)
+            removed += 1
+            continue
+        if any(element.tag not in _MERGEABLE_CONTENT_TAGS for element in content):
+            previous = None
+            continue
+
+        key = _format_key(child)
+        if previous is not None and key == previous_key:
+            previous.extend(content)
+            container.remove(child)
+            removed += 1
+            if not merged or merged[-1] is not previous:
+                merged.append(previous)
         else:
-            new_run = self.paragraph._element._new_r()  # noqa: SLF001
-            new_run.text = text
-            if index < 0:
-                self.paragraph.runs[index]._element.addnext(new_run)  # noqa: SLF001
-            else:
-                self.paragraph.runs[index]._element.addprevious(new_run)  # noqa: SLF001
+            previous, previous_key = child, key
 
-        run.ExtendRun(self.paragraph.runs[index]).format(style)
-        return self.paragraph.runs[index]
+    for run_element in merged:
+        _join_texts(run_element)
+    return removed
 
-    def format(
-        self,
-        style: styles.ParagraphStyle,
-    ) -> None:
-        """Formats a paragraph in a Word document.
 
-        Args:
-            style: The style to apply to the paragraph.
-        """
-        if style.line_spacing is not None:
-            self.paragraph.paragraph_format.line_spacing = style.line_spacing
-
-        if style.alignment is not None:
-            self.paragraph.alignment = style.alignment
-
-        if style.space_before is not None:
-            self.paragraph.paragraph_format.space_before = style.space_before
-
-        if style.space_after is not None:
-            self.paragraph.paragraph_format.space_after = style.space_after
-
-        for paragraph_run in self.paragraph.runs:
-            run.ExtendRun(paragraph_run).format(
-                styles.RunStyle(
-                    bold=style.bold,
-                    italic=style.italic,
-                    font_size=style.font_size,
-                    font_rgb=style.font_rgb,
-                )
-            )
+def _format_key(run_element: etree._Element) -> bytes:
+    """Returns a key that is equal for runs with equivalent formatting.
+
+    Args:
+        run_element: The `w:r` element.
+
+    Returns:
+        The canonical XML of the run's properties.
+    """
+    run_properties = run_element.find(_RUN_PROPERTIES_TAG)
+    if run_properties is None or len(run_properties) == 0:
+        return b""
+    return etree.tostring(run_properties, method="c14n")
+
+
+def _join_texts(run_element: etree._Element) -> None:
+    """Joins adjacent `w:t` elements of a run.
+
+    Args:
+        run_element: The `w:r` element.
+    """
+    previous: etree._Element | None = None
+    for child in list(run_element):
+        if child.tag != _TEXT_TAG:
+            previous = None
+            continue
+        if previous is None:
+            previous = child
+            continue
+        previous.text = (previous.text or "") + (child.text or "")
+        run_element.remove(child)
+        if previous.text != previous.text.strip():
+            previous.set(_XML_SPACE, "preserve")
+
+
+def _copy_run_properties(source: docx_run.Run, target: docx_run.Run) -> None:
+    """Copies all run properties (`w:rPr`) of a run onto a run without any.
+
+    Unlike `run.ExtendRun.get_format`, this keeps properties that a
+    `styles.RunStyle` cannot express, such as the font name or highlight.
+
+    Args:
+        source: The run to copy the properties from.
+        target: The run to copy the properties to.
+    """
+    run_properties = source._r.rPr  # noqa: SLF001
+    if run_properties is not None:
+        target._r.insert(0, copy.deepcopy(run_properties))  # noqa: SLF001
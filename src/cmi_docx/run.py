@@ -1,10 +1,140 @@
 """Module for extending python-docx Run objects."""
 
-from docx import shared
-from docx.enum import text
+import array
+import copy
+import functools
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from docx import oxml, shared
+from docx.oxml import ns
 from docx.text import paragraph as docx_paragraph
+from docx.text import run as docx_run
+
+from cmi_docx import cache, styles
+
+if TYPE_CHECKING:
+    from docx.oxml.text import font as docx_oxml_font
+    from docx.oxml.text import paragraph as docx_oxml_paragraph
+    from docx.oxml.text import run as docx_oxml_run
+
+type _StyleKey = tuple[
+    bool | None,
+    bool | None,
+    bool | None,
+    bool | None,
+    bool | None,
+    float | None,
+    tuple[int, ...] | None,
+]
+
+_VAL = ns.qn("w:val")
+# The run property elements read by `ExtendRun.get_format`, by tag.
+_RUN_PROPERTY_NAMES = {
+    ns.qn(f"w:{name}"): name for name in ("b", "i", "u", "vertAlign", "sz", "color")
+}
+_FALSE_VALUES = frozenset(("0", "false", "off"))
+
+
+class ParagraphRuns:
+    """Cached run handles of a paragraph.
+
+    `docx.text.paragraph.Paragraph.runs` builds a new list of run objects from
+    the XML on every access. This keeps a single list instead, which edits made
+    through `cmi_docx` update in place.
+    """
+
+    def __init__(self, paragraph: docx_paragraph.Paragraph) -> None:
+        """Initializes a ParagraphRuns object.
+
+        Args:
+            paragraph: The paragraph whose runs to cache.
+        """
+        self.paragraph = paragraph
+        self._runs = paragraph.runs
+
+    def __len__(self) -> int:
+        """Returns the number of runs in the paragraph."""
+        return len(self._runs)
 
-from cmi_docx import styles
+    def __iter__(self) -> Iterator[docx_run.Run]:
+        """Iterates over the runs of the paragraph."""
+        return iter(self._runs)
+
+    def __getitem__(self, index: int) -> docx_run.Run:
+        """Returns the run at an index.
+
+        Args:
+            index: The index of the run.
+
+        Returns:
+            The run.
+        """
+        return self._runs[index]
+
+    def slice(self, start: int, stop: int) -> list[docx_run.Run]:
+        """Returns the runs between two indices.
+
+        Args:
+            start: The index of the first run.
+            stop: The index after the last run.
+
+        Returns:
+            The runs.
+        """
+        return self._runs[start:stop]
+
+    def insert(self, index: int, text: str) -> docx_run.Run:
+        """Inserts a new run before the run at an index.
+
+        Args:
+            index: The index of the new run. An index equal to the number of runs
+                appends the run to the paragraph; negative indices insert the
+                run after the indexed run.
+            text: The text of the new run.
+
+        Returns:
+            The inserted run.
+        """
+        if index < 0:
+            return self.insert_after(index + len(self._runs), text)
+        if index == len(self._runs):
+            new_run = self.paragraph.add_run(text)
+            self._runs.append(new_run)
+            return new_run
+
+        new_run = self._new_run(text)
+        self._runs[index]._element.addprevious(new_run._element)  # noqa: SLF001
+        self._runs.insert(index, new_run)
+        return new_run
+
+    def insert_after(self, index: int, text: str) -> docx_run.Run:
+        """Inserts a new run directly after the run at an index.
+
+        Args:
+            index: The index of the run to insert after.
+            text: The text of the new run.
+
+        Returns:
+            The inserted run.
+        """
+        new_run = self._new_run(text)
+        self._runs[index]._element.addnext(new_run._element)  # noqa: SLF001
+        self._runs.insert(index + 1, new_run)
+        return new_run
+
+    def _new_run(self, text: str) -> docx_run.Run:
+        """Creates a run that is not yet part of the paragraph.
+
+        Args:
+            text: The text of the run.
+
+        Returns:
+            The new run.
+        """
+        new_element = self.paragraph._element._new_r()  # noqa: SLF001
+        new_element.text = text
+        return docx_run.Run(new_element, self.paragraph)
 
 
 class FindRun:
@@ -18,11 +148,22 @@ class FindRun:
             the text. The second index is the end of the text in the last run.
     """
 
+    __slots__ = (
+        "_paragraph_cache",
+        "_paragraph_runs",
+        "_replacement_done",
+        "character_indices",
+        "paragraph",
+        "run_indices",
+    )
+
     def __init__(
         self,
         paragraph: docx_paragraph.Paragraph,
         run_indices: tuple[int, int],
         character_indices: tuple[int, int],
+        paragraph_runs: ParagraphRuns | None = None,
+        paragraph_cache: cache.ParagraphCache | None = None,
     ) -> None:
         """Initializes a FindRun object.
 
@@ -30,16 +171,30 @@ class FindRun:
             paragraph: The paragraph containing the text.
             run_indices: The run indices of the text needle's start and end.
             character_indices: The character indices of the text in the runs.
+            paragraph_runs: The cached runs of the paragraph. Sharing these
+                between FindRuns of the same paragraph avoids rebuilding the
+                run list for every replacement.
+            paragraph_cache: The cache the run locations were computed from;
+                the paragraph's entry is dropped from it on replacement.
         """
         self.paragraph = paragraph
         self.run_indices = run_indices
         self.character_indices = character_indices
+        self._paragraph_runs = paragraph_runs
+        self._paragraph_cache = paragraph_cache
         self._replacement_done = False
 
+    @property
+    def paragraph_runs(self) -> ParagraphRuns:
+        """Returns the cached runs of the paragraph."""
+        if self._paragraph_runs is None:
+            self._paragraph_runs = ParagraphRuns(self.paragraph)
+        return self._paragraph_runs
+
     @property
     def runs(self) -> list[docx_paragraph.Run]:
         """Returns the runs containing the text."""
-        return self.paragraph.runs[self.run_indices[0] : self.run_indices[1] + 1]
+        return self.paragraph_runs.slice(self.run_indices[0], self.run_indices[1] + 1)
 
     def replace(self, replace: str, style: styles.RunStyle | None = None) -> None:
         """Replaces the text in the runs with the replacement text.
@@ -62,6 +217,8 @@ class FindRun:
         else:
             self._replace_with_style(replace, style)
         self._replacement_done = True
+        if self._paragraph_cache is not None:
+            self._paragraph_cache.invalidate(self.paragraph)
 
     def _replace_without_style(self, replace: str) -> None:
         """Replaces the text in the runs with the replacement text.
@@ -71,16 +228,15 @@ class FindRun:
         """
         start = self.character_indices[0]
         end = self.character_indices[1]
+        runs = self.runs
 
-        if len(self.runs) == 1:
-            self.runs[0].text = (
-                self.runs[0].text[:start] + replace + self.runs[0].text[end:]
-            )
+        if len(runs) == 1:
+            runs[0].text = runs[0].text[:start] + replace + runs[0].text[end:]
         else:
-            self.runs[0].text = self.runs[0].text[:start] + replace
-            for run in self.runs[1:-1]:
+            runs[0].text = runs[0].text[:start] + replace
+            for run in runs[1:-1]:
                 run.clear()
-            self.runs[-1].text = self.runs[-1].text[end:]
+            runs[-1].text = runs[-1].text[end:]
 
     def _replace_with_style(self, replace: str, style: styles.RunStyle) -> None:
         """Replaces the text in the runs with the replacement text and style.
@@ -91,22 +247,19 @@ class FindRun:
         """
         start = self.character_indices[0]
         end = self.character_indices[1]
+        runs = self.runs
 
-        pre, post = self.runs[0].text[:start], self.runs[-1].text[end:]
-        self.runs[0].text = pre
-        for index in range(1, len(self.runs)):
-            self.runs[index].text = ""
+        pre, post = runs[0].text[:start], runs[-1].text[end:]
+        runs[0].text = pre
+        for run in runs[1:]:
+            run.text = ""
 
-        new_run = self.paragraph._element._new_r()  # noqa: SLF001
-        new_run.text = replace
-        self.paragraph.runs[self.run_indices[0]]._element.addnext(new_run)  # noqa: SLF001
-        ExtendRun(self.paragraph.runs[self.run_indices[0] + 1]).format(style)
+        first_index = self.run_indices[0]
+        new_run = self.paragraph_runs.insert_after(first_index, replace)
+        ExtendRun(new_run).format(style)
 
-        post_run = self.paragraph._element._new_r()  # noqa: SLF001
-        post_run.text = post
-        self.paragraph.runs[self.run_indices[0] + 1]._element.addnext(post_run)  # noqa: SLF001
-        pre_style = ExtendRun(self.paragraph.runs[self.run_indices[0]]).get_format()
-        ExtendRun(self.paragraph.runs[self.run_indices[0] + 2]).format(pre_style)
+        post_run = self.paragraph_runs.insert_after(first_index + 1, post)
+        ExtendRun(post_run).format(ExtendRun(runs[0]).get_format())
 
     def __lt__(self, other: "FindRun") -> bool:
         """Sorts FindRun in order of appearance in the paragraph.
@@ -132,6 +285,120 @@ class FindRun:
         return self.run_indices[0] < other.run_indices[0]
 
 
+class FindResults:
+    """Compact storage of many find results in runs.
+
+    Each result is stored as five integers in `array` columns: the paragraph,
+    the start and end runs, and the start and end characters. `FindRun`
+    objects are only created when a result is accessed; every access returns
+    a new view, and views of the same paragraph share its run list.
+    """
+
+    def __init__(self, paragraph_cache: cache.ParagraphCache | None = None) -> None:
+        """Initializes an empty FindResults object.
+
+        Args:
+            paragraph_cache: The cache the results are computed from, passed on
+                to the `FindRun` views.
+        """
+        self.paragraph_cache = paragraph_cache
+        self.paragraphs: list[docx_paragraph.Paragraph] = []
+        self._paragraph_ids: dict[docx_oxml_paragraph.CT_P, int] = {}
+        self._paragraph_runs: dict[int, ParagraphRuns] = {}
+        self._columns = tuple(array.array("i") for _ in range(5))
+
+    def __len__(self) -> int:
+        """Returns the number of results."""
+        return len(self._columns[0])
+
+    def __getitem__(self, index: int) -> FindRun:
+        """Returns a view of a result.
+
+        Args:
+            index: The index of the result.
+
+        Returns:
+            The result as a FindRun.
+        """
+        paragraph_id, start_run, end_run, start_index, end_index = (
+            column[index] for column in self._columns
+        )
+        if paragraph_id not in self._paragraph_runs:
+            self._paragraph_runs[paragraph_id] = ParagraphRuns(
+                self.paragraphs[paragraph_id]
+            )
+        return FindRun(
+            paragraph=self.paragraphs[paragraph_id],
+            run_indices=(start_run, end_run),
+            character_indices=(start_index, end_index),
+            paragraph_runs=self._paragraph_runs[paragraph_id],
+            paragraph_cache=self.paragraph_cache,
+        )
+
+    def __iter__(self) -> Iterator[FindRun]:
+        """Iterates over views of the results."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def append(
+        self,
+        paragraph: docx_paragraph.Paragraph,
+        run_indices: tuple[int, int],
+        character_indices: tuple[int, int],
+    ) -> None:
+        """Adds a result.
+
+        Args:
+            paragraph: The paragraph containing the text.
+            run_indices: The run indices of the text's start and end.
+            character_indices: The character indices of the text in the runs.
+        """
+        key = paragraph._p  # noqa: SLF001
+        if key not in self._paragraph_ids:
+            self._paragraph_ids[key] = len(self.paragraphs)
+            self.paragraphs.append(paragraph)
+        for column, value in zip(
+            self._columns,
+            (self._paragraph_ids[key], *run_indices, *character_indices),
+            strict=True,
+        ):
+            column.append(value)
+
+    def sort(self, *, reverse: bool = False) -> None:
+        """Sorts the results by paragraph and position within the paragraph.
+
+        Args:
+            reverse: If True, later results come first. Replacing results in
+                this order leaves the run indices of the remaining results
+                intact.
+        """
+        paragraph_ids, start_runs, _, start_indices, _ = self._columns
+        order = sorted(
+            range(len(self)),
+            key=lambda index: (
+                paragraph_ids[index],
+                start_runs[index],
+                start_indices[index],
+            ),
+            reverse=reverse,
+        )
+        self._columns = tuple(
+            array.array("i", (column[index] for index in order))
+            for column in self._columns
+        )
+
+    def replace(self, replace: str, style: styles.RunStyle | None = None) -> None:
+        """Replaces all results, see `FindRun.replace`.
+
+        Args:
+            replace: The text to replace.
+            style: The style to apply to the replacement text.
+        """
+        self.sort(reverse=True)
+        for find_run in self:
+            find_run.replace(replace, style)
+
+
 class ExtendRun:
     """Extends a python-docx Word run with additional functionality."""
 
@@ -152,43 +419,143 @@ class ExtendRun:
         Raises:
             ValueError: If both superscript and subscript are set.
         """
-        if style.superscript and style.subscript:
-            msg = "Cannot have superscript and subscript at the same time."
-            raise ValueError(msg)
-
-        if style.bold is not None:
-            self.run.bold = style.bold
-        if style.italic is not None:
-            self.run.italic = style.italic
-        if style.underline is not None:
-            self.run.underline = style.underline
-        if style.superscript is not None:
-            self.run.font.superscript = style.superscript
-        if style.subscript is not None:
-            self.run.font.subscript = style.subscript
-        if style.font_size is not None:
-            self.run.font.size = shared.Pt(style.font_size)
-        if style.font_rgb is not None:
-            self.run.font.color.rgb = shared.RGBColor(*style.font_rgb)
+        format_run_elements([self.run._r], style)  # noqa: SLF001
 
     def get_format(self) -> styles.RunStyle:
         """Returns the formatting of the run.
 
+        The run properties are read in a single pass over their elements.
+
         Returns:
-            The formatting of the run.
+            The formatting of the run. The font size is in points.
         """
-        underline: bool | None
-        if isinstance(self.run.underline, text.WD_UNDERLINE):
-            underline = self.run.underline != text.WD_UNDERLINE.NONE
-        else:
-            underline = self.run.underline
-
-        return styles.RunStyle(
-            bold=self.run.bold,
-            italic=self.run.italic,
-            underline=underline,
-            superscript=self.run.font.superscript,
-            subscript=self.run.font.subscript,
-            font_size=self.run.font.size,
-            font_rgb=self.run.font.color.rgb,
-        )
+        style = styles.RunStyle()
+        run_properties = self.run._r.rPr  # noqa: SLF001
+        if run_properties is None:
+            return style
+
+        for child in run_properties:
+            value = child.get(_VAL)
+            match _RUN_PROPERTY_NAMES.get(child.tag):
+                case "b" if style.bold is None:
+                    style.bold = value not in _FALSE_VALUES
+                case "i" if style.italic is None:
+                    style.italic = value not in _FALSE_VALUES
+                case "u" if value is not None:
+                    style.underline = value != "none"
+                case "vertAlign":
+                    style.superscript = value == "superscript"
+                    style.subscript = value == "subscript"
+                case "sz" if value is not None:
+                    half_points = int(value)
+                    style.font_size = (
+                        half_points // 2 if half_points % 2 == 0 else half_points / 2  # ty:ignore[invalid-assignment]
+                    )
+                case "color" if value is not None and value != "auto":
+                    red, green, blue = bytes.fromhex(value)
+                    style.font_rgb = (red, green, blue)
+        return style
+
+
+def format_run_elements(
+    run_elements: Iterable["docx_oxml_run.CT_R"], style: styles.RunStyle
+) -> None:
+    """Formats many `w:r` elements, building the style's run properties once.
+
+    Args:
+        run_elements: The runs to format.
+        style: The style to apply, see `ExtendRun.format`.
+
+    Raises:
+        ValueError: If both superscript and subscript are set.
+    """
+    if style.superscript and style.subscript:
+        msg = "Cannot have superscript and subscript at the same time."
+        raise ValueError(msg)
+
+    run_properties = _run_properties(_style_key(style))
+    for run_element in run_elements:
+        if len(run_properties):
+            _stamp_run_properties(run_element, run_properties)
+        # Clearing a vertical alignment depends on the run's current alignment.
+        if style.superscript is False:
+            run_element.get_or_add_rPr().superscript = False
+        if style.subscript is False:
+            run_element.get_or_add_rPr().subscript = False
+
+
+def _style_key(style: styles.RunStyle) -> _StyleKey:
+    """Returns a hashable key of the properties that `ExtendRun.format` stamps.
+
+    Args:
+        style: The style.
+
+    Returns:
+        The key. False superscript and subscript are left out, as they are
+        not stamped.
+    """
+    return (
+        style.bold,
+        style.italic,
+        style.underline,
+        style.superscript or None,
+        style.subscript or None,
+        style.font_size,
+        None if style.font_rgb is None else tuple(style.font_rgb),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _run_properties(key: _StyleKey) -> "docx_oxml_font.CT_RPr":
+    """Builds the run properties of a style once.
+
+    The returned element is shared between calls and must not be modified.
+
+    Args:
+        key: The key of the style, see `_style_key`.
+
+    Returns:
+        The `w:rPr` element holding the properties set by the style.
+    """
+    bold, italic, underline, superscript, subscript, font_size, font_rgb = key
+    scratch = docx_run.Run(oxml.OxmlElement("w:r"), None)  # ty:ignore[invalid-argument-type]
+    if bold is not None:
+        scratch.bold = bold
+    if italic is not None:
+        scratch.italic = italic
+    if underline is not None:
+        scratch.underline = underline
+    if superscript is not None:
+        scratch.font.superscript = superscript
+    if subscript is not None:
+        scratch.font.subscript = subscript
+    if font_size is not None:
+        scratch.font.size = shared.Pt(font_size)
+    if font_rgb is not None:
+        scratch.font.color.rgb = shared.RGBColor(*font_rgb)
+    return scratch._r.get_or_add_rPr()  # noqa: SLF001
+
+
+def _stamp_run_properties(
+    run_element: "docx_oxml_run.CT_R", run_properties: "docx_oxml_font.CT_RPr"
+) -> None:
+    """Copies prebuilt run properties onto a run.
+
+    A run without properties receives a copy of the whole element. Otherwise
+    each property replaces the run's own, keeping the schema order.
+
+    Args:
+        run_element: The `w:r` element to format.
+        run_properties: The prebuilt `w:rPr` element.
+    """
+    target = run_element.rPr
+    if target is None or len(target) == 0:
+        if target is not None:
+            run_element.remove(target)
+        run_element.insert(0, copy.deepcopy(run_properties))
+        return
+
+    for child in run_properties:
+        name = _RUN_PROPERTY_NAMES[child.tag]
+        getattr(target, f"_remove_{name}")()
+        getattr(target, f"_insert_{name}")(copy.deepcopy(child))
@@ -0,0 +1,253 @@
+"""Collects the edits to a document and applies them once per paragraph."""
+
+import dataclasses
+import re
+import types
+from collections.abc import Callable, Iterable, Mapping
+from typing import TYPE_CHECKING, Self
+
+from docx.text import paragraph as docx_paragraph
+
+from cmi_docx import cache, paragraph, styles
+
+if TYPE_CHECKING:
+    from docx.oxml.text import paragraph as docx_oxml_paragraph
+
+
+@dataclasses.dataclass
+class _PendingEdits:
+    """The edits queued for a single paragraph.
+
+    Attributes:
+        paragraph: The paragraph to edit.
+        original_text: The text of the paragraph in the document.
+        edits: The (start, end, text, style) of each edit, relative to the
+            original text, sorted and non-overlapping.
+        text: The text of the paragraph once the edits are applied.
+    """
+
+    paragraph: docx_paragraph.Paragraph
+    original_text: str
+    edits: list[tuple[int, int, str, styles.RunStyle | None]]
+    text: str
+
+
+class EditSession:
+    """Queues finds and replaces, and applies them once per paragraph.
+
+    Edits are recorded per paragraph and applied with a single
+    `ExtendParagraph.apply_edits` call when the session is flushed, typically
+    when leaving its `with` block. Later searches in the same session see the
+    queued edits; paragraph texts are read once and only edited paragraphs are
+    read again.
+
+    If a match overlaps text inserted by an earlier edit of the session, the
+    paragraph's queued edits are applied first so that the match can be
+    located in the document.
+
+    Paragraphs must not be added or removed while the session is open.
+    """
+
+    def __init__(self, paragraphs: Iterable[docx_paragraph.Paragraph]) -> None:
+        """Initializes an EditSession.
+
+        Args:
+            paragraphs: The paragraphs that the session may edit.
+        """
+        self._paragraph_cache = cache.ParagraphCache(paragraphs)
+        self._pending: dict[docx_oxml_paragraph.CT_P, _PendingEdits] = {}
+
+    def __enter__(self) -> Self:
+        """Opens the session."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        """Applies all queued edits, unless the block raised an exception."""
+        if exc_type is None:
+            self.flush()
+
+    @property
+    def dirty_paragraphs(self) -> list[docx_paragraph.Paragraph]:
+        """Returns the paragraphs with queued edits."""
+        return [pending.paragraph for pending in self._pending.values()]
+
+    def any_match(self, needle: str) -> bool:
+        """Checks whether a text occurs anywhere, including queued edits.
+
+        Args:
+            needle: The text to find.
+
+        Returns:
+            True if the text occurs in any paragraph, False otherwise. An
+            empty text never occurs.
+        """
+        if len(needle) == 0:
+            return False
+        return any(
+            needle in self._text(para) for para in self._paragraph_cache.paragraphs
+        )
+
+    def replace(
+        self, needle: str, replace: str, style: styles.RunStyle | None = None
+    ) -> None:
+        """Queues replacing every occurrence of a text.
+
+        Args:
+            needle: The text to find.
+            replace: The text to replace.
+            style: The style to apply to the replacement text.
+        """
+        if needle:
+            self.replace_regex(re.escape(needle), lambda _: replace, style)
+
+    def replace_many(
+        self, replacements: Mapping[str, str], style: styles.RunStyle | None = None
+    ) -> None:
+        """Queues replacing multiple texts, see `ExtendDocument.replace_many`.
+
+        Args:
+            replacements: Mapping of needles to their replacement texts.
+            style: The style to apply to the replacement texts.
+        """
+        needles = sorted(
+            (needle for needle in replacements if needle), key=len, reverse=True
+        )
+        if needles:
+            self.replace_regex(
+                "|".join(re.escape(needle) for needle in needles),
+                lambda match: replacements[match.group()],
+                style,
+            )
+
+    def replace_regex(
+        self,
+        pattern: str | re.Pattern[str],
+        repl: str | Callable[[re.Match[str]], str | tuple[str, styles.RunStyle | None]],
+        style: styles.RunStyle | None = None,
+    ) -> None:
+        """Queues replacing all matches, see `ExtendDocument.replace_regex`.
+
+        Args:
+            pattern: The regular expression to find.
+            repl: The replacement text, or a callable returning the replacement
+                text and optionally its style.
+            style: The style to apply to replacement texts that do not come
+                with their own style.
+        """
+        compiled = re.compile(pattern)
+        for para in self._paragraph_cache.paragraphs:
+            edits = []
+            for match in compiled.finditer(self._text(para)):
+                if match.end() == match.start():
+                    continue
+                replacement = repl(match) if callable(repl) else match.expand(repl)
+                if isinstance(replacement, tuple):
+                    edits.append((match.start(), match.end(), *replacement))
+                else:
+                    edits.append((match.start(), match.end(), replacement, style))
+            if edits:
+                self._queue(para, edits)
+
+    def flush(self) -> None:
+        """Applies all queued edits to the document."""
+        for pending in list(self._pending.values()):
+            self._flush_paragraph(pending)
+
+    def _text(self, para: docx_paragraph.Paragraph) -> str:
+        """Returns the text of a paragraph with its queued edits applied."""
+        pending = self._pending.get(para._p)  # noqa: SLF001
+        if pending is not None:
+            return pending.text
+        return self._paragraph_cache.entry(para).text
+
+    def _queue(
+        self,
+        para: docx_paragraph.Paragraph,
+        edits: list[tuple[int, int, str, styles.RunStyle | None]],
+    ) -> None:
+        """Queues edits of a paragraph.
+
+        Args:
+            para: The paragraph to edit.
+            edits: The edits, relative to the paragraph's text with its queued
+                edits applied.
+        """
+        pending = self._pending.get(para._p)  # noqa: SLF001
+        if pending is not None:
+            original_edits = [
+                _to_original(pending.edits, edit[0], edit[1]) for edit in edits
+            ]
+            if all(span is not None for span in original_edits):
+                edits = [
+                    (*span, *edit[2:])  # ty:ignore[not-iterable] Checked above.
+                    for span, edit in zip(original_edits, edits, strict=True)
+                ]
+            else:
+                self._flush_paragraph(pending)
+                pending = None
+
+        if pending is None:
+            original_text = self._paragraph_cache.entry(para).text
+            pending = _PendingEdits(para, original_text, [], original_text)
+            self._pending[para._p] = pending  # noqa: SLF001
+
+        pending.edits = sorted([*pending.edits, *edits], key=lambda e: (e[0], e[1]))
+        pending.text = _apply(pending.original_text, pending.edits)
+
+    def _flush_paragraph(self, pending: _PendingEdits) -> None:
+        """Applies the queued edits of a single paragraph."""
+        paragraph.ExtendParagraph(pending.paragraph, self._paragraph_cache).apply_edits(
+            pending.edits
+        )
+        del self._pending[pending.paragraph._p]  # noqa: SLF001
+
+
+def _to_original(
+    edits: list[tuple[int, int, str, styles.RunStyle | None]], start: int, end: int
+) -> tuple[int, int] | None:
+    """Maps a span of an edited text back to the original text.
+
+    Args:
+        edits: The edits applied to the original text, sorted.
+        start: The start of the span in the edited text.
+        end: The end of the span in the edited text.
+
+    Returns:
+        The span in the original text, or None if the span overlaps the text
+        of an edit.
+    """
+    shift = 0
+    for edit_start, edit_end, replace, _ in edits:
+        new_start = edit_start + shift
+        new_end = new_start + len(replace)
+        if new_start >= end:
+            break
+        if new_end > start:
+            return None
+        shift += len(replace) - (edit_end - edit_start)
+    return start - shift, end - shift
+
+
+def _apply(text: str, edits: list[tuple[int, int, str, styles.RunStyle | None]]) -> str:
+    """Applies sorted, non-overlapping edits to a text.
+
+    Args:
+        text: The original text.
+        edits: The edits to apply.
+
+    Returns:
+        The edited text.
+    """
+    pieces = []
+    position = 0
+    for start, end, replace, _ in edits:
+        pieces.append(text[position:start])
+        pieces.append(replace)
+        position = end
+    pieces.append(text[position:])
+    return "".join(pieces)
@@ -1,10 +1,38 @@
 """Extends a python-docx Table cell with additional functionality."""
 
+import copy
+from collections.abc import Buffer, Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING
+
 from docx import oxml, table
 from docx.oxml import ns
+from docx.text import paragraph as docx_paragraph
 
 from cmi_docx import paragraph, styles
 
+if TYPE_CHECKING:
+    from docx.oxml import table as docx_oxml_table
+
+# The children of `w:tcPr` that follow `w:shd` in schema order.
+_SHADING_SUCCESSORS = (
+    "w:noWrap",
+    "w:tcMar",
+    "w:textDirection",
+    "w:tcFitText",
+    "w:vAlign",
+    "w:hideMark",
+    "w:headers",
+    "w:cellIns",
+    "w:cellDel",
+    "w:cellMerge",
+    "w:tcPrChange",
+)
+# The children of `w:tcPr` that follow `w:tcBorders` in schema order.
+_BORDERS_SUCCESSORS = ("w:shd", *_SHADING_SUCCESSORS)
+# The text element that `ExtendTable.fill` writes each cell's value into.
+_CELL_TEXT_PATH = "./w:tc/w:p/w:r/w:t"
+_XML_SPACE = f"{{{ns.nsmap['xml']}}}space"
+
 
 class ExtendTable:
     """Extends a python-docx Table with additional functionality."""
@@ -47,6 +75,169 @@ class ExtendTable:
                     raise ValueError(msg)
                 tbl_look.set(ns.qn(f"w:{name}"), str(int(value)))
 
+    def format_range(
+        self,
+        style: styles.CellStyle,
+        *,
+        rows: slice = slice(None),
+        cols: slice = slice(None),
+    ) -> None:
+        """Formats a block of cells in a single pass over the table.
+
+        Formatting cells one by one through `Table.cell` resolves every cell's
+        grid position from scratch and rebuilds the shading and borders for each
+        of them. This walks the table's `w:tc` elements once instead, copying
+        shading and borders that are built once.
+
+        Cells are addressed by grid position, as with `Table.cell`. A cell that
+        spans several columns is selected by its first column and a vertically
+        merged cell by its top row; all elements of a selected merged cell are
+        formatted.
+
+        Args:
+            style: The style to apply to the cells.
+            rows: The rows to format.
+            cols: The grid columns to format.
+        """
+        _format_cell_elements(self._select(rows, cols), style, self.table)
+
+    def band_rows(
+        self,
+        band_styles: Sequence[styles.CellStyle],
+        *,
+        rows: slice = slice(None),
+        cols: slice = slice(None),
+    ) -> None:
+        """Cycles through styles row by row, e.g. to shade alternating rows.
+
+        Args:
+            band_styles: The styles to cycle through, starting at the first
+                selected row.
+            rows: The rows to band, without a step.
+            cols: The grid columns to format.
+        """
+        for offset, style in enumerate(band_styles):
+            self.format_range(
+                style, rows=_band(rows, offset, len(band_styles)), cols=cols
+            )
+
+    def band_columns(
+        self,
+        band_styles: Sequence[styles.CellStyle],
+        *,
+        rows: slice = slice(None),
+        cols: slice = slice(None),
+    ) -> None:
+        """Cycles through styles column by column.
+
+        Args:
+            band_styles: The styles to cycle through, starting at the first
+                selected column.
+            rows: The rows to format.
+            cols: The grid columns to band, without a step.
+        """
+        for offset, style in enumerate(band_styles):
+            self.format_range(
+                style, rows=rows, cols=_band(cols, offset, len(band_styles))
+            )
+
+    def fill(
+        self,
+        data: Sequence[Sequence[object]] | Buffer,
+        *,
+        start_row: int = 1,
+        clone_row: int | None = None,
+    ) -> None:
+        """Fills the table with rows cloned from a prototype row.
+
+        Setting `cell.text` through `Table.cell` rebuilds the table's cell grid
+        for every cell. Instead, the prototype row is prepared once and copied
+        for each row of data, and the values are written straight into the
+        copied `w:t` elements, so filling takes time proportional to the number
+        of cells. Each cell keeps the formatting of the prototype's first run,
+        or of its paragraph mark if it has no runs.
+
+        Args:
+            data: The rows of values, one value per `w:tc` of the prototype
+                row; a cell spanning several grid columns takes one value.
+                Either a sequence of sequences or a two-dimensional buffer,
+                e.g. a NumPy array. Values are converted with `str`, None
+                leaves the cell empty.
+            start_row: The index of the first row to fill. This row and all
+                rows after it are replaced by the filled rows.
+            clone_row: The index of the prototype row, defaults to `start_row`.
+
+        Raises:
+            IndexError: If the prototype row does not exist.
+            ValueError: If a row has more values than the prototype has cells,
+                or if a buffer is not two-dimensional.
+        """
+        tbl = self.table._tbl  # noqa: SLF001
+        row_elements = tbl.tr_lst
+        clone_row = start_row if clone_row is None else clone_row
+        if not 0 <= clone_row < len(row_elements):
+            msg = f"Prototype row {clone_row} does not exist."
+            raise IndexError(msg)
+        prototype = _prepare_prototype(row_elements[clone_row])
+        n_cells = len(prototype.tc_lst)
+        rows = _rows(data)
+        if (n_values := max(map(len, rows), default=0)) > n_cells:
+            msg = f"Row has {n_values} values but the prototype has {n_cells} cells."
+            raise ValueError(msg)
+
+        following = row_elements[-1].getnext()
+        for row_element in row_elements[start_row:]:
+            tbl.remove(row_element)
+        for values in rows:
+            row_element = copy.deepcopy(prototype)
+            for text_element, value in zip(
+                row_element.iterfind(_CELL_TEXT_PATH, ns.nsmap), values, strict=False
+            ):
+                if value is None:
+                    continue
+                text = str(value)
+                if "\t" in text or "\n" in text:
+                    text_element.getparent().text = text
+                    continue
+                text_element.text = text
+                if text != text.strip():
+                    text_element.set(_XML_SPACE, "preserve")
+            if following is None:
+                tbl.append(row_element)
+            else:
+                following.addprevious(row_element)
+
+    def _select(self, rows: slice, cols: slice) -> Iterator["docx_oxml_table.CT_Tc"]:
+        """Iterates over the cell elements of a block of cells.
+
+        Args:
+            rows: The rows to select.
+            cols: The grid columns to select.
+
+        Yields:
+            The `w:tc` elements of the selected cells, including the elements
+            continuing selected vertically merged cells.
+        """
+        tbl = self.table._tbl  # noqa: SLF001
+        row_elements = tbl.tr_lst
+        selected_rows = set(range(len(row_elements))[rows])
+        selected_columns = set(range(len(tbl.tblGrid.gridCol_lst))[cols])
+        # Whether the vertically merged cell starting in each grid column was
+        # selected.
+        selected_origins: dict[int, bool] = {}
+
+        for row_index, row_element in enumerate(row_elements):
+            column = row_element.grid_before
+            for cell_element in row_element.tc_lst:
+                if cell_element.vMerge == "continue":
+                    selected = selected_origins.get(column, False)
+                else:
+                    selected = row_index in selected_rows and column in selected_columns
+                    selected_origins[column] = selected
+                if selected:
+                    yield cell_element
+                column += cell_element.grid_span
+
 
 class ExtendCell:
     """Extends a python-docx Word cell with additional functionality."""
@@ -65,61 +256,178 @@ class ExtendCell:
         Args:
             style: The style to apply to the cell.
         """
+        _format_cell_elements([self.cell._tc], style, self.cell)  # noqa: SLF001
+
+
+def rgb_to_hex(red: int, green: int, blue: int) -> str:
+    """Converts RGB values to a hexadecimal color code.
+
+    Args:
+        red: The red component of the RGB color.
+        green: The green component of the RGB color.
+        blue: The blue component of the RGB color.
+
+    Returns:
+        The hexadecimal color code representing the RGB color.
+    """
+    return f"#{red:02x}{green:02x}{blue:02x}".upper()
+
+
+def _format_cell_elements(
+    cell_elements: Iterable["docx_oxml_table.CT_Tc"],
+    style: styles.CellStyle,
+    parent: table.Table | table._Cell,
+) -> None:
+    """Formats cell elements.
+
+    Args:
+        cell_elements: The `w:tc` elements to format.
+        style: The style to apply to the cells.
+        parent: The proxy object that owns the cells' paragraphs.
+    """
+    shading = None
+    if style.background_rgb is not None:
+        shading = oxml.OxmlElement(
+            "w:shd",
+            {ns.qn("w:fill"): rgb_to_hex(*style.background_rgb).lstrip("#")},
+        )
+    # looks like order of attributes is important
+    border_attributes = [
+        (
+            f"w:{edge}",
+            [
+                (ns.qn(f"w:{key}"), str(value))
+                for key in ["sz", "val", "color"]
+                if (value := getattr(border, key))
+            ],
+        )
+        for border in style.borders or []
+        for edge in border.sides
+    ]
+
+    paragraphs: list[docx_paragraph.Paragraph] = []
+    for cell_element in cell_elements:
         if style.paragraph is not None:
-            for table_paragraph in self.cell.paragraphs:
-                paragraph.ExtendParagraph(table_paragraph).format(style.paragraph)
-
-        if style.background_rgb is not None:
-            shading = oxml.parse_xml(
-                (
-                    r'<w:shd {} w:fill="'
-                    f"{rgb_to_hex(*style.background_rgb).lstrip('#')}"
-                    r'"/>'
-                ).format(
-                    ns.nsdecls("w"),
-                ),
+            paragraphs.extend(
+                docx_paragraph.Paragraph(paragraph_element, parent)
+                for paragraph_element in cell_element.p_lst
             )
-            self.cell._tc.get_or_add_tcPr().append(shading)  # noqa: SLF001
+        if shading is None and not border_attributes:
+            continue
 
-        if style.borders:
-            for border in style.borders:
-                self._apply_border(border)
+        tc_pr = cell_element.get_or_add_tcPr()
+        if border_attributes:
+            _merge_borders(tc_pr, border_attributes)
+        if shading is not None:
+            existing = tc_pr.find(ns.qn("w:shd"))
+            if existing is not None:
+                tc_pr.remove(existing)
+            tc_pr.insert_element_before(copy.deepcopy(shading), *_SHADING_SUCCESSORS)
 
-    def _apply_border(self, border: styles.CellBorder) -> None:
-        """Applies the borders styling to the cell.
+    if style.paragraph is not None:
+        paragraph.format_paragraphs(paragraphs, style.paragraph)
 
-        Args:
-            border: The style to apply to the cell.
-        """
-        tc_pr = self.cell._tc.get_or_add_tcPr()  # noqa: SLF001
 
-        tc_borders = tc_pr.first_child_found_in("w:tcBorders")
-        if tc_borders is None:
-            tc_borders = oxml.OxmlElement("w:tcBorders")
-            tc_pr.append(tc_borders)
+def _merge_borders(
+    tc_pr: "docx_oxml_table.CT_TcPr",
+    border_attributes: list[tuple[str, list[tuple[str, str]]]],
+) -> None:
+    """Sets border attributes, adding the border elements that are missing.
 
-        for edge in border.sides:
-            tag = f"w:{edge}"
-            element = tc_borders.find(ns.qn(tag))
-            if element is None:
-                element = oxml.OxmlElement(tag)
-                tc_borders.append(element)
+    Args:
+        tc_pr: The cell properties to update.
+        border_attributes: The tag of each border side and its attributes.
+    """
+    tc_borders = tc_pr.find(ns.qn("w:tcBorders"))
+    if tc_borders is None:
+        tc_borders = oxml.OxmlElement("w:tcBorders")
+        tc_pr.insert_element_before(tc_borders, *_BORDERS_SUCCESSORS)
+    for tag, attributes in border_attributes:
+        element = tc_borders.find(ns.qn(tag))
+        if element is None:
+            element = oxml.OxmlElement(tag)
+            tc_borders.append(element)
+        for key, value in attributes:
+            element.set(key, value)
 
-            # looks like order of attributes is important
-            for key in ["sz", "val", "color"]:
-                if value := getattr(border, key):
-                    element.set(ns.qn(f"w:{key}"), str(value))
 
+def _prepare_prototype(
+    row_element: "docx_oxml_table.CT_Row",
+) -> "docx_oxml_table.CT_Row":
+    """Copies a row, reducing each cell to a single paragraph with one empty run.
 
-def rgb_to_hex(red: int, green: int, blue: int) -> str:
-    """Converts RGB values to a hexadecimal color code.
+    Args:
+        row_element: The prototype row.
+
+    Returns:
+        The prepared copy. The text element of each cell is found with
+        `_CELL_TEXT_PATH`, in cell order.
+    """
+    prototype = copy.deepcopy(row_element)
+    for cell_element in prototype.tc_lst:
+        paragraphs = cell_element.p_lst
+        if not paragraphs:
+            paragraphs = [cell_element.add_p()]
+        for extra in paragraphs[1:]:
+            cell_element.remove(extra)
+        paragraph_element = paragraphs[0]
+
+        runs = paragraph_element.r_lst
+        for child in list(paragraph_element):
+            if child.tag != ns.qn("w:pPr") and (not runs or child is not runs[0]):
+                paragraph_element.remove(child)
+        if runs:
+            run_element = runs[0]
+            run_element.clear_content()
+        else:
+            run_element = paragraph_element.add_r()
+            mark_properties = paragraph_element.find("w:pPr/w:rPr", ns.nsmap)
+            if mark_properties is not None:
+                run_element.insert(0, copy.deepcopy(mark_properties))
+        run_element.add_t("")
+    return prototype
+
+
+def _rows(data: Sequence[Sequence[object]] | Buffer) -> Sequence[Sequence[object]]:
+    """Converts two-dimensional data to a sequence of rows.
 
     Args:
-        red: The red component of the RGB color.
-        green: The green component of the RGB color.
-        blue: The blue component of the RGB color.
+        data: A sequence of sequences or a two-dimensional buffer.
 
     Returns:
-        The hexadecimal color code representing the RGB color.
+        The rows of values.
+
+    Raises:
+        ValueError: If a buffer is not two-dimensional.
     """
-    return f"#{red:02x}{green:02x}{blue:02x}".upper()
+    if not isinstance(data, Buffer):
+        return data  # ty:ignore[invalid-return-type]
+    view = memoryview(data)
+    if view.ndim != 2:  # noqa: PLR2004
+        msg = f"Expected a two-dimensional buffer, got {view.ndim} dimensions."
+        raise ValueError(msg)
+    return view.tolist()
+
+
+def _band(selection: slice, offset: int, step: int) -> slice:
+    """Selects every step-th index of a selection, starting at an offset.
+
+    Args:
+        selection: The selection to band.
+        offset: The position of the band within the selection.
+        step: The number of bands.
+
+    Returns:
+        The selection of the band.
+
+    Raises:
+        ValueError: If the selection has a step or starts at a negative index.
+    """
+    if selection.step not in {None, 1}:
+        msg = "Banded selections must not have a step."
+        raise ValueError(msg)
+    start = selection.start or 0
+    if start < 0:
+        msg = "Banded selections must not start at a negative index."
+        raise ValueError(msg)
+    return slice(start + offset, selection.stop, step)
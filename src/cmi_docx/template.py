@@ -0,0 +1,183 @@
+"""Fills text placeholders in a Word document directly on its XML parts."""
+
+import pathlib
+import re
+import zipfile
+from collections.abc import Iterator, Mapping
+from typing import IO
+
+from docx.opc import constants
+from docx.oxml.ns import qn
+from lxml import (
+    etree,  # ty:ignore[unresolved-import] # This does work; not sure why not detected.
+)
+
+_STORY_CONTENT_TYPES = frozenset(
+    {
+        constants.CONTENT_TYPE.WML_DOCUMENT_MAIN,
+        constants.CONTENT_TYPE.WML_HEADER,
+        constants.CONTENT_TYPE.WML_FOOTER,
+    }
+)
+_CONTENT_TYPES_NAME = "[Content_Types].xml"
+_CONTENT_TYPES_OVERRIDE = (
+    "{http://schemas.openxmlformats.org/package/2006/content-types}Override"
+)
+
+_PARAGRAPH_TAG = qn("w:p")
+_TEXT_TAG = qn("w:t")
+_BREAK_TAGS = (qn("w:br"), qn("w:cr"), qn("w:noBreakHyphen"), qn("w:ptab"), qn("w:tab"))
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+
+def fill_template(
+    source: str | pathlib.Path | IO[bytes],
+    destination: str | pathlib.Path | IO[bytes],
+    replacements: Mapping[str, str],
+) -> None:
+    """Replaces text placeholders in a Word document without loading it.
+
+    Only the main document, header, and footer parts are parsed; every other
+    part is copied unchanged, as are story parts without placeholders.
+    Placeholders may be split across runs, in which case the replacement keeps
+    the formatting of the run that holds its first character. As with
+    `ExtendDocument.replace_many`, all needles are replaced in a single pass
+    and the longest needle wins when needles overlap.
+
+    Placeholders that contain a tab or a break are not matched.
+
+    Args:
+        source: The Word document to fill.
+        destination: Where to write the filled document.
+        replacements: Mapping of needles to their replacement texts.
+    """
+    needles = sorted(
+        (needle for needle in replacements if needle), key=len, reverse=True
+    )
+    pattern = (
+        re.compile("|".join(re.escape(needle) for needle in needles))
+        if needles
+        else None
+    )
+
+    with (
+        zipfile.ZipFile(source) as source_zip,
+        zipfile.ZipFile(destination, "w") as destination_zip,
+    ):
+        story_names = _story_part_names(source_zip)
+        for info in source_zip.infolist():
+            data = source_zip.read(info)
+            if pattern is not None and info.filename in story_names:
+                data = _fill_part(data, pattern, replacements)
+            destination_zip.writestr(info, data)
+
+
+def _story_part_names(package: zipfile.ZipFile) -> set[str]:
+    """Finds the names of the main document, header, and footer parts.
+
+    Args:
+        package: The opened Word document.
+
+    Returns:
+        The zip member names of the story parts.
+    """
+    content_types = etree.fromstring(package.read(_CONTENT_TYPES_NAME))
+    return {
+        override.get("PartName").lstrip("/")
+        for override in content_types.iter(_CONTENT_TYPES_OVERRIDE)
+        if override.get("ContentType") in _STORY_CONTENT_TYPES
+    }
+
+
+def _fill_part(
+    data: bytes, pattern: re.Pattern[str], replacements: Mapping[str, str]
+) -> bytes:
+    """Replaces the placeholders in a single story part.
+
+    Args:
+        data: The XML of the part.
+        pattern: The pattern matching any needle.
+        replacements: Mapping of needles to their replacement texts.
+
+    Returns:
+        The XML of the filled part, or the original data if nothing matched.
+    """
+    root = etree.fromstring(data)
+    changed = False
+    for text_nodes in _text_segments(root):
+        text = "".join(node.text or "" for node in text_nodes)
+        matches = list(pattern.finditer(text))
+        if not matches:
+            continue
+        changed = True
+        _replace_in_nodes(text_nodes, text, matches, replacements)
+
+    if not changed:
+        return data
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _text_segments(root: etree._Element) -> Iterator[list[etree._Element]]:  # type: ignore[name-defined]
+    """Groups the `w:t` elements of a part into contiguous text.
+
+    A segment ends at the end of a paragraph and at any tab or break.
+
+    Args:
+        root: The root element of the part.
+
+    Yields:
+        The `w:t` elements of each segment, in document order.
+    """
+    segments: dict[etree._Element, list[etree._Element]] = {}  # type: ignore[name-defined]
+    for element in root.iter(_TEXT_TAG, *_BREAK_TAGS):
+        paragraph = next(element.iterancestors(_PARAGRAPH_TAG), None)
+        if paragraph is None:
+            continue
+        if element.tag != _TEXT_TAG:
+            if segments.get(paragraph):
+                yield segments.pop(paragraph)
+            continue
+        segments.setdefault(paragraph, []).append(element)
+    yield from segments.values()
+
+
+def _replace_in_nodes(
+    text_nodes: list[etree._Element],  # type: ignore[name-defined]
+    text: str,
+    matches: list[re.Match[str]],
+    replacements: Mapping[str, str],
+) -> None:
+    """Rewrites the `w:t` elements of a segment with the matches replaced.
+
+    Each replacement is written to the element that holds the first character
+    of its match; the rest of the match is removed from the following elements.
+
+    Args:
+        text_nodes: The `w:t` elements of the segment.
+        text: The concatenated text of the segment.
+        matches: The non-overlapping matches in the text, in order.
+        replacements: Mapping of needles to their replacement texts.
+    """
+    match_index = 0
+    node_start = 0
+    for node in text_nodes:
+        node_end = node_start + len(node.text or "")
+        position = node_start
+        if match_index > 0:
+            position = max(position, min(matches[match_index - 1].end(), node_end))
+        changed = position > node_start
+
+        pieces = []
+        while match_index < len(matches) and matches[match_index].start() < node_end:
+            match = matches[match_index]
+            pieces.append(text[position : match.start()])
+            pieces.append(replacements[match.group()])
+            position = min(match.end(), node_end)
+            match_index += 1
+            changed = True
+
+        if changed:
+            pieces.append(text[position:node_end])
+            node.text = "".join(pieces)
+            node.set(_XML_SPACE, "preserve")
+        node_start = node_end
@@ -1,7 +1,11 @@
 """Async tests for the declarative API."""
 
 import asyncio
+import io
+from concurrent import futures
+from typing import Any
 
+import docx
 import pytest
 
 from cmi_docx import declarative
@@ -59,3 +63,32 @@ async def test_async_text_run() -> None:
     docx = await doc.to_docx()
     assert docx.paragraphs[0].text.startswith("Sync text")
     assert "async text" in docx.paragraphs[0].text
+
+
+class RecordingExecutor(futures.ThreadPoolExecutor):
+    """Thread pool that counts the submitted jobs."""
+
+    submitted = 0
+
+    def submit(self, *args: Any, **kwargs: Any) -> futures.Future:  # noqa: ANN401
+        """Counts and submits a job."""
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_save_and_to_bytes_use_executor() -> None:
+    """Test that packing and saving run in the given executor."""
+    doc = declarative.Document(
+        sections=[declarative.Section(children=[fetch_paragraph()])],
+    )
+    with RecordingExecutor() as executor:
+        data = await doc.to_bytes(executor=executor)
+        buffer = io.BytesIO()
+        await doc.save(buffer, executor=executor)
+        docx_doc = await doc.to_docx(executor=executor)
+
+    assert executor.submitted == 3  # noqa: PLR2004
+    assert docx.Document(io.BytesIO(data)).paragraphs[0].text == "Async paragraph"
+    assert docx.Document(buffer).paragraphs[0].text == "Async paragraph"
+    assert docx_doc.paragraphs[0].text == "Async paragraph"
@@ -0,0 +1,118 @@
+"""Tests for rendering many declarative documents in worker processes."""
+
+import asyncio
+import inspect
+import io
+import pathlib
+import tempfile
+
+import docx
+import pytest
+
+from cmi_docx import declarative
+
+
+async def fetch_paragraph(text: str) -> declarative.Paragraph:
+    """Simulate fetching a paragraph asynchronously."""
+    await asyncio.sleep(0.01)
+    return declarative.Paragraph(text=text)
+
+
+def _make_document(index: int) -> declarative.Document:
+    """Creates a document with async and conditional children."""
+    return declarative.Document(
+        sections=[
+            declarative.Section(
+                children=[
+                    fetch_paragraph(f"Participant {index}"),
+                    declarative.Paragraph(
+                        text="Hidden", condition=lambda: index % 2 == 1
+                    ),
+                    declarative.Paragraph(
+                        children=lambda: [fetch_paragraph("Never resolved")],
+                        condition=lambda: False,
+                    ),
+                ],
+            ),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_render_many_bytes() -> None:
+    """Test that documents are rendered to bytes in worker processes."""
+    documents = [_make_document(index) for index in range(4)]
+
+    results = {
+        index: data
+        async for index, data in declarative.render_many(documents, workers=2)
+    }
+
+    assert sorted(results) == [0, 1, 2, 3]
+    for index, data in results.items():
+        assert isinstance(data, bytes)
+        texts = [para.text for para in docx.Document(io.BytesIO(data)).paragraphs]
+        expected = [f"Participant {index}"] + (["Hidden"] if index % 2 else [])
+        assert texts == expected
+
+
+@pytest.mark.asyncio
+async def test_render_many_paths() -> None:
+    """Test that documents are saved to the output directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results = [
+            result
+            async for result in declarative.render_many(
+                (_make_document(index) for index in range(3)),
+                pathlib.Path(tmpdir) / "reports",
+                workers=1,
+            )
+        ]
+
+        assert sorted(results) == [
+            (index, pathlib.Path(tmpdir) / "reports" / f"{index}.docx")
+            for index in range(3)
+        ]
+        first = docx.Document(str(pathlib.Path(tmpdir) / "reports" / "0.docx"))
+        assert first.paragraphs[0].text == "Participant 0"
+
+
+@pytest.mark.asyncio
+async def test_render_many_keeps_documents() -> None:
+    """Test that conditions are frozen on a copy of the documents."""
+    documents = [_make_document(index) for index in range(2)]
+    conditions = [
+        [child.condition for child in doc.sections[0].children[1:]] for doc in documents
+    ]
+
+    async for _ in declarative.render_many(documents, workers=1):
+        pass
+
+    for doc, expected in zip(documents, conditions, strict=True):
+        children = doc.sections[0].children
+        assert [child.condition for child in children[1:]] == expected
+        assert callable(children[2].children)
+
+
+@pytest.mark.asyncio
+async def test_render_many_closes_disabled_coroutines() -> None:
+    """Test that coroutines of disabled children are closed, not leaked."""
+    coroutine = fetch_paragraph("Never awaited")
+    doc = declarative.Document(
+        sections=[
+            declarative.Section(
+                children=[
+                    declarative.Paragraph(text="Shown"),
+                    declarative.Paragraph(
+                        children=[coroutine],
+                        condition=lambda: False,
+                    ),
+                ],
+            ),
+        ],
+    )
+
+    results = [result async for result in declarative.render_many([doc], workers=1)]
+
+    assert len(results) == 1
+    assert inspect.getcoroutinestate(coroutine) == inspect.CORO_CLOSED
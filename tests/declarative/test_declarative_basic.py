@@ -90,3 +90,40 @@ async def test_document_metadata() -> None:
     assert docx_doc.core_properties.title == "Test Document"
     assert docx_doc.core_properties.author == "Test Author"
     assert docx_doc.core_properties.subject == "Testing"
+
+
+@pytest.mark.asyncio
+async def test_document_comments() -> None:
+    """Test creating a document with paragraph and text run comments."""
+    doc = declarative.Document(
+        sections=[
+            declarative.Section(
+                children=[
+                    declarative.Paragraph(
+                        text="Commented paragraph", comment_text="On paragraph"
+                    ),
+                    declarative.Paragraph(
+                        children=[
+                            declarative.TextRun(text="Plain "),
+                            declarative.TextRun(
+                                text="commented",
+                                comment_text="On run",
+                                comment_author="Reviewer",
+                            ),
+                        ]
+                    ),
+                ],
+            ),
+        ],
+        comment_author="Author",
+    )
+
+    docx_doc = await doc.to_docx()
+    comments = list(docx_doc.comments)
+
+    assert [(c.author, c.text) for c in comments] == [
+        ("Author", "On paragraph"),
+        ("Reviewer", "On run"),
+    ]
+    assert [c.comment_id for c in comments] == [0, 1]
+    assert docx_doc.paragraphs[1].text == "Plain commented"
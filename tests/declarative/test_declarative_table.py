@@ -2,6 +2,7 @@
 
 import pytest
 from docx import shared
+from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
 from docx.oxml.simpletypes import ST_Merge
 
@@ -688,3 +689,99 @@ async def test_table_cell_vertical_alignment_none_by_default() -> None:
     docx_doc = await doc.to_docx()
     tc_pr = docx_doc.tables[0].rows[0].cells[0]._tc.tcPr
     assert tc_pr is None or tc_pr.find(qn("w:vAlign")) is None
+
+
+@pytest.mark.asyncio
+async def test_data_table() -> None:
+    """Test that a DataTable formats its columns and writes header rows."""
+    doc = declarative.Document(
+        sections=[
+            declarative.Section(
+                children=[
+                    declarative.DataTable(
+                        columns=[
+                            ["Anxiety", "A & <B>", None],
+                            [1.234, float("nan"), 10],
+                            [1, 2, 3],
+                        ],
+                        formats=[None, ".1f", lambda value: f"#{value}"],
+                        header_rows=[["Scale", "Score & <5>", "Rank"]],
+                        repeat_header=True,
+                        missing="-",
+                        alignments=[None, "right", "center"],
+                        column_widths=[2880, 1440, 1440],
+                    ),
+                ],
+            ),
+        ],
+    )
+
+    docx_doc = await doc.to_docx()
+    tbl = docx_doc.tables[0]
+
+    assert [[cell.text for cell in row.cells] for row in tbl.rows] == [
+        ["Scale", "Score & <5>", "Rank"],
+        ["Anxiety", "1.2", "#1"],
+        ["A & <B>", "-", "#2"],
+        ["-", "10.0", "#3"],
+    ]
+    assert tbl.rows[0]._tr.trPr.find(qn("w:tblHeader")) is not None
+    assert tbl.rows[1]._tr.trPr is None
+    assert tbl.rows[1].cells[1].paragraphs[0].alignment == WD_ALIGN_PARAGRAPH.RIGHT
+    assert tbl.rows[1].cells[0].paragraphs[0].alignment is None
+    assert tbl.columns[0].width == shared.Twips(2880)
+    assert tbl.rows[1].cells[0].width == shared.Twips(2880)
+
+
+class NAType:
+    """Stands in for `pandas.NA`, whose truth value is ambiguous."""
+
+    def __bool__(self) -> bool:
+        """Raises, as comparisons with NA give NA."""
+        raise TypeError
+
+    def __ne__(self, other: object) -> "NAType":  # ty:ignore[invalid-method-override]
+        """Returns NA, as pandas does."""
+        return self
+
+
+@pytest.mark.asyncio
+async def test_data_table_missing_values_and_control_characters() -> None:
+    """Test that NA values are missing and XML-invalid characters dropped."""
+    doc = declarative.Document(
+        sections=[
+            declarative.Section(
+                children=[
+                    declarative.DataTable(
+                        columns=[[NAType(), 10**400, "Tab\tbell\x07 null\x00"]],
+                        header_rows=[["Score\x0b"]],
+                        missing="-",
+                    ),
+                ],
+            ),
+        ],
+    )
+
+    tbl = (await doc.to_docx()).tables[0]
+
+    assert [row.cells[0].text for row in tbl.rows] == [
+        "Score",
+        "-",
+        str(10**400),
+        "Tab\tbell null",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_data_table_column_lengths_mismatch_raises() -> None:
+    """Test that columns of different lengths raise ValueError."""
+    doc = declarative.Document(
+        sections=[
+            declarative.Section(
+                children=[declarative.DataTable(columns=[[1, 2], [1]])],
+            ),
+        ],
+    )
+
+    with pytest.raises(ValueError, match="same length"):
+        await doc.to_docx()
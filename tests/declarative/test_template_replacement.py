@@ -1,8 +1,10 @@
 """Tests for declarative template replacement functionality."""
 
+import io
 import pathlib
 import tempfile
 
+import docx
 import pytest
 
 from cmi_docx import declarative
@@ -422,3 +424,95 @@ async def test_declarative_template_paragraph_index_multiple_sections() -> None:
         assert result.paragraphs[2].text == "Section2 A"
         assert result.paragraphs[3].text == "Template Second"
         assert result.paragraphs[4].text == "Template Third"
+
+
+@pytest.mark.asyncio
+async def test_compiled_template_renders_independent_documents() -> None:
+    """Test that a compiled template renders many independent documents."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        template_path = pathlib.Path(tmpdir) / "template.docx"
+        template_doc = declarative.Document(
+            sections=[
+                declarative.Section(
+                    children=[
+                        declarative.Paragraph(
+                            children=[
+                                declarative.TextRun(text="Hello {{NA"),
+                                declarative.TextRun(text="ME}}, {{NAME}}!", bold=True),
+                            ]
+                        ),
+                        declarative.Paragraph(text="Age: {{AGE}}"),
+                    ],
+                    headers={
+                        "default": declarative.Header(
+                            children=[declarative.Paragraph(text="Report {{NAME}}")]
+                        )
+                    },
+                ),
+            ],
+        )
+        (await template_doc.to_docx()).save(str(template_path))
+        compiled = declarative.DocumentTemplate(
+            path=template_path,
+            replacements={"{{NAME}}": "Alice", "{{AGE}}": "25"},
+        ).compile()
+
+        first = await declarative.Document(sections=[]).to_docx(template=compiled)
+        second = compiled.render({"{{NAME}}": "Bob"})
+
+        assert first.paragraphs[0].text == "Hello Alice, Alice!"
+        assert first.paragraphs[1].text == "Age: 25"
+        assert first.sections[0].header.paragraphs[-1].text == "Report Alice"
+        assert second.paragraphs[0].text == "Hello Bob, Bob!"
+        assert second.paragraphs[1].text == "Age: {{AGE}}"
+        assert second.sections[0].header.paragraphs[-1].text == "Report Bob"
+        assert first.part.package is not second.part.package
+
+
+def test_compiled_template_rejects_unknown_needles() -> None:
+    """Test that rendering with a needle that was not compiled fails."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        template_path = pathlib.Path(tmpdir) / "template.docx"
+        docx.Document().save(str(template_path))
+        compiled = declarative.CompiledTemplate(
+            declarative.DocumentTemplate(path=template_path)
+        )
+
+        with pytest.raises(ValueError, match="not compiled"):
+            compiled.render({"{{NAME}}": "Alice"})
+
+
+def test_compiled_template_placeholder_with_tab() -> None:
+    """Test that placeholders containing tabs and padded texts are rendered."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        template_path = pathlib.Path(tmpdir) / "template.docx"
+        template_doc = docx.Document()
+        template_doc.add_paragraph("A\t{{TAB\tNEEDLE}} and {{NAME}}")
+        template_doc.save(str(template_path))
+        compiled = declarative.DocumentTemplate(
+            path=template_path,
+            replacements={"{{TAB\tNEEDLE}}": "tabbed", "{{NAME}}": " Alice "},
+        ).compile()
+
+        rendered = compiled.render()
+        buffer = io.BytesIO()
+        rendered.save(buffer)
+
+        assert rendered.paragraphs[0].text == "A\ttabbed and  Alice "
+        assert docx.Document(buffer).paragraphs[0].text == "A\ttabbed and  Alice "
+
+
+def test_template_fill_writes_filled_document() -> None:
+    """Test that filling a template writes a document with replacements."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        template_path = pathlib.Path(tmpdir) / "template.docx"
+        output_path = pathlib.Path(tmpdir) / "output.docx"
+        template_doc = docx.Document()
+        template_doc.add_paragraph("Hello {{NAME}}")
+        template_doc.save(str(template_path))
+
+        declarative.DocumentTemplate(
+            path=template_path, replacements={"{{NAME}}": "Alice"}
+        ).fill(output_path)
+
+        assert docx.Document(str(output_path)).paragraphs[0].text == "Hello Alice"
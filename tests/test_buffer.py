@@ -0,0 +1,90 @@
+"""Tests for the buffer module."""
+
+import docx
+import pytest
+
+from cmi_docx import buffer, comment, styles
+
+
+def test_buffer_interleaves_finds_and_edits() -> None:
+    """Test that forward-order edits use offsets of the current text."""
+    doc = docx.Document()
+    para = doc.add_paragraph("")
+    para.add_run("{{A}} and ")
+    para.add_run("{{B}}, {{A}}")
+
+    with buffer.ParagraphBuffer(para) as paragraph_buffer:
+        position = paragraph_buffer.find("{{")
+        while position != -1:
+            end = paragraph_buffer.find("}}", position) + 2
+            replacement = "alpha" if paragraph_buffer.text[position + 2] == "A" else "b"
+            paragraph_buffer.replace(position, end, replacement)
+            position = paragraph_buffer.find("{{", position + len(replacement))
+
+        assert paragraph_buffer.text == "alpha and b, alpha"
+        assert para.text == "{{A}} and {{B}}, {{A}}"
+
+    assert para.text == "alpha and b, alpha"
+    assert not paragraph_buffer.dirty
+
+
+def test_buffer_find_across_pieces() -> None:
+    """Test that finds match text spanning edited and original pieces."""
+    doc = docx.Document()
+    para = doc.add_paragraph("abcdef")
+    paragraph_buffer = buffer.ParagraphBuffer(para)
+
+    paragraph_buffer.replace(2, 3, "X")
+    paragraph_buffer.insert(4, "Y")
+
+    assert paragraph_buffer.find("bXd") == 1
+    assert paragraph_buffer.find("dYe", 2) == 3  # noqa: PLR2004
+    assert paragraph_buffer.find("bX", 2) == -1
+    assert paragraph_buffer.find("") == 0
+    assert paragraph_buffer.find("a", 8) == -1
+    assert paragraph_buffer.text == "abXdYef"
+
+
+def test_buffer_locate() -> None:
+    """Test that offsets map to the original runs until flushed."""
+    doc = docx.Document()
+    para = doc.add_paragraph("")
+    para.add_run("Hello ")
+    para.add_run("world")
+    paragraph_buffer = buffer.ParagraphBuffer(para)
+
+    paragraph_buffer.insert(6, "big ")
+
+    assert paragraph_buffer.locate(0) == (0, 0)
+    assert paragraph_buffer.locate(7) is None
+    assert paragraph_buffer.locate(11) == (1, 1)
+    with pytest.raises(IndexError):
+        paragraph_buffer.locate(15)
+
+
+def test_buffer_styles_and_comments() -> None:
+    """Test that styled inserts are written in order and comments are kept."""
+    doc = docx.Document()
+    para = doc.add_paragraph("")
+    para.add_run("Hello ")
+    commented = para.add_run("world")
+    comment.add_comment(doc, commented, "Reviewer", "Check this")
+
+    with buffer.ParagraphBuffer(para) as paragraph_buffer:
+        paragraph_buffer.delete(0, 6)
+        paragraph_buffer.insert(0, "Big", styles.RunStyle(bold=True))
+        paragraph_buffer.insert(3, " ")
+        paragraph_buffer.insert(paragraph_buffer.text.index("world"), "new ")
+
+    assert para.text == "Big new world"
+    assert [run.text for run in para.runs if run.bold] == ["Big"]
+    assert "commentRangeStart" in para._p.xml
+
+
+def test_buffer_rejects_invalid_span() -> None:
+    """Test that spans outside of the text raise."""
+    doc = docx.Document()
+    paragraph_buffer = buffer.ParagraphBuffer(doc.add_paragraph("short"))
+
+    with pytest.raises(ValueError, match="outside"):
+        paragraph_buffer.replace(3, 10, "")
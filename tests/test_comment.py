@@ -1,5 +1,7 @@
 """Tests for the comment module."""
 
+import io
+
 import docx
 from docx.opc import constants as docx_constants
 
@@ -131,3 +133,91 @@ def test_restore_comments_preserves_comment_references() -> None:
     assert comment_refs_before > 0
     assert comment_refs_after == comment_refs_before
     assert para.text == "Sample text with comment."
+
+
+def test_comment_batch_sequential_ids() -> None:
+    """Tests that a comment batch continues after existing comment IDs."""
+    document = docx.Document()
+    para = document.add_paragraph("Sample text.")
+    document.add_comment(para.runs, text="Native", author="Kenobi")
+    batch = comment.CommentBatch(document)
+
+    ids = [batch.add(para, "Grievous", f"Comment {index}") for index in range(3)]
+
+    assert ids == [1, 2, 3]
+    assert [c.text for c in document.comments] == [
+        "Native",
+        "Comment 0",
+        "Comment 1",
+        "Comment 2",
+    ]
+
+
+def test_comment_batch_ids_after_outside_changes() -> None:
+    """Tests that IDs stay unique when other code adds and removes comments."""
+    document = docx.Document()
+    para = document.add_paragraph("Sample text.")
+    batch = comment.CommentBatch(document)
+    batch.add(para, "Grievous", "First")
+    batch.add(para, "Grievous", "Second")
+
+    comments_element = document.part._comments_part.element
+    comments_element.remove(comments_element[0])
+    document.add_comment(para.runs, text="Native", author="Kenobi")
+    batch.add(para, "Grievous", "Third")
+
+    ids = [c.comment_id for c in document.comments]
+    assert len(set(ids)) == len(ids)
+
+
+def test_add_comment_to_loaded_document() -> None:
+    """Tests adding comments to a saved document that already has comments."""
+    document = docx.Document()
+    para = document.add_paragraph("Sample text.")
+    cmi_docx.add_comment(document, para, "Grievous", "First")
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    loaded = docx.Document(buffer)
+    cmi_docx.add_comment(loaded, loaded.paragraphs[0], "Kenobi", "Second")
+    loaded.save(buffer := io.BytesIO())
+
+    comments = list(docx.Document(buffer).comments)
+    assert [(c.author, c.text) for c in comments] == [
+        ("Grievous", "First"),
+        ("Kenobi", "Second"),
+    ]
+    assert len({c.comment_id for c in comments}) == len(comments)
+
+
+def test_add_comment_run_range_markup() -> None:
+    """Tests that the comment range surrounds the commented runs."""
+    document = docx.Document()
+    para = document.add_paragraph()
+    run_start = para.add_run("one")
+    run_end = para.add_run("two")
+
+    cmi_docx.add_comment(document, (run_start, run_end), "Grievous", "Message")
+
+    tags = [element.tag.split("}")[1] for element in para._element]
+    assert tags == ["commentRangeStart", "r", "r", "commentRangeEnd", "r"]
+    assert para.text == "onetwo"
+
+
+def test_comment_preserver_round_trip_many_comments() -> None:
+    """Tests that many comment ranges survive being stripped and restored."""
+    document = docx.Document()
+    para = document.add_paragraph()
+    runs = [para.add_run(f"run{index} ") for index in range(20)]
+    batch = comment.CommentBatch(document)
+    for index in range(0, 20, 2):
+        batch.add((runs[index], runs[index + 1]), "Grievous", f"Comment {index}")
+    preserver = comment.CommentPreserver(para._element)
+    expected = preserver.extract_comments()
+
+    preserver.restore_comments(expected)
+    actual = preserver.extract_comments()
+
+    assert len(expected) == 10  # noqa: PLR2004
+    assert actual == expected
+    assert len(para._element.xpath(".//w:commentReference")) == len(expected)
@@ -3,7 +3,7 @@
 import docx
 import pytest
 
-from cmi_docx import document, styles
+from cmi_docx import document, matching, styles
 
 
 def test_find_in_paragraphs() -> None:
@@ -36,6 +36,71 @@ def test_find_in_runs() -> None:
     assert actual[2].character_indices == (14, 19)
 
 
+def test_iter_find_in_paragraphs_skips_empty() -> None:
+    """Test that lazily finding in paragraphs skips paragraphs without matches."""
+    doc = docx.Document()
+    doc.add_paragraph("Nothing here.")
+    doc.add_paragraph("Hello, world!")
+    extend_document = document.ExtendDocument(doc)
+
+    actual = list(extend_document.iter_find_in_paragraphs("Hello"))
+
+    assert len(actual) == 1
+    assert actual[0].paragraph.text == "Hello, world!"
+    assert actual[0].character_indices == [(0, 5)]
+
+
+def test_iter_find_in_runs_is_lazy() -> None:
+    """Test that lazily finding in runs does not visit later paragraphs."""
+    doc = docx.Document()
+    doc.add_paragraph("Hello, world!")
+    doc.add_paragraph("Hello, there!")
+    extend_document = document.ExtendDocument(doc)
+    visited = []
+
+    def iter_paragraphs():  # noqa: ANN202
+        for para in document.ExtendDocument(doc).iter_paragraphs():
+            visited.append(para)
+            yield para
+
+    extend_document.iter_paragraphs = iter_paragraphs  # ty:ignore[invalid-assignment]
+    first = extend_document.first_match("Hello")
+
+    assert first is not None
+    assert first.paragraph.text == "Hello, world!"
+    assert len(visited) == 1
+
+
+@pytest.mark.parametrize(
+    ("needle", "expected"),
+    [
+        ("world", True),
+        ("moon", False),
+        ("", False),
+    ],
+)
+def test_any_match(needle: str, expected: bool) -> None:  # noqa: FBT001
+    """Test checking whether a text occurs in the document."""
+    doc = docx.Document()
+    doc.add_paragraph("Hello, world!")
+    extend_document = document.ExtendDocument(doc)
+
+    assert extend_document.any_match(needle) is expected
+    assert (extend_document.first_match(needle) is not None) is expected
+
+
+def test_any_match_options() -> None:
+    """Test checking whether a text occurs with matching options."""
+    doc = docx.Document()
+    doc.add_paragraph("Hello, World!")
+    extend_document = document.ExtendDocument(doc)
+    options = matching.MatchOptions(casefold=True)
+
+    assert not extend_document.any_match("hello, world")
+    assert extend_document.any_match("hello, world", options=options)
+    assert not extend_document.any_match("hello, moon", options=options)
+
+
 @pytest.mark.parametrize(
     ("runs", "needle", "replace", "expected"),
     [
@@ -107,6 +172,68 @@ def test_replace_with_style() -> None:
     assert doc.paragraphs[0].runs[1].text == "Goodbye"
 
 
+@pytest.mark.parametrize(
+    ("runs", "replacements", "expected"),
+    [
+        (
+            ["Hello {{NAME}}, you are {{AGE}}."],
+            {"{{NAME}}": "Alice", "{{AGE}}": "25"},
+            "Hello Alice, you are 25.",
+        ),
+        (
+            ["Hello {{", "NAME}} and {{NAME}}", "!"],
+            {"{{NAME}}": "Bob"},
+            "Hello Bob and Bob!",
+        ),
+        (
+            ["{{A}}{{AB}}"],
+            {"{{A}}": "short", "{{AB}}": "long"},
+            "shortlong",
+        ),
+        (
+            ["{{A}} {{B}}"],
+            {"{{A}}": "{{B}}", "{{B}}": "b"},
+            "{{B}} b",
+        ),
+        (
+            ["Nothing to see."],
+            {"": "Nonsense", "{{MISSING}}": "Nonsense"},
+            "Nothing to see.",
+        ),
+    ],
+)
+def test_replace_many(
+    runs: list[str], replacements: dict[str, str], expected: str
+) -> None:
+    """Test replacing multiple needles in a single pass."""
+    doc = docx.Document()
+    paragraph = doc.add_paragraph(runs[0])
+    for run in runs[1:]:
+        paragraph.add_run(run)
+    extend_document = document.ExtendDocument(doc)
+
+    extend_document.replace_many(replacements)
+
+    assert doc.paragraphs[0].text == expected
+
+
+def test_replace_many_with_style() -> None:
+    """Test replacing multiple needles with a style."""
+    doc = docx.Document()
+    doc.add_paragraph("{{A}} and {{B}}")
+    extend_document = document.ExtendDocument(doc)
+
+    extend_document.replace_many(
+        {"{{A}}": "first", "{{B}}": "second"}, styles.RunStyle(bold=True)
+    )
+
+    assert doc.paragraphs[0].text == "first and second"
+    assert [run.text for run in doc.paragraphs[0].runs if run.bold] == [
+        "first",
+        "second",
+    ]
+
+
 def test_insert_paragraph_by_object() -> None:
     """Test inserting a paragraph into a document."""
     doc = docx.Document()
@@ -134,3 +261,237 @@ def test_insert_paragraph_by_text() -> None:
     assert doc.paragraphs[0].text == "Hello, world!"
     assert doc.paragraphs[1].text == "Maintain, world!"
     assert doc.paragraphs[2].text == "Goodbye, world!"
+
+
+def test_cached_document_invalidates_edited_paragraph() -> None:
+    """Test that edits through a cached document refresh only that paragraph."""
+    doc = docx.Document()
+    doc.add_paragraph("Hello, world!")
+    doc.add_paragraph("Hello, there!")
+    extend_document = document.ExtendDocument(doc, cached=True)
+    extend_document.find_in_runs("Hello")
+    paragraph_cache = extend_document._paragraph_cache
+    assert paragraph_cache is not None
+    untouched_entry = paragraph_cache.entry(doc.paragraphs[1])
+
+    extend_document.find_in_runs("world")[0].replace("moon")
+
+    assert [find.run_indices for find in extend_document.find_in_runs("moon")] == [
+        (0, 0)
+    ]
+    assert extend_document._paragraph_cache is paragraph_cache
+    assert paragraph_cache.entry(doc.paragraphs[1]) is untouched_entry
+    assert extend_document.find_in_paragraphs("Hello")[0].character_indices == [(0, 5)]
+
+
+def test_cached_document_replaces_twice() -> None:
+    """Test that a replacement invalidates a freshly built cache."""
+    doc = docx.Document()
+    doc.add_paragraph("hello world")
+    extend_document = document.ExtendDocument(doc, cached=True)
+
+    extend_document.replace("hello", "bye")
+    extend_document.replace("world", "X")
+
+    assert doc.paragraphs[0].text == "bye X"
+
+
+def test_cached_document_ignores_other_documents() -> None:
+    """Test that edits to another document leave a cache untouched."""
+    documents = [docx.Document(), docx.Document()]
+    for doc in documents:
+        doc.add_paragraph("Hello, world!")
+    first, second = (document.ExtendDocument(doc, cached=True) for doc in documents)
+    second.find_in_runs("Hello")
+    paragraph_cache = second._paragraph_cache
+    assert paragraph_cache is not None
+    entry = paragraph_cache.entry(documents[1].paragraphs[0])
+
+    first.find_in_runs("world")[0].replace("moon")
+
+    assert paragraph_cache.entry(documents[1].paragraphs[0]) is entry
+    assert documents[0].paragraphs[0].text == "Hello, moon!"
+
+
+def test_cached_document_cleared_on_insert() -> None:
+    """Test that inserting a paragraph drops the cached paragraph list."""
+    doc = docx.Document()
+    doc.add_paragraph("Hello, world!")
+    extend_document = document.ExtendDocument(doc, cached=True)
+    extend_document.find_in_runs("Hello")
+
+    extend_document.insert_paragraph_by_text(0, "Hello, there!")
+
+    assert len(extend_document.find_in_runs("Hello")) == 2  # noqa: PLR2004
+
+
+def test_replace_regex_callback() -> None:
+    """Test replacing a family of tokens with a callback."""
+    doc = docx.Document()
+    paragraph = doc.add_paragraph("Age: {{patient.")
+    paragraph.add_run("age}}, name: {{patient.name}}, {{unknown}}")
+    extend_document = document.ExtendDocument(doc)
+    data = {"age": "42", "name": "Jane"}
+
+    extend_document.replace_regex(
+        r"\{\{patient\.(\w+)\}\}", lambda match: data[match.group(1)]
+    )
+
+    assert doc.paragraphs[0].text == "Age: 42, name: Jane, {{unknown}}"
+
+
+def test_replace_regex_string_with_groups() -> None:
+    """Test replacing with group references."""
+    doc = docx.Document()
+    doc.add_paragraph("2024-01-31")
+    extend_document = document.ExtendDocument(doc)
+
+    extend_document.replace_regex(r"(\d+)-(\d+)-(\d+)", r"\3/\2/\1")
+
+    assert doc.paragraphs[0].text == "31/01/2024"
+
+
+def test_replace_regex_callback_style() -> None:
+    """Test that a callback can style each replacement."""
+    doc = docx.Document()
+    doc.add_paragraph("{{bold}} and {{plain}}")
+    extend_document = document.ExtendDocument(doc)
+
+    extend_document.replace_regex(
+        r"\{\{(\w+)\}\}",
+        lambda match: (
+            match.group(1),
+            styles.RunStyle(bold=True) if match.group(1) == "bold" else None,
+        ),
+    )
+
+    assert doc.paragraphs[0].text == "bold and plain"
+    assert [run.text for run in doc.paragraphs[0].runs if run.bold] == ["bold"]
+
+
+def test_all_paragraphs_merged_and_nested_cells() -> None:
+    """Test that merged cells are visited once and nested tables are included."""
+    doc = docx.Document()
+    table = doc.add_table(rows=1, cols=3)
+    merged = table.cell(0, 0).merge(table.cell(0, 1))
+    merged.paragraphs[0].text = "{{MERGED}}"
+    nested = table.cell(0, 2).add_table(rows=1, cols=1)
+    nested.cell(0, 0).paragraphs[0].text = "{{NESTED}}"
+    extend_document = document.ExtendDocument(doc)
+
+    texts = [para.text for para in extend_document.all_paragraphs]
+
+    assert texts.count("{{MERGED}}") == 1
+    assert texts.count("{{NESTED}}") == 1
+
+
+def test_all_paragraphs_headers_and_footers() -> None:
+    """Test that each header part is visited once and linked ones are skipped."""
+    doc = docx.Document()
+    doc.sections[0].header.paragraphs[0].text = "{{HEADER}}"
+    doc.sections[0].first_page_header.paragraphs[0].text = "{{FIRST}}"
+    doc.add_section()
+    extend_document = document.ExtendDocument(doc)
+
+    texts = [para.text for para in extend_document.all_paragraphs]
+
+    assert texts.count("{{HEADER}}") == 1
+    assert texts.count("{{FIRST}}") == 1
+    assert doc.sections[1].header.is_linked_to_previous
+    assert doc.sections[0].footer.is_linked_to_previous
+
+
+def test_normalize_runs() -> None:
+    """Test that runs are merged in all paragraphs of a document."""
+    doc = docx.Document()
+    for _ in range(2):
+        para = doc.add_paragraph("{{")
+        para.add_run("NAME")
+        para.add_run("}}")
+    extend_document = document.ExtendDocument(doc, cached=True)
+
+    removed = extend_document.normalize_runs()
+    run_counts = [len(para.runs) for para in doc.paragraphs]
+    extend_document.replace("{{NAME}}", "Jane")
+
+    assert removed == 4  # noqa: PLR2004
+    assert run_counts == [1, 1]
+    assert [para.text for para in doc.paragraphs] == ["Jane", "Jane"]
+
+
+def test_scan_placeholders() -> None:
+    """Test that placeholders are found with their locations in one pass."""
+    doc = docx.Document()
+    doc.add_paragraph("Dear {{NAME}},")
+    para = doc.add_paragraph("Score: {{")
+    para.add_run("SCORE}} for {{NAME}}")
+    doc.add_table(rows=1, cols=1).cell(0, 0).paragraphs[0].text = "{{SCORE}}"
+    header = doc.sections[0].header
+    header.paragraphs[0].text = "{{NAME}}"
+
+    placeholders = document.ExtendDocument(doc).scan_placeholders()
+
+    assert sorted(placeholders) == ["{{NAME}}", "{{SCORE}}"]
+    assert [
+        (location.part, location.paragraph_index)
+        for location in placeholders["{{NAME}}"]
+    ] == [(doc.part, 0), (doc.part, 1), (header.part, 0)]
+    split = placeholders["{{SCORE}}"][0].run_find
+    assert split.run_indices == (0, 1)
+    assert split.character_indices == (7, 7)
+    assert placeholders["{{SCORE}}"][1].paragraph_index == 2  # noqa: PLR2004
+
+    split.replace("99")
+    assert para.text == "Score: 99 for {{NAME}}"
+
+
+def test_replace_with_match_options() -> None:
+    """Test that all variants of a needle are replaced in one pass."""
+    doc = docx.Document()
+    doc.add_paragraph("Don\u2019t\u00a0Know")
+    para = doc.add_paragraph("don't ")
+    para.add_run("KNOW")
+    doc.add_paragraph("Dont know")
+    extend_document = document.ExtendDocument(doc, cached=True)
+    options = matching.MatchOptions(casefold=True, normalize=True, whitespace=True)
+
+    assert len(extend_document.find_in_runs("don't know", options=options)) == 2  # noqa: PLR2004
+    extend_document.replace("don't know", "unknown", options=options)
+
+    assert [para.text for para in doc.paragraphs] == [
+        "unknown",
+        "unknown",
+        "Dont know",
+    ]
+
+
+def test_replace_with_match_options_keeps_whole_characters() -> None:
+    """Test that part of a multi-character fold is never replaced."""
+    doc = docx.Document()
+    doc.add_paragraph("Stra\u00dfe")
+    extend_document = document.ExtendDocument(doc)
+    options = matching.MatchOptions(casefold=True)
+
+    extend_document.replace("s", "ZZ", options=options)
+
+    assert doc.paragraphs[0].text == "ZZtra\u00dfe"
+
+
+def test_find_results() -> None:
+    """Test that compact results match find_in_runs."""
+    doc = docx.Document()
+    doc.add_paragraph("Hello, world, Hello!")
+    para = doc.add_paragraph("He")
+    para.add_run("llo")
+    extend_document = document.ExtendDocument(doc)
+
+    results = extend_document.find_results("Hello")
+
+    assert [
+        (result.paragraph.text, result.run_indices, result.character_indices)
+        for result in results
+    ] == [
+        (result.paragraph.text, result.run_indices, result.character_indices)
+        for result in extend_document.find_in_runs("Hello")
+    ]
+    assert len(results) == 3  # noqa: PLR2004
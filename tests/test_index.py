@@ -0,0 +1,53 @@
+"""Tests for the index module."""
+
+import docx
+
+from cmi_docx import document
+
+
+def _build_document() -> docx.document.Document:
+    """Builds a document with medication names in the body and a table."""
+    doc = docx.Document()
+    doc.add_paragraph("Prescribed sertraline 50 mg; sertraline was tolerated.")
+    doc.add_paragraph("No sertralinex here, but blood pressure was high.")
+    doc.add_table(rows=1, cols=1).cell(0, 0).text = "Blood pressure: high blood"
+    return doc
+
+
+def test_find_word() -> None:
+    """Test that words are found as whole words only."""
+    doc = _build_document()
+    index = document.ExtendDocument(doc).build_index()
+
+    results = index.find("sertraline")
+
+    assert len(results) == 1
+    assert results[0].paragraph.text == doc.paragraphs[0].text
+    assert results[0].character_indices == [(11, 21), (29, 39)]
+    assert index.find("sertra") == []
+    assert index.count("sertraline") == 2  # noqa: PLR2004
+
+
+def test_find_phrase() -> None:
+    """Test that phrases are verified against the paragraph texts."""
+    index = document.ExtendDocument(_build_document()).build_index()
+
+    results = index.find("blood pressure")
+    assert [result.character_indices for result in results] == [[(25, 39)]]
+    assert [result.character_indices for result in index.find("high blood")] == [
+        [(16, 26)]
+    ]
+    assert index.find("pressure was low") == []
+    assert [result.character_indices for result in index.find(": ")] == [[(14, 16)]]
+
+
+def test_find_prefix() -> None:
+    """Test that prefix queries return the whole matching words."""
+    index = document.ExtendDocument(_build_document()).build_index()
+
+    results = index.find_prefix("sertra")
+
+    assert [result.character_indices for result in results] == [
+        [(11, 21), (29, 39)],
+        [(3, 14)],
+    ]
@@ -0,0 +1,64 @@
+"""Tests for the matching module."""
+
+from cmi_docx import matching
+
+
+def test_fold_maps_to_original_offsets() -> None:
+    """Test that matches in the folded text map back to the original text."""
+    text = "Patient\u00a0 said \u201cSTRASSE\u201d, straße"
+    options = matching.MatchOptions(casefold=True, normalize=True, whitespace=True)
+
+    folded = matching.fold(text, options)
+    spans = folded.find(matching.fold_needle('"Strasse"', options))
+
+    assert folded.text == 'patient said "strasse", strasse'
+    assert [text[start:end] for start, end in spans] == ["\u201cSTRASSE\u201d"]
+    assert [
+        text[start:end]
+        for start, end in folded.find(matching.fold_needle("T S", options))
+    ] == ["t\u00a0 s"]
+    assert [
+        text[start:end]
+        for start, end in folded.find(matching.fold_needle("SSE", options))
+    ] == ["SSE", "ße"]
+
+
+def test_fold_options_are_independent() -> None:
+    """Test that each option only applies its own folding."""
+    text = "A\u00a0\u2019b"
+
+    assert (
+        matching.fold(text, matching.MatchOptions(casefold=True)).text == text.lower()
+    )
+    assert matching.fold(text, matching.MatchOptions(normalize=True)).text == "A 'b"
+    assert (
+        matching.fold(text, matching.MatchOptions(whitespace=True)).text == "A \u2019b"
+    )
+
+
+def test_fold_composes_combining_marks() -> None:
+    """Test that decomposed and precomposed characters match each other."""
+    text = "Cafe\u0301 and caf\u00e9"
+
+    for casefold in [False, True]:
+        options = matching.MatchOptions(casefold=casefold, normalize=True)
+        folded = matching.fold(text, options)
+
+        for needle in ["cafe\u0301", "caf\u00e9"]:
+            spans = folded.find(matching.fold_needle(needle, options))
+
+            assert [text[start:end] for start, end in spans] == [
+                "Cafe\u0301"
+            ] * casefold + ["caf\u00e9"]
+
+
+def test_fold_skips_partial_characters() -> None:
+    """Test that matches within a multi-character fold are skipped."""
+    text = "Stra\u00dfe"
+    options = matching.MatchOptions(casefold=True)
+    folded = matching.fold(text, options)
+
+    assert folded.find(matching.fold_needle("s", options)) == [(0, 1)]
+    assert folded.find(matching.fold_needle("ss", options)) == [(4, 5)]
+    assert folded.find(matching.fold_needle("sse", options)) == [(4, 6)]
+    assert folded.find(matching.fold_needle("as", options)) == []
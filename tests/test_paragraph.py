@@ -2,9 +2,14 @@
 
 import docx
 import pytest
+from docx import oxml
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_COLOR_INDEX
+from docx.oxml import ns
+from docx.shared import Pt
 from docx.text import paragraph as docx_paragraph
 
-from cmi_docx import paragraph, styles
+import cmi_docx
+from cmi_docx import comment, paragraph, styles
 
 
 @pytest.fixture
@@ -195,3 +200,137 @@ def test_replace_between_end_run() -> None:
     extend_paragraph.replace_between(8, 16, "Athens!")
 
     assert para.text == "This is Athens!"
+
+
+def test_replace_between_end_of_text() -> None:
+    """Test inserting text at the end of the paragraph."""
+    document = docx.Document()
+    para = document.add_paragraph("This is")
+    extend_paragraph = paragraph.ExtendParagraph(para)
+
+    extend_paragraph.replace_between(7, 7, " Sparta!")
+
+    assert para.text == "This is Sparta!"
+
+
+def test_apply_edits_multiple_spans() -> None:
+    """Test applying edits within one run and across runs."""
+    document = docx.Document()
+    para = document.add_paragraph("This ")
+    para.add_run("is")
+    para.add_run(" Sparta!")
+    extend_paragraph = paragraph.ExtendParagraph(para)
+
+    extend_paragraph.apply_edits(
+        [
+            (8, 14, "Athens", styles.RunStyle(bold=True)),
+            (0, 1, "W"),
+            (2, 7, "at was"),
+        ]
+    )
+
+    assert para.text == "What was Athens!"
+    assert [run.text for run in para.runs if run.bold] == ["Athens"]
+
+
+def test_apply_edits_keeps_run_properties() -> None:
+    """Test that unstyled edits keep properties a RunStyle cannot express."""
+    document = docx.Document()
+    para = document.add_paragraph()
+    formatted = para.add_run("Hello {{NAME}}!")
+    formatted.font.name = "Courier New"
+    formatted.font.highlight_color = WD_COLOR_INDEX.YELLOW
+    extend_paragraph = paragraph.ExtendParagraph(para)
+
+    extend_paragraph.apply_edits([(6, 14, "Jane")])
+
+    assert para.text == "Hello Jane!"
+    assert [run.font.name for run in para.runs] == ["Courier New"] * 3
+    assert [run.font.highlight_color for run in para.runs] == [
+        WD_COLOR_INDEX.YELLOW
+    ] * 3
+
+
+def test_apply_edits_preserves_comments() -> None:
+    """Test that comments are kept around text edited in one batch."""
+    document = docx.Document()
+    para = document.add_paragraph("alpha beta gamma")
+    cmi_docx.add_comment(document, para, "Grievous", "Ah, General Kenobi.")
+    extend_paragraph = paragraph.ExtendParagraph(para)
+
+    extend_paragraph.apply_edits([(0, 5, "a"), (11, 16, "g")])
+    comments = comment.CommentPreserver(para._element).extract_comments()
+
+    assert para.text == "a beta g"
+    assert len(comments) == 1
+    assert comments[0].start_index == 0
+    assert comments[0].end_index == len(para.text)
+
+
+def test_apply_edits_overlapping() -> None:
+    """Test that overlapping edits are rejected."""
+    document = docx.Document()
+    para = document.add_paragraph("This is a sample paragraph.")
+    extend_paragraph = paragraph.ExtendParagraph(para)
+
+    with pytest.raises(ValueError, match="overlap"):
+        extend_paragraph.apply_edits([(0, 5, "a"), (4, 6, "b")])
+    assert para.text == "This is a sample paragraph."
+
+
+def test_normalize_runs_merges_split_placeholder() -> None:
+    """Test that runs split by spell-check and revision IDs are merged."""
+    document = docx.Document()
+    para = document.add_paragraph("")
+    for text in ("Hello {{", "NA", "ME", "}}"):
+        para.add_run(text)._r.set(ns.qn("w:rsidR"), text.encode().hex())
+    para.runs[1]._r.addprevious(oxml.OxmlElement("w:proofErr"))
+    para.add_run("")
+    para.add_run("!").bold = True
+
+    removed = paragraph.ExtendParagraph(para).normalize_runs()
+
+    assert removed == 4  # noqa: PLR2004
+    assert [run.text for run in para.runs] == ["Hello {{NAME}}", "!"]
+    assert len(para.runs[0]._r.findall(ns.qn("w:t"))) == 1
+
+
+def test_normalize_runs_respects_comments() -> None:
+    """Test that runs are not merged across comment boundaries."""
+    document = docx.Document()
+    para = document.add_paragraph("")
+    para.add_run("Hello ")
+    commented = para.add_run("world")
+    para.add_run("!")
+    comment.add_comment(document, commented, "Reviewer", "Check this")
+
+    paragraph.ExtendParagraph(para).normalize_runs()
+
+    assert [run.text for run in para.runs if run.text] == ["Hello ", "world", "!"]
+    comments = comment.CommentPreserver(para._element).extract_comments()
+    assert (comments[0].start_index, comments[0].end_index) == (6, 11)
+
+
+def test_format_paragraphs() -> None:
+    """Test that a style is applied to every paragraph and run."""
+    document = docx.Document()
+    first = document.add_paragraph("Hello", style="Heading 1")
+    first.paragraph_format.space_before = Pt(6)
+    second = document.add_paragraph("world")
+    second.add_run("!")
+
+    paragraph.format_paragraphs(
+        [first, second],
+        styles.ParagraphStyle(
+            bold=True,
+            line_spacing=1.5,
+            alignment=WD_ALIGN_PARAGRAPH.CENTER,
+        ),
+    )
+
+    for para in (first, second):
+        assert para.alignment == WD_ALIGN_PARAGRAPH.CENTER
+        assert para.paragraph_format.line_spacing == 1.5  # noqa: PLR2004
+        assert all(run.bold for run in para.runs)
+    assert first.style.name == "Heading 1"
+    assert first.paragraph_format.space_before == Pt(6)
@@ -117,3 +117,114 @@ def test_extend_run_format() -> None:
     assert paragraph_run.underline
     assert paragraph_run.font.superscript
     assert paragraph_run.font.color.rgb == (1, 0, 0)
+
+
+def test_paragraph_runs_insert() -> None:
+    """Test that inserting runs keeps the cached run list in sync."""
+    document = docx.Document()
+    paragraph = document.add_paragraph("Hello")
+    paragraph.add_run("world")
+    paragraph_runs = run.ParagraphRuns(paragraph)
+
+    paragraph_runs.insert(1, ", ")
+    paragraph_runs.insert(len(paragraph_runs), "!")
+    paragraph_runs.insert_after(0, "")
+
+    assert [r.text for r in paragraph_runs] == [r.text for r in paragraph.runs]
+    assert paragraph.text == "Hello, world!"
+
+
+def test_find_runs_share_paragraph_runs() -> None:
+    """Test that replacing with style through shared runs keeps indices valid."""
+    document = docx.Document()
+    paragraph = document.add_paragraph("a {{X}} b ")
+    paragraph.add_run("{{X}} c")
+    paragraph_runs = run.ParagraphRuns(paragraph)
+    find_runs = [
+        run.FindRun(paragraph, (0, 0), (2, 7), paragraph_runs),
+        run.FindRun(paragraph, (1, 1), (0, 5), paragraph_runs),
+    ]
+
+    for find_run in reversed(find_runs):
+        find_run.replace("Y", styles.RunStyle(bold=True))
+
+    assert paragraph.text == "a Y b Y c"
+    assert [r.text for r in paragraph.runs if r.bold] == ["Y", "Y"]
+
+
+def test_find_results() -> None:
+    """Test that compact results produce FindRun views and replace safely."""
+    document = docx.Document()
+    first = document.add_paragraph("a-b-a")
+    second = document.add_paragraph("x")
+    second.add_run("a")
+    results = run.FindResults()
+    results.append(first, (0, 0), (0, 1))
+    results.append(second, (1, 1), (0, 1))
+    results.append(first, (0, 0), (4, 5))
+
+    results.sort(reverse=True)
+
+    assert len(results) == 3  # noqa: PLR2004
+    assert [
+        (find_run.paragraph.text, find_run.character_indices) for find_run in results
+    ] == [("xa", (0, 1)), ("a-b-a", (4, 5)), ("a-b-a", (0, 1))]
+    assert results[1].paragraph_runs is results[2].paragraph_runs
+
+    results.replace("c", styles.RunStyle(bold=True))
+
+    assert first.text == "c-b-c"
+    assert second.text == "xc"
+
+
+def test_find_run_has_slots() -> None:
+    """Test that FindRun does not allocate an instance dictionary."""
+    document = docx.Document()
+    find_run = run.FindRun(document.add_paragraph("a"), (0, 0), (0, 1))
+
+    with pytest.raises(AttributeError):
+        find_run.extra = 1  # ty:ignore[unresolved-attribute]
+
+
+def test_extend_run_format_keeps_other_properties() -> None:
+    """Test that formatting replaces only the properties set by the style."""
+    document = docx.Document()
+    paragraph_run = document.add_paragraph().add_run("Hello")
+    paragraph_run.italic = True
+    paragraph_run.font.superscript = True
+    paragraph_run.font.name = "Arial"
+
+    run.ExtendRun(paragraph_run).format(
+        styles.RunStyle(bold=True, superscript=False, font_size=10)
+    )
+
+    assert paragraph_run.bold
+    assert paragraph_run.italic
+    assert paragraph_run.font.superscript is None
+    assert paragraph_run.font.name == "Arial"
+    assert paragraph_run.font.size.pt == 10  # noqa: PLR2004
+
+
+def test_extend_run_get_format_round_trip() -> None:
+    """Test that get_format returns a style that format reproduces."""
+    document = docx.Document()
+    paragraph = document.add_paragraph()
+    source = paragraph.add_run("Hello")
+    style = styles.RunStyle(
+        bold=False, underline=True, subscript=True, font_size=12, font_rgb=(1, 2, 3)
+    )
+    run.ExtendRun(source).format(style)
+
+    copied_style = run.ExtendRun(source).get_format()
+    target = paragraph.add_run("world")
+    run.ExtendRun(target).format(copied_style)
+
+    assert copied_style == styles.RunStyle(
+        bold=False,
+        underline=True,
+        superscript=False,
+        subscript=True,
+        font_size=12,
+        font_rgb=(1, 2, 3),
+    )
+    assert target._r.rPr.xml == source._r.rPr.xml
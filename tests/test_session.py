@@ -0,0 +1,84 @@
+"""Tests for the session module."""
+
+import docx
+import pytest
+
+from cmi_docx import document, styles
+
+
+def test_edit_session_defers_edits() -> None:
+    """Test that edits are applied when the session exits."""
+    doc = docx.Document()
+    doc.add_paragraph("Hello {{NAME}}, you are {{AGE}}.")
+    doc.add_paragraph("No placeholders here.")
+    extend_document = document.ExtendDocument(doc)
+
+    with extend_document.edit_session() as session:
+        session.replace("{{NAME}}", "Jane", styles.RunStyle(bold=True))
+        session.replace_many({"{{AGE}}": "42"})
+
+        assert doc.paragraphs[0].text == "Hello {{NAME}}, you are {{AGE}}."
+        assert [para.text for para in session.dirty_paragraphs] == [
+            "Hello {{NAME}}, you are {{AGE}}."
+        ]
+        assert session.any_match("Jane")
+        assert not session.any_match("")
+
+    assert doc.paragraphs[0].text == "Hello Jane, you are 42."
+    assert [run.text for run in doc.paragraphs[0].runs if run.bold] == ["Jane"]
+    assert doc.paragraphs[1].text == "No placeholders here."
+
+
+def test_edit_session_matches_sequential_replacements() -> None:
+    """Test that chained edits give the same result as sequential replaces."""
+    texts = ["{{A}} and {{B}}", "{{B}}{{A}}", "plain", "{{C}} {{A}}"]
+    replacements = [
+        ("{{A}}", "alpha"),
+        ("{{C}} ", ""),
+        ("ha and", "ha or"),
+        ("{{B}}", "beta"),
+        ("taal", "ta-al"),
+    ]
+    expected_doc = docx.Document()
+    session_doc = docx.Document()
+    for text in texts:
+        expected_doc.add_paragraph(text)
+        session_doc.add_paragraph(text)
+
+    for needle, replace in replacements:
+        document.ExtendDocument(expected_doc).replace(needle, replace)
+    with document.ExtendDocument(session_doc).edit_session() as session:
+        for needle, replace in replacements:
+            session.replace(needle, replace)
+
+    expected = [para.text for para in expected_doc.paragraphs]
+    assert [para.text for para in session_doc.paragraphs] == expected
+    assert expected == ["alpha or beta", "beta-alpha", "plain", "alpha"]
+
+
+def test_edit_session_discards_edits_on_error() -> None:
+    """Test that queued edits are not applied if the block raises."""
+    doc = docx.Document()
+    doc.add_paragraph("Hello {{NAME}}")
+
+    def edit() -> None:
+        with document.ExtendDocument(doc).edit_session() as session:
+            session.replace("{{NAME}}", "Jane")
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        edit()
+
+    assert doc.paragraphs[0].text == "Hello {{NAME}}"
+
+
+def test_edit_session_keeps_font_name() -> None:
+    """Test that unstyled replacements keep the run's font name."""
+    doc = docx.Document()
+    doc.add_paragraph().add_run("Hello {{NAME}}!").font.name = "Courier New"
+
+    with document.ExtendDocument(doc).edit_session() as session:
+        session.replace("{{NAME}}", "Jane")
+
+    assert doc.paragraphs[0].text == "Hello Jane!"
+    assert {run.font.name for run in doc.paragraphs[0].runs} == {"Courier New"}
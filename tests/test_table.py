@@ -1,8 +1,14 @@
 """Test for utility functions."""
 
+import array
+
+import docx
 import pytest
+from docx import oxml
+from docx import table as docx_table
+from docx.oxml import ns
 
-from cmi_docx import table
+from cmi_docx import styles, table
 
 
 @pytest.mark.parametrize(
@@ -31,3 +37,156 @@ def test_rgb_to_hex(
 ) -> None:
     """Tests converting RGB to hex."""
     assert table.rgb_to_hex(*rgb) == hexadecimal
+
+
+def _fills(tbl: docx_table.Table) -> list[list[str | None]]:
+    """Reads the shading of each cell element, row by row."""
+    return [
+        [
+            next(iter(tc.xpath("./w:tcPr/w:shd/@w:fill")), None)
+            for tc in row_element.tc_lst
+        ]
+        for row_element in tbl._tbl.tr_lst
+    ]
+
+
+def test_format_range() -> None:
+    """Tests formatting a block of cells."""
+    tbl = docx.Document().add_table(rows=3, cols=3)
+
+    table.ExtendTable(tbl).format_range(
+        styles.CellStyle(background_rgb=(255, 0, 0)),
+        rows=slice(1, None),
+        cols=slice(0, 2),
+    )
+
+    assert _fills(tbl) == [
+        [None, None, None],
+        ["FF0000", "FF0000", None],
+        ["FF0000", "FF0000", None],
+    ]
+
+
+def test_format_range_merged_cells() -> None:
+    """Tests that merged cells are selected by their top-left grid position."""
+    tbl = docx.Document().add_table(rows=3, cols=3)
+    tbl.cell(0, 0).merge(tbl.cell(1, 1))
+
+    table.ExtendTable(tbl).format_range(
+        styles.CellStyle(background_rgb=(255, 0, 0)), rows=slice(0, 1), cols=slice(0, 1)
+    )
+    table.ExtendTable(tbl).format_range(
+        styles.CellStyle(background_rgb=(0, 0, 255)), cols=slice(2, 3)
+    )
+
+    assert _fills(tbl) == [
+        ["FF0000", "0000FF"],
+        ["FF0000", "0000FF"],
+        [None, None, "0000FF"],
+    ]
+
+
+def test_format_range_replaces_shading() -> None:
+    """Tests that shading is replaced in schema order rather than appended."""
+    tbl = docx.Document().add_table(rows=1, cols=1)
+    tc_pr = tbl.cell(0, 0)._tc.get_or_add_tcPr()
+    tc_pr.append(oxml.OxmlElement("w:vAlign"))
+
+    for rgb in [(255, 0, 0), (0, 255, 0)]:
+        table.ExtendTable(tbl).format_range(
+            styles.CellStyle(
+                background_rgb=rgb, borders=[styles.CellBorder(sides=("top",))]
+            )
+        )
+
+    assert [child.tag for child in tc_pr] == [
+        ns.qn("w:tcW"),
+        ns.qn("w:tcBorders"),
+        ns.qn("w:shd"),
+        ns.qn("w:vAlign"),
+    ]
+    assert _fills(tbl) == [["00FF00"]]
+
+
+def test_band_rows() -> None:
+    """Tests cycling through styles row by row."""
+    tbl = docx.Document().add_table(rows=5, cols=2)
+
+    table.ExtendTable(tbl).band_rows(
+        [
+            styles.CellStyle(background_rgb=(255, 0, 0)),
+            styles.CellStyle(background_rgb=(0, 0, 255)),
+        ],
+        rows=slice(1, None),
+    )
+
+    assert [row[0] for row in _fills(tbl)] == [
+        None,
+        "FF0000",
+        "0000FF",
+        "FF0000",
+        "0000FF",
+    ]
+
+
+def test_band_columns_with_step() -> None:
+    """Tests that banded selections reject a step."""
+    tbl = docx.Document().add_table(rows=1, cols=4)
+
+    with pytest.raises(ValueError, match="step"):
+        table.ExtendTable(tbl).band_columns(
+            [styles.CellStyle()], cols=slice(None, None, 2)
+        )
+
+
+def _template_table() -> docx_table.Table:
+    """Creates a table with a header row and a bold, empty prototype row."""
+    tbl = docx.Document().add_table(rows=2, cols=3)
+    for column, cell in enumerate(tbl.rows[0].cells):
+        cell.text = f"Header {column}"
+    for cell in tbl.rows[1].cells:
+        cell.paragraphs[0].add_run("placeholder").bold = True
+    return tbl
+
+
+def test_fill() -> None:
+    """Tests filling a table from a sequence of rows."""
+    tbl = _template_table()
+
+    table.ExtendTable(tbl).fill([["a", 1, None], [" b ", 2.5], ["c\td", 3, "e"]])
+
+    assert [[cell.text for cell in row.cells] for row in tbl.rows] == [
+        ["Header 0", "Header 1", "Header 2"],
+        ["a", "1", ""],
+        [" b ", "2.5", ""],
+        ["c\td", "3", "e"],
+    ]
+    assert all(
+        run.bold
+        for row in tbl.rows[1:]
+        for cell in row.cells
+        for run in cell.paragraphs[0].runs
+    )
+
+
+def test_fill_buffer() -> None:
+    """Tests filling a table without runs from a two-dimensional buffer."""
+    tbl = docx.Document().add_table(rows=1, cols=3)
+    data = memoryview(array.array("i", range(6))).cast("B").cast("i", (2, 3))
+
+    table.ExtendTable(tbl).fill(data, start_row=0)
+
+    assert [[cell.text for cell in row.cells] for row in tbl.rows] == [
+        ["0", "1", "2"],
+        ["3", "4", "5"],
+    ]
+
+
+def test_fill_too_many_values() -> None:
+    """Tests that rows longer than the prototype are rejected before editing."""
+    tbl = _template_table()
+
+    with pytest.raises(ValueError, match="4 values"):
+        table.ExtendTable(tbl).fill([[1, 2, 3, 4]])
+
+    assert len(tbl.rows) == 2  # noqa: PLR2004
@@ -0,0 +1,89 @@
+"""Tests for the template module."""
+
+import io
+import zipfile
+
+import docx
+
+from cmi_docx import template
+
+
+def _save(doc: docx.document.Document) -> io.BytesIO:
+    """Saves a document to an in-memory buffer."""
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def test_fill_template_split_placeholders() -> None:
+    """Test that placeholders split across runs are replaced in place."""
+    doc = docx.Document()
+    paragraph = doc.add_paragraph("Hello {{NA")
+    paragraph.add_run("ME}}, {{NAME}}!").bold = True
+    doc.add_paragraph("Born {{DATE}}")
+    destination = io.BytesIO()
+
+    template.fill_template(
+        _save(doc), destination, {"{{NAME}}": "Alice", "{{DATE}}": " 2025 "}
+    )
+    actual = docx.Document(destination)
+
+    assert actual.paragraphs[0].text == "Hello Alice, Alice!"
+    assert actual.paragraphs[0].runs[0].text == "Hello Alice"
+    assert actual.paragraphs[0].runs[1].text == ", Alice!"
+    assert actual.paragraphs[0].runs[1].bold
+    assert actual.paragraphs[1].text == "Born  2025 "
+
+
+def test_fill_template_headers_and_tables() -> None:
+    """Test that placeholders in headers, footers, and tables are replaced."""
+    doc = docx.Document()
+    doc.add_table(rows=1, cols=1).cell(0, 0).text = "Cell {{X}}"
+    doc.sections[0].header.paragraphs[0].text = "Header {{X}}"
+    doc.sections[0].footer.paragraphs[0].text = "Footer {{X}}"
+    destination = io.BytesIO()
+
+    template.fill_template(_save(doc), destination, {"{{X}}": "y"})
+    actual = docx.Document(destination)
+
+    assert actual.tables[0].cell(0, 0).text == "Cell y"
+    assert actual.sections[0].header.paragraphs[0].text == "Header y"
+    assert actual.sections[0].footer.paragraphs[0].text == "Footer y"
+
+
+def test_fill_template_longest_needle_wins() -> None:
+    """Test that overlapping needles prefer the longest match."""
+    doc = docx.Document()
+    doc.add_paragraph("{{A}} {{AB}}")
+    destination = io.BytesIO()
+
+    template.fill_template(_save(doc), destination, {"{{A": "x", "{{AB}}": "y"})
+
+    assert docx.Document(destination).paragraphs[0].text == "x}} y"
+
+
+def test_fill_template_does_not_match_across_tabs() -> None:
+    """Test that text on both sides of a tab is not stitched together."""
+    doc = docx.Document()
+    doc.add_paragraph("{{A\t}}")
+    destination = io.BytesIO()
+
+    template.fill_template(_save(doc), destination, {"{{A}}": "x"})
+
+    assert docx.Document(destination).paragraphs[0].text == "{{A\t}}"
+
+
+def test_fill_template_copies_untouched_parts() -> None:
+    """Test that parts without placeholders are copied unchanged."""
+    doc = docx.Document()
+    doc.add_paragraph("No placeholders")
+    source = _save(doc)
+    destination = io.BytesIO()
+
+    template.fill_template(source, destination, {"{{X}}": "y"})
+
+    with zipfile.ZipFile(source) as expected, zipfile.ZipFile(destination) as actual:
+        assert expected.namelist() == actual.namelist()
+        for name in expected.namelist():
+            assert expected.read(name) == actual.read(name)